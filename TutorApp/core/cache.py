@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+METRICS_KEY = "cache_metrics:{namespace}:{event}"
+METRIC_EVENTS = ("hits", "misses")
+
+_MISSING = object()
+_USE_NAMESPACE_TIMEOUT = object()
+
+_metrics_lock = threading.Lock()
+_pending_metrics: Counter = Counter()
+
+
+class CacheNamespace:
+    """
+    Group of cache keys of one subsystem sharing a key prefix and a timeout.
+
+    The timeout can be overridden per namespace with the CACHE_TIMEOUTS
+    setting. A versioned namespace keeps a version number in the cache that
+    is part of every key, so invalidate_all() can drop all of its keys at
+    once without knowing them. Reads are counted as hits and misses, see
+    get_metrics().
+    """
+
+    registry: Dict[str, "CacheNamespace"] = {}
+
+    def __init__(self, name: str, timeout: Optional[int], versioned: bool = False):
+        self.name = name
+        self.default_timeout = timeout
+        self.versioned = versioned
+        CacheNamespace.registry[name] = self
+
+    def __repr__(self) -> str:
+        return f"<CacheNamespace {self.name}>"
+
+    @property
+    def timeout(self) -> Optional[int]:
+        timeouts = getattr(settings, "CACHE_TIMEOUTS", {})
+        return timeouts.get(self.name, self.default_timeout)
+
+    def make_key(self, key: Any) -> str:
+        if self.versioned:
+            return f"{self.name}:v{self.get_version()}:{key}"
+        return f"{self.name}:{key}"
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = cache.get(self.make_key(key), _MISSING)
+        record_metric(self.name, hit=value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def get_or_set(self, key: Any, build: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value of a key, calling build() and caching its
+        result on a miss. None results are not cached.
+        """
+        cache_key = self.make_key(key)
+        value = cache.get(cache_key, _MISSING)
+        record_metric(self.name, hit=value is not _MISSING)
+
+        if value is _MISSING:
+            value = build()
+            if value is not None:
+                cache.set(cache_key, value, self.timeout)
+
+        return value
+
+    def set(self, key: Any, value: Any, timeout: Any = _USE_NAMESPACE_TIMEOUT) -> None:
+        if timeout is _USE_NAMESPACE_TIMEOUT:
+            timeout = self.timeout
+        cache.set(self.make_key(key), value, timeout)
+
+    def delete(self, key: Any) -> None:
+        cache.delete(self.make_key(key))
+
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        prefix = self.make_key("")
+        cache.delete_many([f"{prefix}{key}" for key in keys])
+
+    def get_version(self) -> int:
+        version_key = f"{self.name}:version"
+        # A lost version restarts from the current time, so it never matches
+        # a version keys were cached under before.
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, time.time_ns(), None)
+            version = cache.get(version_key)
+        return version
+
+    def invalidate_all(self) -> None:
+        """
+        Drops every key of a versioned namespace by bumping its version.
+        """
+        if not self.versioned:
+            raise ValueError(f"Cache namespace '{self.name}' is not versioned")
+
+        try:
+            cache.incr(f"{self.name}:version")
+        except ValueError:
+            self.get_version()
+
+
+def record_metric(namespace: str, hit: bool) -> None:
+    """
+    Counts a cache read in process memory. Counts are added to the shared
+    cache every CACHE_METRICS_FLUSH_EVERY reads, so recording a read does
+    not add a round trip to Redis.
+    """
+    flush_every = getattr(settings, "CACHE_METRICS_FLUSH_EVERY", 100)
+
+    with _metrics_lock:
+        _pending_metrics[(namespace, "hits" if hit else "misses")] += 1
+        should_flush = sum(_pending_metrics.values()) >= flush_every
+
+    if should_flush:
+        flush_metrics()
+
+
+def flush_metrics() -> None:
+    with _metrics_lock:
+        pending = dict(_pending_metrics)
+        _pending_metrics.clear()
+
+    for (namespace, event), count in pending.items():
+        key = METRICS_KEY.format(namespace=namespace, event=event)
+        if not cache.add(key, count, None):
+            try:
+                cache.incr(key, count)
+            except ValueError:
+                cache.set(key, count, None)
+
+
+def _metric_keys() -> Dict[Tuple[str, str], str]:
+    return {
+        (namespace, event): METRICS_KEY.format(namespace=namespace, event=event)
+        for namespace in CacheNamespace.registry
+        for event in METRIC_EVENTS
+    }
+
+
+def get_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns hits, misses and the hit ratio of every registered namespace,
+    summed over all processes sharing the cache.
+    """
+    flush_metrics()
+
+    keys = _metric_keys()
+    values = cache.get_many(keys.values())
+
+    metrics = {}
+    for namespace in sorted(CacheNamespace.registry):
+        hits = values.get(keys[(namespace, "hits")], 0)
+        misses = values.get(keys[(namespace, "misses")], 0)
+        reads = hits + misses
+        metrics[namespace] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / reads, 4) if reads else None,
+        }
+
+    return metrics
+
+
+def reset_metrics() -> None:
+    with _metrics_lock:
+        _pending_metrics.clear()
+    cache.delete_many(list(_metric_keys().values()))
@@ -0,0 +1,13 @@
+import django_filters
+
+from .search import fuzzy_search
+
+
+class FuzzyCharFilter(django_filters.CharFilter):
+    """
+    CharFilter matching a trigram-indexed field with ``fuzzy_search`` instead
+    of an unindexed ``icontains`` lookup.
+    """
+
+    def filter(self, qs, value):
+        return fuzzy_search(qs, self.field_name, value)
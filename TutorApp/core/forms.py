@@ -1,5 +1,8 @@
 from django import forms
 from django.db import models
+from django_select2.forms import ModelSelect2Widget
+
+from .search import fuzzy_search
 
 
 class TypedChoiceMixin:
@@ -29,3 +32,15 @@ class TypedChoiceMixin:
             empty_value=None,
             required=required,
         )
+
+
+class FuzzyModelSelect2Widget(ModelSelect2Widget):
+    """
+    ModelSelect2Widget searching a trigram-indexed field with ``fuzzy_search``.
+
+    ``search_fields`` holds the plain field name, e.g. ``["name"]``.
+    """
+
+    def filter_queryset(self, request, term, queryset=None, **dependent_fields):
+        queryset = super().filter_queryset(request, "", queryset, **dependent_fields)
+        return fuzzy_search(queryset, self.get_search_fields()[0], term)
@@ -0,0 +1,47 @@
+import itertools
+
+from django.conf import settings
+from django.core import signing
+from django.http import HttpRequest
+
+PROFILING_SALT = "core.profiling"
+PROFILING_TOKEN_VALUE = "profile"
+
+_request_counter = itertools.count(1)
+
+
+def make_profiling_token() -> str:
+    """
+    Creates a signed token that makes silk profile requests sending it in the
+    PROFILING_HEADER header, until PROFILING_TOKEN_MAX_AGE seconds pass.
+    """
+    signer = signing.TimestampSigner(salt=PROFILING_SALT)
+    return signer.sign(PROFILING_TOKEN_VALUE)
+
+
+def has_valid_profiling_token(request: HttpRequest) -> bool:
+    token = request.headers.get(getattr(settings, "PROFILING_HEADER", ""))
+    if not token:
+        return False
+
+    signer = signing.TimestampSigner(salt=PROFILING_SALT)
+    try:
+        value = signer.unsign(
+            token, max_age=getattr(settings, "PROFILING_TOKEN_MAX_AGE", 60 * 60)
+        )
+    except signing.BadSignature:
+        return False
+
+    return value == PROFILING_TOKEN_VALUE
+
+
+def should_profile(request: HttpRequest) -> bool:
+    """
+    Decides whether silk records a request: every PROFILING_SAMPLE_EVERY-th
+    request of the process, and every request with a valid profiling token.
+    """
+    if has_valid_profiling_token(request):
+        return True
+
+    sample_every = getattr(settings, "PROFILING_SAMPLE_EVERY", 0)
+    return bool(sample_every) and next(_request_counter) % sample_every == 0
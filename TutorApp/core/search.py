@@ -0,0 +1,119 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, Func, Q, QuerySet, TextField, Value
+from django.db.models.functions import Lower
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
+
+# Text search configuration created by courses/migrations/0013_search_vector.
+SEARCH_CONFIG = "polish"
+
+# Sentinels used by SearchHeadline instead of HTML tags, so the snippet can be
+# escaped before the matches are wrapped in <mark>.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+
+
+def fuzzy_text(expression):
+    """
+    Lower-cased text without diacritics, as stored in trigram indexes.
+    ``immutable_unaccent`` is created by courses/migrations/0014_trigram_search.
+    """
+    return Func(
+        Lower(expression), function="immutable_unaccent", output_field=TextField()
+    )
+
+
+def trigram_index(field: str, name: str) -> GinIndex:
+    """
+    Returns a pg_trgm GIN index over ``fuzzy_text(field)``, which serves both
+    the substring and the similarity lookups of ``fuzzy_search``.
+    """
+    return GinIndex(OpClass(fuzzy_text(field), name="gin_trgm_ops"), name=name)
+
+
+def full_text_search(
+    queryset: QuerySet, query: str, field: str = "task_content"
+) -> QuerySet:
+    """
+    Filters a queryset with a GIN-indexed ``search_vector`` column by a
+    web-style query (quoted phrases, ``or``, ``-excluded``).
+
+    Results are ordered by relevance and annotated with ``rank`` and
+    ``search_headline``, a snippet of ``field`` with the matches marked.
+
+    Args:
+        queryset: Queryset of a model with a ``search_vector`` field.
+        query: Text typed by the user.
+        field: Text field the snippet is taken from.
+
+    Returns:
+        Filtered queryset, or the unchanged queryset for a blank query.
+    """
+    query = (query or "").strip()
+    if not query:
+        return queryset
+
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.filter(search_vector=search_query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), search_query),
+            search_headline=SearchHeadline(
+                field,
+                search_query,
+                config=SEARCH_CONFIG,
+                start_sel=HIGHLIGHT_START,
+                stop_sel=HIGHLIGHT_STOP,
+                max_fragments=2,
+                fragment_delimiter=" … ",
+            ),
+        )
+        .order_by("-rank", "-pk")
+    )
+
+
+def fuzzy_search(queryset: QuerySet, field: str, query: str) -> QuerySet:
+    """
+    Filters a queryset by a field covered by ``trigram_index``.
+
+    Matching ignores case and Polish diacritics ("ciagi" finds "ciągi") and
+    tolerates typos: a row matches if it contains the query or if the query
+    is similar enough to one of its words (``pg_trgm.word_similarity_threshold``).
+    Results are annotated with ``similarity`` and ordered by it, best first.
+
+    Args:
+        queryset: Queryset to filter.
+        field: Name of the indexed text field.
+        query: Text typed by the user.
+
+    Returns:
+        Filtered queryset, or the unchanged queryset for a blank query.
+    """
+    query = (query or "").strip()
+    if not query:
+        return queryset
+
+    text = fuzzy_text(field)
+    term = fuzzy_text(Value(query))
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return (
+        queryset.alias(fuzzy_text=text)
+        .filter(Q(fuzzy_text__contains=term) | Q(fuzzy_text__trigram_word_similar=term))
+        .annotate(similarity=TrigramWordSimilarity(term, text))
+        .order_by("-similarity", *ordering)
+    )
+
+
+def render_headline(headline: str) -> SafeString:
+    """Escapes a search snippet and wraps its matches in ``<mark>``."""
+    return mark_safe(
+        escape(headline or "")
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
@@ -0,0 +1,3 @@
+# Settings used when DJANGO_SETTINGS_MODULE is "core.settings". Production
+# sets it to "core.settings.prod".
+from .dev import *  # noqa: F401,F403
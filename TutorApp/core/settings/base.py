@@ -4,10 +4,11 @@ from pathlib import Path
 from typing import List
 
 import environ
+from celery.schedules import crontab
 from django.utils.translation import gettext_lazy as _
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-APPS_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+APPS_DIR = Path(__file__).resolve().parent.parent.parent
 
 
 env = environ.Env(DEBUG=(bool, False))
@@ -34,9 +35,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "widget_tweaks",
-    "silk",
-    "debug_toolbar",
     "django_extensions",
     "django_filters",
     "django_select2",
@@ -68,10 +68,9 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "plans.middleware.EntitlementMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "silk.middleware.SilkyMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
@@ -104,6 +103,8 @@ DATABASES = {
         "PASSWORD": env("PG_PASSWORD"),
         "HOST": env("PG_HOST", default="localhost"),
         "PORT": env("PG_PORT", default="5432"),
+        "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=60),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -143,13 +144,33 @@ MEDIA_URL = "/media/"
 
 TEMP_WIZARD_DIR = os.path.join(MEDIA_ROOT, "temp_wizard")
 TEMP_PREVIEW_DIR = os.path.join(MEDIA_ROOT, "temp_previews")
+CUT_PDF_CACHE_DIR = os.path.join(MEDIA_ROOT, "cut_pdf_cache")
+CUT_PDF_CACHE_MAX_BYTES = env.int("CUT_PDF_CACHE_MAX_BYTES", default=512 * 1024 * 1024)
 
-INTERNAL_IPS = [
-    "127.0.0.1",
-]
+# "file" streams cut PDFs through Django, "x-accel" hands them off to nginx.
+PDF_DELIVERY_MODE = env("PDF_DELIVERY_MODE", default="file")
+PDF_ACCEL_REDIRECT_LOCATION = "/protected/cut_pdf_cache/"
+
+# Worker processes used for batch PDF processing (defaults to all cores)
+# and the time limit, in seconds, for processing a single document.
+PDF_POOL_PROCESSES = env.int("PDF_POOL_PROCESSES", default=0) or os.cpu_count()
+PDF_POOL_TIMEOUT = env.int("PDF_POOL_TIMEOUT", default=120)
 
 CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="redis://redis:6379/1")
 CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND", default="redis://redis:6379/1")
+CELERY_BEAT_SCHEDULE = {
+    "downgrade-expired-trials": {
+        "task": "plans.tasks.downgrade_expired_trials",
+        "schedule": crontab(minute=5),
+    },
+}
+
+CELERY_TASK_ROUTES = {
+    "plans.tasks.process_stripe_events": {"queue": "stripe_webhooks"},
+}
+
+# Expired trials downgraded per transaction by the hourly beat job.
+TRIAL_EXPIRY_BATCH_SIZE = env.int("TRIAL_EXPIRY_BATCH_SIZE", default=1000)
 
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
@@ -160,11 +181,28 @@ if TESTING := "test" in sys.argv:
     PASSWORD_HASHERS = [
         "django.contrib.auth.hashers.MD5PasswordHasher",
     ]
+    CELERY_TASK_ALWAYS_EAGER = True
 
 SELECT2_CACHE_BACKEND = "default"
 
+# Shared by all web and Celery processes, on the Redis instance used by
+# Celery but in its own database.
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("CACHE_URL", default="redis://redis:6379/2"),
+        "KEY_PREFIX": "tutorapp",
     }
 }
+
+# Per-namespace overrides, in seconds, of the timeouts of core.cache namespaces,
+# e.g. {"quizes:answer_key": 3600}.
+CACHE_TIMEOUTS: dict = {}
+CACHE_METRICS_FLUSH_EVERY = env.int("CACHE_METRICS_FLUSH_EVERY", default=100)
+
+if TESTING:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
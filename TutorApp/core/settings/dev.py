@@ -0,0 +1,18 @@
+from .base import *  # noqa: F401,F403
+from .base import INSTALLED_APPS, MIDDLEWARE, TESTING
+
+INSTALLED_APPS = INSTALLED_APPS + [
+    "silk",
+    "debug_toolbar",
+]
+
+# Silk keeps its collected request per thread after a response, so in tests
+# every later query would be profiled and EXPLAINed as well.
+if not TESTING:
+    MIDDLEWARE = MIDDLEWARE + ["silk.middleware.SilkyMiddleware"]
+
+MIDDLEWARE = MIDDLEWARE + ["debug_toolbar.middleware.DebugToolbarMiddleware"]
+
+INTERNAL_IPS = [
+    "127.0.0.1",
+]
@@ -0,0 +1,49 @@
+from core.profiling import should_profile
+
+from .base import *  # noqa: F401,F403
+from .base import DATABASES, INSTALLED_APPS, MIDDLEWARE, env
+
+DEBUG = False
+
+# Each process keeps one bounded pool shared by all of its greenlets, instead
+# of a connection per greenlet. DB_POOL_MAX_SIZE times the number of pooled
+# processes must stay below max_connections of Postgres, see
+# docker-compose.prod.yml. DB_POOL_MAX_SIZE=0 falls back to persistent
+# connections, e.g. for prefork celery workers. Pooled connections are checked
+# before use since CONN_HEALTH_CHECKS is enabled.
+DB_POOL_MAX_SIZE = env.int("DB_POOL_MAX_SIZE", default=10)
+
+if DB_POOL_MAX_SIZE:
+    DATABASES = {
+        **DATABASES,
+        "default": {
+            **DATABASES["default"],
+            "CONN_MAX_AGE": 0,
+            "OPTIONS": {
+                "pool": {
+                    "min_size": min(
+                        env.int("DB_POOL_MIN_SIZE", default=2), DB_POOL_MAX_SIZE
+                    ),
+                    "max_size": DB_POOL_MAX_SIZE,
+                    "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),
+                    "max_idle": env.float("DB_POOL_MAX_IDLE", default=300.0),
+                },
+            },
+        },
+    }
+
+# Opt-in sampled profiling with silk. Only every PROFILING_SAMPLE_EVERY-th
+# request of a process (0 disables sampling) and requests carrying a valid
+# signed PROFILING_HEADER are recorded, see core.profiling.
+PROFILING_ENABLED = env.bool("PROFILING_ENABLED", default=False)
+PROFILING_SAMPLE_EVERY = env.int("PROFILING_SAMPLE_EVERY", default=0)
+PROFILING_HEADER = "X-Profile-Token"
+PROFILING_TOKEN_MAX_AGE = env.int("PROFILING_TOKEN_MAX_AGE", default=60 * 60)
+
+if PROFILING_ENABLED:
+    INSTALLED_APPS = INSTALLED_APPS + ["silk"]
+    MIDDLEWARE = MIDDLEWARE + ["silk.middleware.SilkyMiddleware"]
+
+    SILKY_INTERCEPT_FUNC = should_profile
+    SILKY_AUTHENTICATION = True
+    SILKY_AUTHORISATION = True
@@ -0,0 +1,118 @@
+from core.cache import CacheNamespace, flush_metrics, get_metrics, reset_metrics
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from users.factories import UserFactory
+
+
+class CacheNamespaceTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        reset_metrics()
+        self.namespace = CacheNamespace("tests:plain", timeout=60)
+        self.versioned = CacheNamespace("tests:versioned", timeout=60, versioned=True)
+
+    def test_keys_are_namespaced(self) -> None:
+        """Test case that checks if equal keys of two namespaces do not collide"""
+        other = CacheNamespace("tests:other", timeout=60)
+
+        self.namespace.set(1, "plain")
+        other.set(1, "other")
+
+        self.assertEqual(self.namespace.get(1), "plain")
+        self.assertEqual(other.get(1), "other")
+
+    def test_get_or_set_builds_once(self) -> None:
+        """Test case that checks if a value is built only on a miss"""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"value": 1}
+
+        self.namespace.get_or_set("key", build)
+        self.namespace.get_or_set("key", build)
+
+        self.assertEqual(len(calls), 1)
+
+    def test_get_or_set_does_not_cache_none(self) -> None:
+        """Test case that checks if a None result is built again"""
+        self.namespace.get_or_set("key", lambda: None)
+
+        self.assertEqual(self.namespace.get_or_set("key", lambda: 2), 2)
+
+    @override_settings(CACHE_TIMEOUTS={"tests:plain": 5})
+    def test_timeout_can_be_overridden_in_settings(self) -> None:
+        """Test case that checks if CACHE_TIMEOUTS overrides a namespace timeout"""
+        self.assertEqual(self.namespace.timeout, 5)
+        self.assertEqual(self.versioned.timeout, 60)
+
+    def test_invalidate_all_drops_versioned_keys(self) -> None:
+        """Test case that checks if bumping the version hides all old keys"""
+        self.versioned.set(1, "first")
+        self.versioned.set(2, "second")
+
+        self.versioned.invalidate_all()
+
+        self.assertIsNone(self.versioned.get(1))
+        self.assertIsNone(self.versioned.get(2))
+
+    def test_delete_many_drops_only_given_keys(self) -> None:
+        """Test case that checks if several keys are deleted at once"""
+        for namespace in (self.namespace, self.versioned):
+            for key in (1, 2, 3):
+                namespace.set(key, key)
+
+            namespace.delete_many([1, 2])
+
+            self.assertIsNone(namespace.get(1))
+            self.assertIsNone(namespace.get(2))
+            self.assertEqual(namespace.get(3), 3)
+
+    def test_invalidate_all_survives_lost_version(self) -> None:
+        """Test case that checks if a lost version key does not revive old keys"""
+        self.versioned.set(1, "first")
+        cache.delete("tests:versioned:version")
+
+        self.assertIsNone(self.versioned.get(1))
+
+    def test_invalidate_all_requires_versioned_namespace(self) -> None:
+        """Test case that checks if a plain namespace cannot be invalidated at once"""
+        with self.assertRaises(ValueError):
+            self.namespace.invalidate_all()
+
+    @override_settings(CACHE_METRICS_FLUSH_EVERY=1000)
+    def test_metrics_count_hits_and_misses(self) -> None:
+        """Test case that checks if reads are counted per namespace"""
+        self.namespace.get("missing")
+        self.namespace.set("present", 1)
+        self.namespace.get("present")
+        self.namespace.get("present")
+
+        metrics = get_metrics()["tests:plain"]
+
+        self.assertEqual(metrics["hits"], 2)
+        self.assertEqual(metrics["misses"], 1)
+        self.assertEqual(metrics["hit_ratio"], round(2 / 3, 4))
+
+    @override_settings(CACHE_METRICS_FLUSH_EVERY=2)
+    def test_metrics_are_flushed_to_shared_cache(self) -> None:
+        """Test case that checks if buffered counts reach the cache"""
+        self.namespace.get("a")
+        self.namespace.get("b")
+
+        self.assertEqual(cache.get("cache_metrics:tests:plain:misses"), 2)
+        flush_metrics()
+        self.assertEqual(cache.get("cache_metrics:tests:plain:misses"), 2)
+
+    def test_metrics_view_is_staff_only(self) -> None:
+        """Test case that checks if only staff can read cache metrics"""
+        url = reverse("cache_metrics")
+        self.client.force_login(UserFactory.create(is_staff=False))
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(UserFactory.create(is_staff=True))
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("quizes:answer_key", response.json())
@@ -0,0 +1,57 @@
+from unittest import mock
+
+from core import profiling
+from django.core import signing
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+
+@override_settings(PROFILING_HEADER="X-Profile-Token", PROFILING_TOKEN_MAX_AGE=60)
+class ShouldProfileTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+
+    def _request(self, token=None):
+        headers = {"X-Profile-Token": token} if token else {}
+        return self.factory.get("/", headers=headers)
+
+    @override_settings(PROFILING_SAMPLE_EVERY=0)
+    def test_no_sampling_by_default(self) -> None:
+        """Test case that checks if requests are not profiled without sampling"""
+        self.assertFalse(
+            any(profiling.should_profile(self._request()) for _ in range(10))
+        )
+
+    @override_settings(PROFILING_SAMPLE_EVERY=5)
+    def test_samples_every_nth_request(self) -> None:
+        """Test case that checks if every Nth request is profiled"""
+        with mock.patch.object(profiling, "_request_counter", iter(range(1, 11))):
+            sampled = [profiling.should_profile(self._request()) for _ in range(10)]
+
+        self.assertEqual(sampled.count(True), 2)
+        self.assertTrue(sampled[4])
+        self.assertTrue(sampled[9])
+
+    @override_settings(PROFILING_SAMPLE_EVERY=0)
+    def test_valid_token_is_profiled(self) -> None:
+        """Test case that checks if a request with a signed token is profiled"""
+        token = profiling.make_profiling_token()
+
+        self.assertTrue(profiling.should_profile(self._request(token)))
+
+    @override_settings(PROFILING_SAMPLE_EVERY=0)
+    def test_forged_token_is_not_profiled(self) -> None:
+        """Test case that checks if a token with a wrong signature is rejected"""
+        forged = signing.TimestampSigner(salt="other").sign(
+            profiling.PROFILING_TOKEN_VALUE
+        )
+
+        self.assertFalse(profiling.should_profile(self._request(forged)))
+        self.assertFalse(profiling.should_profile(self._request("profile")))
+
+    @override_settings(PROFILING_SAMPLE_EVERY=0)
+    def test_expired_token_is_not_profiled(self) -> None:
+        """Test case that checks if a token older than its max age is rejected"""
+        with mock.patch("django.core.signing.time.time", return_value=1_000_000):
+            token = profiling.make_profiling_token()
+
+        self.assertFalse(profiling.should_profile(self._request(token)))
@@ -0,0 +1,64 @@
+import importlib
+import os
+from unittest import mock
+
+from core import profiling
+from django.test import SimpleTestCase
+
+
+class ProdSettingsTests(SimpleTestCase):
+    def _load_prod_settings(self, **environ):
+        with mock.patch.dict(os.environ, environ):
+            import core.settings.base as base
+            import core.settings.prod as prod
+
+            importlib.reload(base)
+            return importlib.reload(prod)
+
+    def test_dev_tools_are_not_installed(self) -> None:
+        """Test case that checks if silk and the debug toolbar are left out of prod"""
+        prod = self._load_prod_settings(PROFILING_ENABLED="False")
+
+        self.assertFalse(prod.DEBUG)
+        self.assertNotIn("silk", prod.INSTALLED_APPS)
+        self.assertNotIn("debug_toolbar", prod.INSTALLED_APPS)
+        self.assertNotIn(
+            "debug_toolbar.middleware.DebugToolbarMiddleware", prod.MIDDLEWARE
+        )
+
+    def test_profiling_installs_sampled_silk(self) -> None:
+        """Test case that checks if enabling profiling installs silk behind sampling"""
+        prod = self._load_prod_settings(
+            PROFILING_ENABLED="True", PROFILING_SAMPLE_EVERY="100"
+        )
+
+        self.assertIn("silk", prod.INSTALLED_APPS)
+        self.assertIn("silk.middleware.SilkyMiddleware", prod.MIDDLEWARE)
+        self.assertNotIn("debug_toolbar", prod.INSTALLED_APPS)
+        self.assertIs(prod.SILKY_INTERCEPT_FUNC, profiling.should_profile)
+        self.assertEqual(prod.PROFILING_SAMPLE_EVERY, 100)
+
+    def test_database_pool_is_bounded(self) -> None:
+        """Test case that checks if prod connects through a bounded pool"""
+        prod = self._load_prod_settings(DB_POOL_MIN_SIZE="4", DB_POOL_MAX_SIZE="20")
+        database = prod.DATABASES["default"]
+
+        self.assertEqual(database["CONN_MAX_AGE"], 0)
+        self.assertEqual(database["OPTIONS"]["pool"]["min_size"], 4)
+        self.assertEqual(database["OPTIONS"]["pool"]["max_size"], 20)
+        self.assertTrue(database["CONN_HEALTH_CHECKS"])
+
+    def test_min_pool_size_is_capped(self) -> None:
+        """Test case that checks if the pool never keeps more idle connections than its max size"""
+        prod = self._load_prod_settings(DB_POOL_MIN_SIZE="8", DB_POOL_MAX_SIZE="3")
+
+        self.assertEqual(prod.DATABASES["default"]["OPTIONS"]["pool"]["min_size"], 3)
+
+    def test_database_pool_can_be_disabled(self) -> None:
+        """Test case that checks if prod falls back to persistent connections without a pool"""
+        prod = self._load_prod_settings(DB_POOL_MAX_SIZE="0", DB_CONN_MAX_AGE="30")
+        database = prod.DATABASES["default"]
+
+        self.assertNotIn("OPTIONS", database)
+        self.assertEqual(database["CONN_MAX_AGE"], 30)
+        self.assertTrue(database["CONN_HEALTH_CHECKS"])
@@ -0,0 +1,12 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpRequest, JsonResponse
+
+from .cache import get_metrics
+
+
+@staff_member_required
+def cache_metrics(request: HttpRequest) -> JsonResponse:
+    """
+    Hits, misses and hit ratio of every cache namespace, for staff only.
+    """
+    return JsonResponse(get_metrics())
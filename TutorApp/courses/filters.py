@@ -1,7 +1,8 @@
 import django_filters
+from core.forms import FuzzyModelSelect2Widget
+from core.search import full_text_search
 from django import forms
 from django.utils.translation import gettext_lazy as _
-from django_select2.forms import ModelSelect2Widget
 
 from .models import Section, TrainingTask
 
@@ -22,8 +23,7 @@ class TrainingTaskFilter(django_filters.FilterSet):
     """
 
     search = django_filters.CharFilter(
-        field_name="task_content",
-        lookup_expr="icontains",
+        method="filter_search",
         label=_("Task content"),
         widget=forms.Textarea(
             attrs={
@@ -37,9 +37,9 @@ class TrainingTaskFilter(django_filters.FilterSet):
         queryset=filter_section,
         label=_("Section"),
         empty_label=_("All Sections"),
-        widget=ModelSelect2Widget(
+        widget=FuzzyModelSelect2Widget(
             model=Section,
-            search_fields=["name__icontains"],
+            search_fields=["name"],
             attrs={"class": "field-search-single"},
         ),
     )
@@ -79,6 +79,9 @@ class TrainingTaskFilter(django_filters.FilterSet):
 
         return queryset.filter(section__grade=user.grade)
 
+    def filter_search(self, queryset, name, value):
+        return full_text_search(queryset, value)
+
     def filter_completed(self, queryset, name, value):
         user = self.request.user
         if value == "completed":
@@ -1,7 +1,7 @@
+from core.forms import FuzzyModelSelect2Widget
 from courses.models import Section, Topic
 from django import forms
 from django.utils.translation import gettext_lazy as _
-from django_select2.forms import ModelSelect2Widget
 
 
 class TopicForm(forms.ModelForm):
@@ -19,9 +19,9 @@ class TopicForm(forms.ModelForm):
         }
 
         widgets = {
-            "section": ModelSelect2Widget(
+            "section": FuzzyModelSelect2Widget(
                 model=Section,
-                search_fields=["name__icontains"],
+                search_fields=["name"],
                 attrs={
                     "placeholder": _("Section Name"),
                     "data-placeholder": _("Section Name"),
@@ -1,4 +1,4 @@
-from core.forms import TypedChoiceMixin
+from core.forms import FuzzyModelSelect2Widget, TypedChoiceMixin
 from courses.choices import DifficultyLevelChoices, TaskSourceChoices
 from courses.models import Book, Section, TrainingTask
 from django import forms
@@ -52,9 +52,9 @@ class TrainingTaskForm(TypedChoiceMixin, forms.ModelForm):
                 }
             ),
             "answer": forms.TextInput(attrs={"placeholder": _(" ")}),
-            "section": ModelSelect2Widget(
+            "section": FuzzyModelSelect2Widget(
                 model=Section,
-                search_fields=["name__icontains"],
+                search_fields=["name"],
                 attrs={
                     "placeholder": _("Section Name"),
                     "data-placeholder": _("Section Name"),
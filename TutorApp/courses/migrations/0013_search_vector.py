@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:34
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# PostgreSQL does not ship a Polish stemmer. The "polish" configuration uses
+# an ispell dictionary when its files (polish.dict/.affix/.stop) are present
+# in the server's tsearch_data directory and plain "simple" otherwise.
+CREATE_SEARCH_CONFIG_SQL = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'polish') THEN
+        BEGIN
+            CREATE TEXT SEARCH DICTIONARY polish_ispell (
+                TEMPLATE = ispell,
+                DictFile = polish,
+                AffFile = polish,
+                StopWords = polish
+            );
+            CREATE TEXT SEARCH CONFIGURATION polish (COPY = pg_catalog.simple);
+            ALTER TEXT SEARCH CONFIGURATION polish
+                ALTER MAPPING FOR asciiword, asciihword, hword_asciipart,
+                    word, hword, hword_part
+                WITH polish_ispell, simple;
+        EXCEPTION WHEN OTHERS THEN
+            CREATE TEXT SEARCH CONFIGURATION polish (COPY = pg_catalog.simple);
+        END;
+    END IF;
+END
+$$;
+"""
+
+# The vector is recomputed by a row trigger whenever the row is inserted or
+# task_content is updated, which also covers bulk_create and QuerySet.update.
+# Existing rows are backfilled.
+CREATE_TRIGGER_SQL = """
+CREATE TRIGGER courses_trainingtask_search_vector_update
+    BEFORE INSERT OR UPDATE OF task_content ON courses_trainingtask
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'public.polish', task_content);
+UPDATE courses_trainingtask
+    SET search_vector = to_tsvector('public.polish', coalesce(task_content, ''));
+"""
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS courses_trainingtask_search_vector_update
+    ON courses_trainingtask;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0012_alter_trainingtask_answer_and_more"),
+        ("videos", "0003_alter_videotimestamp_timestamp_type"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SEARCH_CONFIG_SQL, migrations.RunSQL.noop),
+        migrations.AddField(
+            model_name="trainingtask",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Kept in sync with task_content by a database trigger.",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trainingtask",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="trainingtask_search_vector_idx"
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
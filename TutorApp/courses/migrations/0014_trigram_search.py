@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:37
+
+import django.contrib.postgres.indexes
+import django.db.models
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations
+
+# unaccent() is only STABLE, so it cannot be used in an index expression.
+# Passing the dictionary explicitly makes the wrapper safe to mark IMMUTABLE.
+CREATE_IMMUTABLE_UNACCENT_SQL = """
+CREATE OR REPLACE FUNCTION public.immutable_unaccent(text)
+    RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+"""
+DROP_IMMUTABLE_UNACCENT_SQL = "DROP FUNCTION IF EXISTS public.immutable_unaccent(text);"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0013_search_vector"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.RunSQL(CREATE_IMMUTABLE_UNACCENT_SQL, DROP_IMMUTABLE_UNACCENT_SQL),
+        migrations.AddIndex(
+            model_name="section",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.Func(
+                        django.db.models.functions.text.Lower("name"),
+                        function="immutable_unaccent",
+                        output_field=django.db.models.TextField(),
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="section_name_trgm_idx",
+            ),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from core.search import trigram_index
 from courses.choices import (
     BookTypeChoices,
     DifficultyLevelChoices,
@@ -6,6 +7,8 @@ from courses.choices import (
     SubjectChoices,
     TaskSourceChoices,
 )
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -53,6 +56,9 @@ class Section(models.Model):
     subject = models.IntegerField(choices=SubjectChoices.choices)
     name = models.CharField(max_length=255)
 
+    class Meta:
+        indexes = [trigram_index("name", "section_name_trgm_idx")]
+
     def __str__(self):
         return (
             f"{self.name} - {self.get_subject_display()} - {self.get_grade_display()}"
@@ -136,9 +142,18 @@ class TrainingTask(models.Model):
         verbose_name="Task Source",
     )
 
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Kept in sync with task_content by a database trigger.",
+    )
+
     class Meta:
         verbose_name = "Training Task"
         verbose_name_plural = "Training Tasks"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="trainingtask_search_vector_idx")
+        ]
 
     def clean(self):
         if self.source == TaskSourceChoices.BOOK:
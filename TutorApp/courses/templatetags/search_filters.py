@@ -0,0 +1,9 @@
+from core.search import render_headline
+from django import template
+
+register = template.Library()
+
+
+@register.filter
+def highlight(headline):
+    return render_headline(headline)
@@ -12,7 +12,6 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, DetailView
 from django_filters.views import FilterView
-from plans.models import UserPlan
 from users.mixins import TeacherRequiredMixin
 
 
@@ -78,12 +77,7 @@ class TrainingTaskDetailView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
-        try:
-            is_premium = self.request.user.userplan.is_premium_or_trial
-        except UserPlan.DoesNotExist:
-            is_premium = False
-
-        context["is_premium"] = is_premium
+        context["is_premium"] = self.request.entitlement.is_premium_or_trial
 
         if self.object.explanation_timestamp:
             context["video_id"] = (
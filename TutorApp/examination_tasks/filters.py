@@ -1,5 +1,7 @@
 import django_filters
+from core.search import full_text_search
 from courses.models import Section, Topic
+from django.utils.translation import gettext_lazy as _
 
 from .models import Exam, ExamTask
 
@@ -16,6 +18,12 @@ SCHOOL_TO_EXAM_TYPE = {
 
 
 class ExamTaskFilter(django_filters.FilterSet):
+    search = django_filters.CharFilter(
+        method="filter_search",
+        label=_("Task content"),
+        required=False,
+    )
+
     section = django_filters.ModelChoiceFilter(
         field_name="section",
         queryset=Section.objects.none(),
@@ -49,7 +57,7 @@ class ExamTaskFilter(django_filters.FilterSet):
     class Meta:
 
         model = ExamTask
-        fields = ["section", "topic", "level_type", "completed_by"]
+        fields = ["search", "section", "topic", "level_type", "completed_by"]
 
     def __init__(self, data=None, queryset=None, *, request=None, prefix=None):
         super().__init__(data=data, queryset=queryset, request=request, prefix=prefix)
@@ -80,3 +88,6 @@ class ExamTaskFilter(django_filters.FilterSet):
         if value:
             return queryset.filter(completed_by=user)
         return queryset.exclude(completed_by=user)
+
+    def filter_search(self, queryset, name, value):
+        return full_text_search(queryset, value)
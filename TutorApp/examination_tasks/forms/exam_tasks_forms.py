@@ -1,3 +1,5 @@
+import re
+
 from courses.models import Section, Topic
 from django import forms
 from django.utils.translation import gettext_lazy as _
@@ -78,7 +80,7 @@ class ExamTaskBasicForm(forms.Form):
         task_id = cleaned_data.get("task_id")
         task_pages = cleaned_data.get("task_pages")
 
-        if exam and not exam.exam_file:
+        if exam and not exam.tasks_link:
             raise forms.ValidationError(_("Selected exam has no PDF file attached."))
 
         if exam and task_id:
@@ -143,6 +145,132 @@ class ExamTaskPreviewForm(forms.Form):
     )
 
 
+PAGES_PATTERN = re.compile(r"^\d+(-\d+)?$")
+
+
+class ExamBulkSelectForm(forms.Form):
+    """First step of the bulk import: choosing the exam to split into tasks"""
+
+    exam = forms.ModelChoiceField(
+        queryset=Exam.objects.none(),
+        label=_("Select Exam"),
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["exam"].queryset = (
+            ExamTaskDBService.get_exams_with_available_tasks()
+        )
+
+    def clean_exam(self):
+        exam = self.cleaned_data["exam"]
+        if not exam.tasks_link:
+            raise forms.ValidationError(_("Selected exam has no PDF file attached."))
+        return exam
+
+
+class ExamBulkTaskForm(forms.Form):
+    """Single editable row of the bulk import preview table"""
+
+    include = forms.BooleanField(
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={"class": "form-check-input"}),
+    )
+    task_id = forms.IntegerField(
+        min_value=1,
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+    task_pages = forms.CharField(
+        required=False,
+        max_length=20,
+        widget=forms.TextInput(
+            attrs={"class": "form-control", "placeholder": _("e.g. 5 or 5-6")}
+        ),
+    )
+    answer_pages = forms.CharField(
+        required=False,
+        max_length=20,
+        widget=forms.TextInput(
+            attrs={"class": "form-control", "placeholder": _("e.g. 15 or 15-16")}
+        ),
+    )
+    task_content = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={"class": "form-control", "rows": 3}),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get("include"):
+            return cleaned_data
+
+        task_pages = (cleaned_data.get("task_pages") or "").strip()
+        if not task_pages:
+            self.add_error("task_pages", _("Task pages are required."))
+        elif not PAGES_PATTERN.match(task_pages):
+            self.add_error("task_pages", _("Invalid page format. Use '5' or '5-6'."))
+
+        answer_pages = (cleaned_data.get("answer_pages") or "").strip()
+        if answer_pages and not PAGES_PATTERN.match(answer_pages):
+            self.add_error("answer_pages", _("Invalid page format. Use '5' or '5-6'."))
+
+        return cleaned_data
+
+
+class BaseExamBulkTaskFormSet(forms.BaseFormSet):
+    """Validates task numbers of all included rows against each other and the exam"""
+
+    def __init__(self, *args, exam=None, **kwargs):
+        self.exam = exam
+        super().__init__(*args, **kwargs)
+
+    def clean(self):
+        if any(self.errors):
+            return
+
+        task_ids = [
+            form.cleaned_data["task_id"]
+            for form in self.forms
+            if form.cleaned_data.get("include")
+        ]
+        if not task_ids:
+            raise forms.ValidationError(_("Select at least one task to import."))
+
+        duplicates = sorted(
+            {task_id for task_id in task_ids if task_ids.count(task_id) > 1}
+        )
+        if duplicates:
+            raise forms.ValidationError(
+                _("Duplicated task numbers: %(ids)s")
+                % {"ids": ", ".join(map(str, duplicates))}
+            )
+
+        if self.exam is not None:
+            existing = sorted(
+                self.exam.tasks.filter(task_id__in=task_ids).values_list(
+                    "task_id", flat=True
+                )
+            )
+            if existing:
+                raise forms.ValidationError(
+                    _("Tasks already exist for this exam: %(ids)s")
+                    % {"ids": ", ".join(map(str, existing))}
+                )
+
+    @property
+    def included_data(self):
+        return [
+            form.cleaned_data for form in self.forms if form.cleaned_data.get("include")
+        ]
+
+
+ExamBulkTaskFormSet = forms.formset_factory(
+    ExamBulkTaskForm, formset=BaseExamBulkTaskFormSet, extra=0
+)
+
+
 class TaskSearchForm(forms.Form):
     """
     Form used to validate and clean the parameters of
@@ -0,0 +1,309 @@
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from examination_tasks.models import Exam, ExamTask
+from examination_tasks.services import (
+    CutPdfCacheService,
+    ExamFileNameParser,
+    ExamSegmentationService,
+    PdfProcessingPool,
+    TextLayerService,
+)
+from examination_tasks.services.examFileNameParser import ParsedExamFile
+from examination_tasks.services.examSegmentationService import TaskSegment
+from examination_tasks.services.textLayerService import PageText
+
+
+class Command(BaseCommand):
+    help = (
+        "Ingest a directory of exam PDFs: create exams from file names, "
+        "detect and save all their tasks and pre-cut task PDFs"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory", help="Directory with exam PDF files")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of worker processes (defaults to PDF_POOL_PROCESSES)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Detect tasks and report what would be created without saving",
+        )
+
+    def handle(self, *args, **options):
+        directory = options["directory"]
+        dry_run = options["dry_run"]
+        if not os.path.isdir(directory):
+            raise CommandError(f"Directory not found: {directory}")
+
+        started = time.monotonic()
+        groups = self._collect_files(directory)
+        pending = self._skip_ingested(groups)
+
+        stats = {"exams": 0, "tasks": 0, "failed": 0, "cut": 0, "documents": 0}
+        ingested: List[Exam] = []
+
+        with PdfProcessingPool(processes=options["workers"]) as pool:
+            answers = self._detect_answer_pages(pool, pending, stats)
+
+            task_files = {group["tasks"].path: key for key, group in pending.items()}
+            for result in pool.segment_and_render(task_files):
+                stats["documents"] += 1
+                key = task_files[result.args[0]]
+                group = pending[key]
+                name = os.path.basename(result.args[0])
+
+                if not result.ok:
+                    stats["failed"] += 1
+                    self.stdout.write(
+                        self.style.ERROR(f"Failed: {name} - {result.error}")
+                    )
+                    continue
+
+                pages, rendered = result.value
+
+                if dry_run:
+                    self.stdout.write(
+                        f"Would create {len(rendered)} tasks from {name} "
+                        f"({result.duration:.2f}s)"
+                    )
+                    stats["exams"] += 1
+                    stats["tasks"] += len(rendered)
+                    continue
+
+                try:
+                    exam = self._ingest_exam(
+                        group, pages, rendered, answers.get(key, (None, {}))
+                    )
+                except Exception as e:
+                    stats["failed"] += 1
+                    self.stdout.write(self.style.ERROR(f"Failed: {name} - {e}"))
+                    continue
+
+                ingested.append(exam)
+                stats["exams"] += 1
+                stats["tasks"] += len(rendered)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Ingested: {exam} - {len(rendered)} tasks "
+                        f"({result.duration:.2f}s)"
+                    )
+                )
+
+            if ingested:
+                stats["cut"] = self._precut(pool, ingested)
+
+        self._write_summary(stats, time.monotonic() - started, dry_run)
+
+    def _collect_files(self, directory: str) -> Dict[tuple, Dict[str, ParsedExamFile]]:
+        """Parses every PDF in the directory and pairs tasks with solutions."""
+        groups: Dict[tuple, Dict[str, ParsedExamFile]] = {}
+        for root, _dirs, files in os.walk(directory):
+            for name in sorted(files):
+                if not name.lower().endswith(".pdf"):
+                    continue
+                parsed = ExamFileNameParser.parse(os.path.join(root, name))
+                if parsed is None:
+                    self.stdout.write(
+                        self.style.WARNING(f"Skipped: {name} - unrecognised file name")
+                    )
+                    continue
+
+                role = "solutions" if parsed.is_solutions else "tasks"
+                group = groups.setdefault(parsed.exam_key, {})
+                if role in group:
+                    self.stdout.write(
+                        self.style.WARNING(f"Skipped: {name} - duplicate {role} file")
+                    )
+                    continue
+                group[role] = parsed
+        return groups
+
+    def _skip_ingested(
+        self, groups: Dict[tuple, Dict[str, ParsedExamFile]]
+    ) -> Dict[tuple, Dict[str, object]]:
+        """
+        Drops exams which already have tasks, so an interrupted run can be
+        restarted. Exams are saved together with their tasks, so an exam
+        without tasks was either added by hand or never finished.
+        """
+        pending = {}
+        for key, group in groups.items():
+            tasks_file = group.get("tasks")
+            if tasks_file is None:
+                name = os.path.basename(group["solutions"].path)
+                self.stdout.write(
+                    self.style.WARNING(f"Skipped: {name} - no matching tasks file")
+                )
+                continue
+
+            exam = self._find_exam(tasks_file)
+            if exam is not None and exam.tasks.exists():
+                self.stdout.write(f"Already ingested: {exam}")
+                continue
+
+            pending[key] = {**group, "exam": exam}
+        return pending
+
+    def _detect_answer_pages(
+        self,
+        pool: PdfProcessingPool,
+        pending: Dict[tuple, Dict[str, object]],
+        stats: Dict[str, int],
+    ) -> Dict[tuple, Tuple[list, Dict[int, str]]]:
+        """
+        Reads the text layer of every solutions file and maps task numbers
+        to answer pages.
+        """
+        solution_files = {
+            group["solutions"].path: key
+            for key, group in pending.items()
+            if group.get("solutions")
+        }
+        answers: Dict[tuple, Tuple[list, Dict[int, str]]] = {}
+        for result in pool.read_pages(solution_files):
+            stats["documents"] += 1
+            if not result.ok:
+                name = os.path.basename(result.args[0])
+                self.stdout.write(
+                    self.style.WARNING(f"No answer pages for {name} - {result.error}")
+                )
+                continue
+            segments = ExamSegmentationService.segment_pages(result.value)
+            answers[solution_files[result.args[0]]] = (
+                result.value,
+                {segment.task_number: segment.pages_string for segment in segments},
+            )
+        return answers
+
+    @staticmethod
+    def _find_exam(parsed: ParsedExamFile) -> Optional[Exam]:
+        return Exam.objects.filter(
+            exam_type=parsed.exam_type,
+            year=parsed.year,
+            month=parsed.month,
+            level_type=parsed.level_type,
+        ).first()
+
+    @staticmethod
+    def _ingest_exam(
+        group: Dict[str, object],
+        pages: List[PageText],
+        rendered: List[Tuple[TaskSegment, bytes]],
+        answers: Tuple[Optional[List[PageText]], Dict[int, str]],
+    ) -> Exam:
+        """
+        Creates (or completes) the exam and bulk-creates all its tasks in one
+        transaction. Text layers read by the workers are stored for the saved
+        copies of the PDFs. Files stored before the transaction rolls back are
+        removed again.
+        """
+        solution_pages, answer_pages = answers
+        tasks_file: ParsedExamFile = group["tasks"]
+        solutions_file: Optional[ParsedExamFile] = group.get("solutions")
+        exam: Optional[Exam] = group["exam"]
+        stored: List[str] = []
+        committed: List[bool] = []
+        layers_stored = True
+
+        try:
+            with transaction.atomic():
+                # Registered first, so it runs before any other commit hook
+                # which could still raise once the rows are committed.
+                transaction.on_commit(lambda: committed.append(True))
+                if exam is None:
+                    exam = Exam(
+                        subject=tasks_file.subject,
+                        exam_type=tasks_file.exam_type,
+                        year=tasks_file.year,
+                        month=tasks_file.month,
+                        level_type=tasks_file.level_type,
+                    )
+                    Command._store_file(exam.tasks_link, tasks_file.path, stored)
+                    TextLayerService.store(exam.tasks_link.path, pages)
+                if solutions_file and not exam.solutions_link:
+                    Command._store_file(
+                        exam.solutions_link, solutions_file.path, stored
+                    )
+                    if solution_pages:
+                        TextLayerService.store(exam.solutions_link.path, solution_pages)
+                    else:
+                        layers_stored = False
+                exam.tasks_count = max(exam.tasks_count, len(rendered))
+                # Skips the post_save handler which would parse the PDFs again.
+                exam._text_layers_stored = layers_stored
+                exam.save()
+
+                tasks = []
+                for segment, pdf_bytes in rendered:
+                    task = ExamTask(
+                        exam=exam,
+                        task_id=segment.task_number,
+                        task_pages=segment.pages_string,
+                        answer_pages=answer_pages.get(segment.task_number, ""),
+                        task_content=segment.content,
+                    )
+                    task.task_screen.save(
+                        f"zadanie_{segment.task_number}.pdf",
+                        ContentFile(pdf_bytes),
+                        save=False,
+                    )
+                    stored.append(task.task_screen.name)
+                    tasks.append(task)
+                ExamTask.objects.bulk_create(tasks)
+        except Exception:
+            if committed:
+                raise
+            for name in stored:
+                TextLayerService.delete(default_storage.path(name))
+                default_storage.delete(name)
+            raise
+
+        return exam
+
+    @staticmethod
+    def _store_file(field_file, path: str, stored: List[str]) -> None:
+        with open(path, "rb") as source:
+            field_file.save(os.path.basename(path), File(source), save=False)
+        stored.append(field_file.name)
+
+    def _precut(self, pool: PdfProcessingPool, exams: List[Exam]) -> int:
+        """Pre-cuts task and answer PDFs of the ingested exams in parallel."""
+        service = CutPdfCacheService()
+        jobs = [
+            (source_path, kind, exam.pk, entries)
+            for exam in exams
+            for source_path, kind, entries in service.plan_exam(exam)
+        ]
+        cut = 0
+        for result in pool.cut(jobs):
+            if result.ok:
+                cut += result.value
+            else:
+                name = os.path.basename(result.args[0])
+                self.stdout.write(
+                    self.style.WARNING(f"Pre-cut failed: {name} - {result.error}")
+                )
+        return cut
+
+    def _write_summary(self, stats: Dict[str, int], elapsed: float, dry_run: bool):
+        elapsed = max(elapsed, 1e-6)
+        prefix = "Dry run: " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}{stats['exams']} exams, {stats['tasks']} tasks, "
+                f"{stats['cut']} PDFs pre-cut, {stats['failed']} failed "
+                f"in {elapsed:.1f}s ({stats['documents'] / elapsed:.2f} documents/s, "
+                f"{stats['tasks'] / elapsed:.2f} tasks/s)"
+            )
+        )
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:34
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The vector is recomputed by a row trigger whenever the row is inserted or
+# task_content is updated, which also covers bulk_create and QuerySet.update.
+# Existing rows are backfilled.
+CREATE_TRIGGER_SQL = """
+CREATE TRIGGER examination_tasks_examtask_search_vector_update
+    BEFORE INSERT OR UPDATE OF task_content ON examination_tasks_examtask
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'public.polish', task_content);
+UPDATE examination_tasks_examtask
+    SET search_vector = to_tsvector('public.polish', coalesce(task_content, ''));
+"""
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS examination_tasks_examtask_search_vector_update
+    ON examination_tasks_examtask;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0013_search_vector"),
+        ("examination_tasks", "0003_alter_exam_subject"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examtask",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Kept in sync with task_content by a database trigger.",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="examtask",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="examtask_search_vector_idx"
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
@@ -3,6 +3,8 @@ import os
 from courses.choices import SubjectChoices
 from courses.models import Topic
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from examination_tasks.choices import (
     LEVEL_CHOICES,
@@ -94,6 +96,11 @@ class ExamTask(models.Model):
         blank=True,
         help_text="The extracted content of the task from the PDF file.",
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Kept in sync with task_content by a database trigger.",
+    )
     task_pages = models.CharField(
         max_length=20,
         blank=True,
@@ -117,6 +124,9 @@ class ExamTask(models.Model):
         verbose_name_plural = "Exam Tasks"
         unique_together = ("exam", "task_id")
         ordering = ["exam", "task_id"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="examtask_search_vector_idx")
+        ]
 
     def __str__(self) -> str:
         return f"{self.exam} – Task {self.task_id}"
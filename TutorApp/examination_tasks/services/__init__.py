@@ -1,15 +1,25 @@
+from .cutPdfCacheService import CutPdfCacheService
+from .examFileNameParser import ExamFileNameParser
+from .examSegmentationService import ExamSegmentationService
 from .examTaskDBService import ExamTaskDBService
 from .extractTaskContentFromLines import ExtractTaskContentFromLines
 from .extractTaskFromPdf import ExtractTaskFromPdf
 from .extractTaskPagesFromPdf import ExtractTaskPagesFromPdf
 from .extractTaskTextFromPdf import ExtractTaskTextFromPdf
+from .pdfProcessingPool import PdfProcessingPool
 from .tempFileService import TempFileService
+from .textLayerService import TextLayerService
 
 __all__ = [
+    "CutPdfCacheService",
+    "ExamFileNameParser",
+    "ExamSegmentationService",
     "ExamTaskDBService",
     "ExtractTaskFromPdf",
     "ExtractTaskContentFromLines",
     "ExtractTaskTextFromPdf",
     "ExtractTaskPagesFromPdf",
+    "PdfProcessingPool",
     "TempFileService",
+    "TextLayerService",
 ]
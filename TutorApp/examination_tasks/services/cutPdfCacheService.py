@@ -0,0 +1,364 @@
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import pymupdf
+from django.conf import settings
+
+from .examTaskDBService import ExamTaskDBService
+from .extractTaskPagesFromPdf import ExtractTaskPagesFromPdf
+
+if TYPE_CHECKING:
+    from ..models import Exam
+
+logger = logging.getLogger(__name__)
+
+
+class CutPdfCacheService:
+    """
+    Disk-backed, content-addressed cache of cut task/answer PDFs.
+
+    Entries are stored as ``<cache_dir>/<exam_pk>/<task_pk>-<kind>-<key>.pdf``.
+    The key combines the source PDF fingerprint (content hash memoized by
+    mtime/size), the page list and the kind, so editing the source file or the
+    page range automatically produces a new entry. Total size is bounded with
+    least-recently-used eviction based on file mtime, which is refreshed on
+    every hit. Each process keeps an estimate of the cache size and only
+    walks the directory when the estimate goes over budget, after every
+    ``RESCAN_EVERY`` stores (to account for other processes' writes) and
+    once more after a whole-archive pre-cut.
+    """
+
+    KIND_TASK = "task"
+    KIND_ANSWER = "answer"
+    KINDS = (KIND_TASK, KIND_ANSWER)
+    RESCAN_EVERY = 50
+
+    # Estimated total size and stores since the last full scan, per cache
+    # directory and process. Every full scan in ``evict`` resets both.
+    _estimated_bytes: Dict[str, int] = {}
+    _stores_since_scan: Dict[str, int] = {}
+
+    def __init__(
+        self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        self.cache_dir = str(cache_dir or settings.CUT_PDF_CACHE_DIR)
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else settings.CUT_PDF_CACHE_MAX_BYTES
+        )
+
+    def get_or_create(
+        self,
+        source_path: str,
+        pages: List[int],
+        kind: str,
+        exam_pk: int,
+        task_pk: int,
+    ) -> Optional[str]:
+        """
+        Returns the path of the cached cut PDF, cutting and storing it on a miss.
+
+        Args:
+            source_path: Path to the full exam (or solutions) PDF.
+            pages: 1-based page numbers to cut.
+            kind: Either ``"task"`` or ``"answer"``.
+            exam_pk: Primary key of the exam the source file belongs to.
+            task_pk: Primary key of the exam task.
+
+        Returns:
+            Path to the cut PDF, or None if no page could be extracted.
+        """
+        path = self.get(source_path, pages, kind, exam_pk, task_pk)
+        if path:
+            return path
+
+        pdf_bytes = ExtractTaskPagesFromPdf.get_single_task_pdf(
+            task_link=source_path, pages=pages
+        )
+        if not pdf_bytes:
+            return None
+
+        return self.store(source_path, pages, kind, exam_pk, task_pk, pdf_bytes)
+
+    def get(
+        self,
+        source_path: str,
+        pages: List[int],
+        kind: str,
+        exam_pk: int,
+        task_pk: int,
+    ) -> Optional[str]:
+        """Returns the cached entry path on a hit (refreshing its LRU position)."""
+        key = self.build_key(source_path, pages, kind)
+        path = self._entry_path(exam_pk, task_pk, kind, key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def store(
+        self,
+        source_path: str,
+        pages: List[int],
+        kind: str,
+        exam_pk: int,
+        task_pk: int,
+        pdf_bytes: bytes,
+    ) -> str:
+        """
+        Atomically writes a cut PDF into the cache and drops stale entries
+        of the same task and kind. Evicts old entries once the cache grows
+        over max_bytes.
+
+        Returns:
+            Path to the stored entry.
+        """
+        key = self.build_key(source_path, pages, kind)
+        path = self._entry_path(exam_pk, task_pk, kind, key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(pdf_bytes)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        freed = self._remove_entries(exam_pk, task_pk, kind, keep=path)
+        estimate = self._estimated_bytes.get(self.cache_dir)
+        stores = self._stores_since_scan.get(self.cache_dir, 0) + 1
+        if estimate is None or stores >= self.RESCAN_EVERY:
+            self.evict()
+        else:
+            estimate += len(pdf_bytes) - freed
+            self._estimated_bytes[self.cache_dir] = estimate
+            self._stores_since_scan[self.cache_dir] = stores
+            if estimate > self.max_bytes:
+                self.evict()
+        return path
+
+    def warm(
+        self,
+        source_path: str,
+        kind: str,
+        exam_pk: int,
+        entries: List[Tuple[int, List[int]]],
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Cuts every missing entry of one source PDF, opening the file only once.
+
+        Args:
+            source_path: Path to the full exam (or solutions) PDF.
+            kind: Either ``"task"`` or ``"answer"``.
+            exam_pk: Primary key of the exam the source file belongs to.
+            entries: ``(task_pk, pages)`` pairs to cut.
+            progress_callback: Called after each processed entry with the
+                number of entries processed so far.
+
+        Returns:
+            Number of newly cut entries.
+        """
+        missing = [
+            (task_pk, pages)
+            for task_pk, pages in entries
+            if pages and not self.get(source_path, pages, kind, exam_pk, task_pk)
+        ]
+        processed = len(entries) - len(missing)
+        if progress_callback:
+            progress_callback(processed)
+        if not missing:
+            return 0
+
+        cut = 0
+        with pymupdf.open(source_path) as exam:
+            for task_pk, pages in missing:
+                pdf_bytes = ExtractTaskPagesFromPdf.cut_pages(exam, pages)
+                if pdf_bytes:
+                    self.store(source_path, pages, kind, exam_pk, task_pk, pdf_bytes)
+                    cut += 1
+                processed += 1
+                if progress_callback:
+                    progress_callback(processed)
+        return cut
+
+    def warm_exam(
+        self,
+        exam: "Exam",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Pre-cuts task and answer PDFs of every task of the given exam.
+
+        Args:
+            exam: Exam whose tasks should be cut.
+            progress_callback: Called with ``(processed, total)`` as entries
+                are processed.
+
+        Returns:
+            Tuple of (newly cut entries, total entries).
+        """
+        plan = self.plan_exam(exam)
+        total = sum(len(entries) for _path, _kind, entries in plan)
+        done = 0
+        cut = 0
+        for source_path, kind, entries in plan:
+            offset = done
+            cut += self.warm(
+                source_path,
+                kind,
+                exam.pk,
+                entries,
+                progress_callback=(
+                    (lambda processed: progress_callback(offset + processed, total))
+                    if progress_callback
+                    else None
+                ),
+            )
+            done += len(entries)
+        return cut, total
+
+    def plan_exam(
+        self, exam: "Exam"
+    ) -> List[Tuple[str, str, List[Tuple[int, List[int]]]]]:
+        """
+        Lists what has to be cut for an exam, one item per source PDF.
+
+        Returns:
+            ``(source_path, kind, [(task_pk, pages), ...])`` tuples, ready to be
+            passed to ``warm`` (also from a worker process).
+        """
+        sources = {
+            self.KIND_TASK: (exam.tasks_link, "task_pages"),
+            self.KIND_ANSWER: (exam.solutions_link, "answer_pages"),
+        }
+        plan = []
+        for kind, (source, pages_field) in sources.items():
+            if not source:
+                continue
+            entries = [
+                (task_pk, ExamTaskDBService.parse_pages_string(pages_string))
+                for task_pk, pages_string in exam.tasks.values_list("pk", pages_field)
+                if pages_string
+            ]
+            if entries:
+                plan.append((source.path, kind, entries))
+        return plan
+
+    def build_key(self, source_path: str, pages: List[int], kind: str) -> str:
+        """Builds the content-addressed key for a cut PDF."""
+        fingerprint = self._source_fingerprint(source_path)
+        pages_part = ",".join(str(page) for page in pages)
+        raw = f"{fingerprint}:{kind}:{pages_part}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def invalidate_exam(self, exam_pk: int) -> None:
+        """Removes every cached entry of the given exam."""
+        shutil.rmtree(self._exam_dir(exam_pk), ignore_errors=True)
+        self._estimated_bytes.pop(self.cache_dir, None)
+
+    def invalidate_task(self, exam_pk: int, task_pk: int) -> None:
+        """Removes every cached entry (both kinds) of the given task."""
+        freed = sum(self._remove_entries(exam_pk, task_pk, kind) for kind in self.KINDS)
+        estimate = self._estimated_bytes.get(self.cache_dir)
+        if estimate is not None:
+            self._estimated_bytes[self.cache_dir] = max(0, estimate - freed)
+
+    def evict(self) -> int:
+        """
+        Removes least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            Number of removed entries.
+        """
+        entries = []
+        total = 0
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".pdf"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        self._stores_since_scan[self.cache_dir] = 0
+        if total <= self.max_bytes:
+            self._estimated_bytes[self.cache_dir] = total
+            return removed
+
+        for _mtime, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+            if total <= self.max_bytes:
+                break
+
+        self._estimated_bytes[self.cache_dir] = total
+        logger.info("Evicted %s cut PDF(s) from cache", removed)
+        return removed
+
+    def _exam_dir(self, exam_pk: int) -> str:
+        return os.path.join(self.cache_dir, str(exam_pk))
+
+    def _entry_path(self, exam_pk: int, task_pk: int, kind: str, key: str) -> str:
+        return os.path.join(self._exam_dir(exam_pk), f"{task_pk}-{kind}-{key}.pdf")
+
+    def _remove_entries(
+        self, exam_pk: int, task_pk: int, kind: str, keep: Optional[str] = None
+    ) -> int:
+        """Removes entries of a task and kind, returning the freed bytes."""
+        directory = self._exam_dir(exam_pk)
+        prefix = f"{task_pk}-{kind}-"
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return 0
+
+        freed = 0
+        for name in names:
+            path = os.path.join(directory, name)
+            if name.startswith(prefix) and path != keep:
+                try:
+                    size = os.path.getsize(path)
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                freed += size
+        return freed
+
+    @staticmethod
+    def _source_fingerprint(source_path: str) -> str:
+        """
+        Returns a sha256 of the source PDF content, memoized per process by
+        (path, mtime, size) so the file is hashed once per modification.
+        """
+        stat = os.stat(source_path)
+        return CutPdfCacheService._hash_file(
+            source_path, stat.st_mtime_ns, stat.st_size
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _hash_file(source_path: str, mtime_ns: int, size: int) -> str:
+        digest = hashlib.sha256()
+        with open(source_path, "rb") as source:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,180 @@
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from courses.choices import SubjectChoices
+
+from ..choices import ExamTypeChoices
+
+
+@dataclass(frozen=True)
+class ParsedExamFile:
+    """Exam attributes recovered from a PDF file name."""
+
+    path: str
+    subject: int
+    exam_type: int
+    year: int
+    month: int
+    level_type: Optional[int]
+    is_solutions: bool
+
+    @property
+    def exam_key(self) -> Tuple[int, int, int, int, Optional[int]]:
+        """Identifies the exam, so task and solution files can be paired."""
+        return (self.subject, self.exam_type, self.year, self.month, self.level_type)
+
+
+class ExamFileNameParser:
+    """
+    Parses exam PDF file names such as
+    ``matematyka-2025-czerwiec-matura-rozszerzona.pdf`` or
+    ``egzamin-osmoklasisty_2024_maj_odpowiedzi.pdf``.
+
+    Tokens are separated by ``-``, ``_``, spaces or dots and may appear in any
+    order. Polish diacritics are ignored and months may be written as Polish
+    (any case form) or English names. The subject defaults to mathematics and
+    the level is only used for matriculation exams.
+    """
+
+    TOKEN_SPLIT_PATTERN = re.compile(r"[-_.\s]+")
+    YEAR_PATTERN = re.compile(r"^(19|20)\d{2}$")
+
+    SUBJECTS = {
+        "matematyka": SubjectChoices.MATH,
+        "math": SubjectChoices.MATH,
+        "fizyka": SubjectChoices.PHYSICS,
+        "physics": SubjectChoices.PHYSICS,
+    }
+    EXAM_TYPES = {
+        "matura": ExamTypeChoices.MATRICULATION,
+        "maturalny": ExamTypeChoices.MATRICULATION,
+        "matriculation": ExamTypeChoices.MATRICULATION,
+        "osmoklasisty": ExamTypeChoices.EIGHTH_GRADE,
+        "e8": ExamTypeChoices.EIGHTH_GRADE,
+    }
+    LEVELS = {
+        "podstawowa": 1,
+        "podstawowy": 1,
+        "pp": 1,
+        "basic": 1,
+        "rozszerzona": 2,
+        "rozszerzony": 2,
+        "pr": 2,
+        "extended": 2,
+    }
+    SOLUTION_MARKERS = {
+        "odpowiedzi",
+        "rozwiazania",
+        "klucz",
+        "zasady",
+        "answers",
+        "solutions",
+    }
+    # The first three letters identify every Polish month in any case form
+    # ("maj", "maja", "czerwiec", "czerwca", ...).
+    POLISH_MONTH_PREFIXES = {
+        "sty": 1,
+        "lut": 2,
+        "mar": 3,
+        "kwi": 4,
+        "maj": 5,
+        "cze": 6,
+        "lip": 7,
+        "sie": 8,
+        "wrz": 9,
+        "paz": 10,
+        "lis": 11,
+        "gru": 12,
+    }
+    ENGLISH_MONTHS = {
+        "january": 1,
+        "february": 2,
+        "march": 3,
+        "april": 4,
+        "may": 5,
+        "june": 6,
+        "july": 7,
+        "august": 8,
+        "september": 9,
+        "october": 10,
+        "november": 11,
+        "december": 12,
+    }
+
+    @staticmethod
+    def parse(path: str) -> Optional[ParsedExamFile]:
+        """
+        Parses the file name of the given path.
+
+        Args:
+            path: Path to an exam PDF.
+
+        Returns:
+            ParsedExamFile, or None if the year or month cannot be recognised.
+        """
+        name, extension = os.path.splitext(os.path.basename(path))
+        if extension.lower() != ".pdf":
+            return None
+
+        subject = SubjectChoices.MATH
+        exam_type = ExamTypeChoices.MATRICULATION
+        year = None
+        month = None
+        level_type = None
+        is_solutions = False
+
+        for token in ExamFileNameParser._tokenize(name):
+            if ExamFileNameParser.YEAR_PATTERN.match(token):
+                year = int(token)
+            elif token in ExamFileNameParser.SUBJECTS:
+                subject = ExamFileNameParser.SUBJECTS[token]
+            elif token in ExamFileNameParser.EXAM_TYPES:
+                exam_type = ExamFileNameParser.EXAM_TYPES[token]
+            elif token in ExamFileNameParser.LEVELS:
+                level_type = ExamFileNameParser.LEVELS[token]
+            elif token in ExamFileNameParser.SOLUTION_MARKERS:
+                is_solutions = True
+            elif month is None:
+                month = ExamFileNameParser._parse_month(token)
+
+        if year is None or month is None:
+            return None
+
+        if exam_type != ExamTypeChoices.MATRICULATION:
+            level_type = None
+        elif level_type is None:
+            level_type = 1
+
+        return ParsedExamFile(
+            path=path,
+            subject=int(subject),
+            exam_type=int(exam_type),
+            year=year,
+            month=month,
+            level_type=level_type,
+            is_solutions=is_solutions,
+        )
+
+    @staticmethod
+    def _tokenize(name: str) -> list:
+        normalized = unicodedata.normalize(
+            "NFKD", name.lower().replace("ł", "l")
+        ).encode("ascii", "ignore")
+        return [
+            token
+            for token in ExamFileNameParser.TOKEN_SPLIT_PATTERN.split(
+                normalized.decode()
+            )
+            if token
+        ]
+
+    @staticmethod
+    def _parse_month(token: str) -> Optional[int]:
+        if token in ExamFileNameParser.ENGLISH_MONTHS:
+            return ExamFileNameParser.ENGLISH_MONTHS[token]
+        if len(token) >= 3 and token.isalpha():
+            return ExamFileNameParser.POLISH_MONTH_PREFIXES.get(token[:3])
+        return None
@@ -0,0 +1,260 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import pymupdf
+
+from .extractTaskContentFromLines import ExtractTaskContentFromLines
+from .textLayerService import BBox, PageLine, PageText, TextLayerService
+
+
+@dataclass(frozen=True)
+class TaskRegion:
+    """Part of a task that lies on a single page."""
+
+    page_number: int
+    bbox: BBox
+
+
+@dataclass(frozen=True)
+class TaskSegment:
+    """
+    A single ``Zadanie N.`` task found in an exam.
+
+    Attributes:
+        task_number: Number from the task header.
+        regions: Per-page bounding boxes, in reading order.
+        content: Cleaned task text (header and filtered phrases removed).
+    """
+
+    task_number: int
+    regions: Tuple[TaskRegion, ...]
+    content: str
+
+    @property
+    def start_page(self) -> int:
+        return self.regions[0].page_number
+
+    @property
+    def end_page(self) -> int:
+        return self.regions[-1].page_number
+
+    @property
+    def pages(self) -> List[int]:
+        return list(range(self.start_page, self.end_page + 1))
+
+    @property
+    def pages_string(self) -> str:
+        """Page range in the ``"5"`` / ``"5-7"`` format used by ExamTask."""
+        if self.start_page == self.end_page:
+            return str(self.start_page)
+        return f"{self.start_page}-{self.end_page}"
+
+
+class ExamSegmentationService:
+    """
+    Splits a whole exam PDF into tasks in a single pass.
+
+    Pages come from the persisted text layer, so the PDF is parsed at most
+    once (when its layer is built) and every page is walked a single time.
+    Every ``Zadanie N.`` header opens a new task which lasts until the next
+    header with a higher number, or until a ``brudnopis`` marker ends it
+    early. On every page the task covers everything from its start down to
+    the next task or the page footer, so figures and pages without any text
+    stay part of the task.
+
+    Example:
+        >>> segments = ExamSegmentationService.segment("exam.pdf")
+        >>> [(s.task_number, s.pages_string) for s in segments]
+        [(1, '2'), (2, '2-3'), ...]
+    """
+
+    TASK_START_PATTERN = ExtractTaskContentFromLines.TASK_START_PATTERN
+    END_MARKER = "brudnopis"
+    FOOTER_PHRASES = ("więcej arkuszy", "arkusze.pl", "brudnopis")
+    PAGE_NUMBER_PATTERN = re.compile(
+        r"^\s*(strona\s+)?\d+(\s*(z|/)\s*\d+)?\s*$", re.IGNORECASE
+    )
+    MARGIN = 5
+    PAGE_BAND = 0.08
+
+    @staticmethod
+    def segment(file_path: str) -> List[TaskSegment]:
+        """
+        Finds every task of the exam stored under the given path.
+
+        Args:
+            file_path: Path to the exam PDF.
+
+        Returns:
+            List of task segments ordered by their position in the file.
+        """
+        return ExamSegmentationService.segment_pages(TextLayerService.load(file_path))
+
+    @staticmethod
+    def segment_pages(pages: List[PageText]) -> List[TaskSegment]:
+        """
+        Groups already extracted page lines into tasks.
+
+        Args:
+            pages: Text of the pages in document order.
+
+        Returns:
+            List of task segments ordered by their position in the file.
+        """
+        segments: List[TaskSegment] = []
+        current: Optional[dict] = None
+
+        for page in pages:
+            top, bottom = ExamSegmentationService._content_bounds(page)
+            if current is not None and not current["closed"]:
+                current["regions"][page.number] = [top, bottom]
+                current["page_widths"][page.number] = page.width
+
+            for line in page.lines:
+                match = ExamSegmentationService.TASK_START_PATTERN.match(line.text)
+                if match and (
+                    current is None or int(match.group(1)) > current["task_number"]
+                ):
+                    if current is not None:
+                        if not current["closed"]:
+                            current["regions"][page.number][1] = line.bbox[1]
+                            current["cut_pages"].add(page.number)
+                        segments.append(ExamSegmentationService._build_segment(current))
+                    current = {
+                        "task_number": int(match.group(1)),
+                        "lines": [line.text],
+                        "regions": {
+                            page.number: [
+                                max(top, line.bbox[1] - ExamSegmentationService.MARGIN),
+                                bottom,
+                            ]
+                        },
+                        "page_widths": {page.number: page.width},
+                        "line_pages": {page.number},
+                        "cut_pages": set(),
+                        "closed": False,
+                    }
+                    continue
+
+                if current is None or current["closed"]:
+                    continue
+
+                lower = line.text.strip().lower()
+                if ExamSegmentationService.END_MARKER in lower:
+                    current["closed"] = True
+                    current["regions"][page.number][1] = line.bbox[1]
+                    current["cut_pages"].add(page.number)
+                    continue
+                if ExamSegmentationService._is_footer(line, page):
+                    continue
+
+                current["lines"].append(line.text)
+                if lower:
+                    current["line_pages"].add(page.number)
+
+        if current is not None:
+            segments.append(ExamSegmentationService._build_segment(current))
+
+        return segments
+
+    @staticmethod
+    def render_segment(doc: pymupdf.Document, segment: TaskSegment) -> bytes:
+        """
+        Renders a task as a PDF with one clipped page per task region.
+
+        Args:
+            doc: Opened exam document the segment was found in.
+            segment: Segment to render.
+
+        Returns:
+            PDF file content.
+        """
+        task_doc = pymupdf.open()
+        try:
+            for region in segment.regions:
+                x0, y0, x1, y1 = region.bbox
+                width, height = x1 - x0, y1 - y0
+                new_page = task_doc.new_page(width=width, height=height)
+                new_page.show_pdf_page(
+                    pymupdf.Rect(0, 0, width, height),
+                    doc,
+                    region.page_number - 1,
+                    clip=pymupdf.Rect(region.bbox),
+                )
+            return task_doc.tobytes(garbage=4, deflate=True)
+        finally:
+            task_doc.close()
+
+    @staticmethod
+    def _is_footer(line: PageLine, page: PageText) -> bool:
+        """
+        Checks if a line is a page footer. Bare page numbers only count when
+        they sit in the header or footer band, so numeric answers and
+        fractions inside tasks are kept.
+        """
+        lower = line.text.strip().lower()
+        if any(phrase in lower for phrase in ExamSegmentationService.FOOTER_PHRASES):
+            return True
+        return bool(
+            ExamSegmentationService.PAGE_NUMBER_PATTERN.match(lower)
+        ) and ExamSegmentationService._in_page_band(line, page)
+
+    @staticmethod
+    def _in_page_band(line: PageLine, page: PageText) -> bool:
+        """Checks if a line lies in the header or footer band of its page."""
+        band = page.height * ExamSegmentationService.PAGE_BAND
+        return line.bbox[3] <= band or line.bbox[1] >= page.height - band
+
+    @staticmethod
+    def _content_bounds(page: PageText) -> Tuple[float, float]:
+        """
+        Returns the vertical range of a page between its header and footer
+        lines, or the whole page when it has none (e.g. a figure-only page).
+        """
+        service = ExamSegmentationService
+        top, bottom = 0.0, page.height
+        for line in page.lines:
+            if not service._in_page_band(line, page):
+                continue
+            if not service._is_footer(line, page):
+                continue
+            if line.bbox[1] >= page.height / 2:
+                bottom = min(bottom, line.bbox[1])
+            else:
+                top = max(top, line.bbox[3])
+        return top, bottom
+
+    @staticmethod
+    def _build_segment(current: dict) -> TaskSegment:
+        """
+        Builds a segment from the lines and per-page vertical ranges collected
+        for one task. Each range spans the full page width, so figures next
+        to or below the text are kept. A page is skipped when the next task
+        (or the draft area) starts on it before any line of this task.
+        """
+        regions = []
+        for page_number, (y0, y1) in current["regions"].items():
+            if (
+                page_number in current["cut_pages"]
+                and page_number not in current["line_pages"]
+            ):
+                continue
+            regions.append(
+                TaskRegion(
+                    page_number=page_number,
+                    bbox=(0.0, y0, current["page_widths"][page_number], y1),
+                )
+            )
+
+        content = "\n".join(
+            ExtractTaskContentFromLines._filter_and_clean_lines(
+                current["lines"],
+                list(ExtractTaskContentFromLines.DEFAULT_FILTER_PHRASES),
+            )
+        )
+        return TaskSegment(
+            task_number=current["task_number"],
+            regions=tuple(regions),
+            content=content,
+        )
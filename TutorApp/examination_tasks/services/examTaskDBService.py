@@ -15,7 +15,7 @@ class ExamTaskDBService:
         Returns a QuerySet of Exam instances that do not yet have all tasks added.
         The filtering is done at the database level for maximum efficiency.
         """
-        from .models import Exam
+        from ..models import Exam
 
         return Exam.objects.annotate(num_tasks=Count("tasks")).filter(
             tasks_count__gt=F("num_tasks")
@@ -162,6 +162,14 @@ class ExamTaskDBService:
          Private helper method to convert the string “5-7” or “5”
         to a list of integers [5, 6, 7] or [5].
         """
+        return ExamTaskDBService.parse_pages_string(pages_str)
+
+    @staticmethod
+    def parse_pages_string(pages_str: str) -> List[int]:
+        """
+        Converts a page range string such as “5-7” or “5” to a list of page
+        numbers ([5, 6, 7] or [5]). Invalid ranges give an empty list.
+        """
         if not pages_str:
             return []
         try:
@@ -11,25 +11,11 @@ class ExtractTaskPagesFromPdf:
         the pages specified as a list of integers and returns only those pages as bytes.
         """
 
-        task = pymupdf.open()
         try:
 
             with pymupdf.open(task_link) as exam:
+                return ExtractTaskPagesFromPdf.cut_pages(exam, pages)
 
-                for page in pages:
-                    page_index = page - 1
-                    if 0 <= page_index < exam.page_count:
-                        task.insert_pdf(exam, from_page=page_index, to_page=page_index)
-                    else:
-                        print(
-                            f"Warning: Page number {page_index} is not found and going to be missed."
-                        )
-
-                if task.page_count > 0:
-                    pdf_bytes = task.tobytes(garbage=4, deflate=True)
-                    return pdf_bytes
-                else:
-                    return None
         except FileNotFoundError:
             print(f"Error: File not found under that path: {task_link}")
             return None
@@ -38,5 +24,28 @@ class ExtractTaskPagesFromPdf:
             print(f"An unexpected error has occurred inside PyMuPDF: {e}")
             print(f"Typ błędu: {type(e)}")
             return None
+
+    @staticmethod
+    def cut_pages(exam: pymupdf.Document, pages: list[int]) -> typing.Optional[bytes]:
+        """
+        Extracts the given pages from an already opened exam document,
+        so many page ranges can be cut in a single pass over one file.
+        """
+        task = pymupdf.open()
+        try:
+            for page in pages:
+                page_index = page - 1
+                if 0 <= page_index < exam.page_count:
+                    task.insert_pdf(exam, from_page=page_index, to_page=page_index)
+                else:
+                    print(
+                        f"Warning: Page number {page_index} is not found and going to be missed."
+                    )
+
+            if task.page_count > 0:
+                pdf_bytes = task.tobytes(garbage=4, deflate=True)
+                return pdf_bytes
+            else:
+                return None
         finally:
             task.close()
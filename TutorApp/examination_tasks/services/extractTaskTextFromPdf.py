@@ -2,20 +2,14 @@
 PDF text extraction utility module.
 
 This module provides functionality for extracting text content from PDF files
-with support for selective page extraction and robust error handling.
+with support for selective page extraction and robust error handling. Text is
+read from the persisted text layer instead of re-parsing the PDF each time.
 """
 
 import os
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 
-try:
-    import pymupdf
-except ImportError:
-    raise ImportError(
-        "PyMuPDF is required for PDF text extraction. "
-        "Install it with: pip install PyMuPDF"
-    )
+from .textLayerService import PageText, TextLayerService
 
 
 class ExtractTaskTextFromPdf:
@@ -53,20 +47,19 @@ class ExtractTaskTextFromPdf:
             ValueError: If page numbers are invalid or PDF processing fails.
         """
         ExtractTaskTextFromPdf._validate_file_path(file_path)
+        pages = ExtractTaskTextFromPdf._load_text_layer(file_path)
 
-        with ExtractTaskTextFromPdf._open_pdf_document(file_path) as doc:
+        if page_numbers is None:
+            page_numbers = list(range(1, len(pages) + 1))
 
-            if page_numbers is None:
-                page_numbers = list(range(1, doc.page_count + 1))
+        if not isinstance(page_numbers, list):
+            raise TypeError("Page numbers must be provided as a list.")
 
-            if not isinstance(page_numbers, list):
-                raise TypeError("Page numbers must be provided as a list.")
+        if not page_numbers:
+            return []
 
-            if not page_numbers:
-                return []
-
-            ExtractTaskTextFromPdf._validate_page_numbers(page_numbers, doc.page_count)
-            return ExtractTaskTextFromPdf._extract_lines_from_pages(doc, page_numbers)
+        ExtractTaskTextFromPdf._validate_page_numbers(page_numbers, len(pages))
+        return ExtractTaskTextFromPdf._extract_lines_from_pages(pages, page_numbers)
 
     @staticmethod
     def extract_all_lines(file_path: str) -> List[str]:
@@ -114,28 +107,26 @@ class ExtractTaskTextFromPdf:
             Dict[int, List[str]]: A dictionary where keys are page numbers and values are lists of text lines.
         """
         ExtractTaskTextFromPdf._validate_file_path(file_path)
+        pages = ExtractTaskTextFromPdf._load_text_layer(file_path)
 
-        with ExtractTaskTextFromPdf._open_pdf_document(file_path) as doc:
-            if page_numbers is None:
-                page_numbers = list(range(1, doc.page_count + 1))
+        if page_numbers is None:
+            page_numbers = list(range(1, len(pages) + 1))
 
-            if not isinstance(page_numbers, list):
-                raise TypeError("Page numbers must be provided as a list.")
+        if not isinstance(page_numbers, list):
+            raise TypeError("Page numbers must be provided as a list.")
 
-            if not page_numbers:
-                return {}
+        if not page_numbers:
+            return {}
 
-            ExtractTaskTextFromPdf._validate_page_numbers(page_numbers, doc.page_count)
+        ExtractTaskTextFromPdf._validate_page_numbers(page_numbers, len(pages))
 
-            result = {}
-            for page_num in page_numbers:
-                result[page_num] = (
-                    ExtractTaskTextFromPdf._extract_lines_from_single_page(
-                        doc, page_num
-                    )
-                )
+        result = {}
+        for page_num in page_numbers:
+            result[page_num] = ExtractTaskTextFromPdf._extract_lines_from_single_page(
+                pages, page_num
+            )
 
-            return result
+        return result
 
     @staticmethod
     def count_pages(file_path: str) -> int:
@@ -149,9 +140,7 @@ class ExtractTaskTextFromPdf:
             int: The number of pages in the PDF.
         """
         ExtractTaskTextFromPdf._validate_file_path(file_path)
-
-        with ExtractTaskTextFromPdf._open_pdf_document(file_path) as doc:
-            return doc.page_count
+        return len(ExtractTaskTextFromPdf._load_text_layer(file_path))
 
     @staticmethod
     def _validate_file_path(file_path: str) -> None:
@@ -198,40 +187,36 @@ class ExtractTaskTextFromPdf:
                 )
 
     @staticmethod
-    @contextmanager
-    def _open_pdf_document(file_path: str):
+    def _load_text_layer(file_path: str) -> List[PageText]:
         """
-        Context manager for safely opening and closing PDF documents.
+        Loads the persisted text layer of the PDF (building it on first use).
 
         Args:
             file_path (str): Path to the PDF file.
 
-        Yields:
-            pymupdf.Document: The opened PDF document.
+        Returns:
+            List[PageText]: Text lines of every page.
 
         Raises:
             ValueError: If the PDF cannot be opened or is corrupted.
         """
-        doc = None
         try:
-            doc = pymupdf.open(file_path)
-            yield doc
-        except pymupdf as e:
+            return TextLayerService.load(file_path)
+        except (RuntimeError, ValueError) as e:
             raise ValueError(
                 f"Error processing the PDF file: {e}. "
                 f"The file may be corrupted or is not a valid PDF."
             )
-        finally:
-            if doc:
-                doc.close()
 
     @staticmethod
-    def _extract_lines_from_pages(doc, page_numbers: List[int]) -> List[str]:
+    def _extract_lines_from_pages(
+        pages: List[PageText], page_numbers: List[int]
+    ) -> List[str]:
         """
         Extracts text lines from specified pages of the document.
 
         Args:
-            doc: The opened PDF document object.
+            pages (List[PageText]): Text layer of the document.
             page_numbers (List[int]): List of page numbers (1-based) to extract from.
 
         Returns:
@@ -241,25 +226,24 @@ class ExtractTaskTextFromPdf:
 
         for page_num in page_numbers:
             lines = ExtractTaskTextFromPdf._extract_lines_from_single_page(
-                doc, page_num
+                pages, page_num
             )
             all_lines.extend(lines)
 
         return all_lines
 
     @staticmethod
-    def _extract_lines_from_single_page(doc, page_num: int) -> List[str]:
+    def _extract_lines_from_single_page(
+        pages: List[PageText], page_num: int
+    ) -> List[str]:
         """
         Extracts text lines from a single page.
 
         Args:
-            doc: The opened PDF document object.
+            pages (List[PageText]): Text layer of the document.
             page_num (int): Page number (1-based) to extract from.
 
         Returns:
             List[str]: List of text lines from the page.
         """
-        page_index = page_num - 1
-        page = doc.load_page(page_index)
-        text = page.get_text("text")
-        return text.splitlines()
+        return [line.text for line in pages[page_num - 1].lines]
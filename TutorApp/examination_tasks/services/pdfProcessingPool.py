@@ -0,0 +1,259 @@
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pymupdf
+from django.conf import settings
+
+from .cutPdfCacheService import CutPdfCacheService
+from .examSegmentationService import ExamSegmentationService
+from .extractTaskTextFromPdf import ExtractTaskTextFromPdf
+from .textLayerService import TextLayerService
+
+logger = logging.getLogger(__name__)
+
+
+class PdfJobTimeout(Exception):
+    """Raised inside a worker when a single document exceeds its time budget."""
+
+
+@dataclass(frozen=True)
+class PdfJobResult:
+    """Outcome of a single document job."""
+
+    args: Tuple[Any, ...]
+    ok: bool
+    value: Any = None
+    error: str = ""
+    duration: float = 0.0
+
+
+def _raise_timeout(signum, frame):
+    raise PdfJobTimeout()
+
+
+def _run_job(
+    func: Callable[..., Any], args: Tuple[Any, ...], timeout: int
+) -> PdfJobResult:
+    """
+    Runs a job with a per-document time limit and never lets it raise,
+    so a single broken file cannot take the whole batch down.
+    """
+    use_alarm = timeout and threading.current_thread() is threading.main_thread()
+    started = time.monotonic()
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(timeout)
+    try:
+        value = func(*args)
+        return PdfJobResult(
+            args=args, ok=True, value=value, duration=time.monotonic() - started
+        )
+    except PdfJobTimeout:
+        return PdfJobResult(
+            args=args,
+            ok=False,
+            error=f"Timed out after {timeout}s",
+            duration=time.monotonic() - started,
+        )
+    except Exception as e:
+        return PdfJobResult(
+            args=args,
+            ok=False,
+            error=f"{type(e).__name__}: {e}",
+            duration=time.monotonic() - started,
+        )
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+def segment_job(source_path: str) -> list:
+    """Detects all tasks of one exam PDF."""
+    return ExamSegmentationService.segment(source_path)
+
+
+def segment_and_render_job(source_path: str) -> tuple:
+    """
+    Reads the text layer of one exam PDF, detects all its tasks and renders
+    each of them to PDF bytes. The text layer is returned instead of being
+    stored next to the source, so it can be saved for the final copy.
+    """
+    with pymupdf.open(source_path) as doc:
+        pages = TextLayerService.read_pages(doc)
+        segments = ExamSegmentationService.segment_pages(pages)
+        return pages, [
+            (segment, ExamSegmentationService.render_segment(doc, segment))
+            for segment in segments
+        ]
+
+
+def read_pages_job(source_path: str) -> list:
+    """Reads the text layer of one PDF without storing it."""
+    with pymupdf.open(source_path) as doc:
+        return TextLayerService.read_pages(doc)
+
+
+def text_job(source_path: str) -> Dict[int, List[str]]:
+    """Dumps the text lines of every page of one PDF."""
+    return ExtractTaskTextFromPdf.extract_lines_by_page(source_path)
+
+
+def cut_job(
+    source_path: str,
+    kind: str,
+    exam_pk: int,
+    entries: List[Tuple[int, List[int]]],
+) -> int:
+    """Cuts all missing task/answer PDFs of one source file into the cache."""
+    return CutPdfCacheService().warm(source_path, kind, exam_pk, entries)
+
+
+class PdfProcessingPool:
+    """
+    Runs CPU-bound PyMuPDF jobs for many documents across worker processes.
+
+    Every job works on a single document, has its own time limit and reports
+    its outcome as a PdfJobResult instead of raising. At most ``processes``
+    jobs run at once and only a bounded number of jobs is queued ahead, so
+    very large batches do not pile up in memory. With ``processes=1`` jobs
+    run inline, which is handy in tests and when debugging.
+
+    Workers are plain (non-daemonic) processes, so the pool can be used from
+    a Celery prefork worker as well as from management commands. Jobs must
+    not touch the database: resolve paths and page ranges up front.
+
+    Example:
+        >>> with PdfProcessingPool(processes=4) as pool:
+        ...     for result in pool.segment(["a.pdf", "b.pdf"]):
+        ...         print(result.args[0], result.ok, result.duration)
+    """
+
+    def __init__(
+        self, processes: Optional[int] = None, timeout: Optional[int] = None
+    ) -> None:
+        self.processes = max(
+            1, processes or settings.PDF_POOL_PROCESSES or os.cpu_count() or 1
+        )
+        self.timeout = timeout if timeout is not None else settings.PDF_POOL_TIMEOUT
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._hung = False
+
+    def __enter__(self) -> "PdfProcessingPool":
+        if self.processes > 1:
+            # Forked workers inherit the configured Django settings and code.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._executor is None:
+            return
+        if self._hung:
+            # A stuck worker would block shutdown forever; there is no public
+            # API for this, so terminate the worker processes directly.
+            for process in list(self._executor._processes.values()):
+                process.terminate()
+        self._executor.shutdown(wait=not self._hung, cancel_futures=True)
+        self._executor = None
+
+    def map(
+        self, func: Callable[..., Any], jobs: Iterable[Tuple[Any, ...]]
+    ) -> Iterator[PdfJobResult]:
+        """
+        Runs ``func(*args)`` for every args tuple, yielding results as they finish.
+
+        Args:
+            func: Module-level job function (it has to be picklable).
+            jobs: Argument tuples, one per document.
+
+        Yields:
+            PdfJobResult for every job, in completion order.
+        """
+        if self._executor is None:
+            for args in jobs:
+                yield _run_job(func, args, self.timeout)
+            return
+
+        pending: Dict[Future, Tuple[Any, ...]] = {}
+        jobs = iter(jobs)
+        max_pending = self.processes * 2
+
+        while True:
+            for args in jobs:
+                future = self._executor.submit(_run_job, func, args, self.timeout)
+                pending[future] = args
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = wait(
+                pending, timeout=self._backstop_timeout(), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                yield from self._abandon(pending)
+                return
+
+            for future in done:
+                args = pending.pop(future)
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield PdfJobResult(args=args, ok=False, error=str(e))
+
+    def segment(self, source_paths: Iterable[str]) -> Iterator[PdfJobResult]:
+        """Detects tasks of many exam PDFs in parallel."""
+        return self.map(segment_job, ((path,) for path in source_paths))
+
+    def segment_and_render(self, source_paths: Iterable[str]) -> Iterator[PdfJobResult]:
+        """Detects and renders tasks of many exam PDFs in parallel."""
+        return self.map(segment_and_render_job, ((path,) for path in source_paths))
+
+    def read_pages(self, source_paths: Iterable[str]) -> Iterator[PdfJobResult]:
+        """Reads text layers of many PDFs in parallel, without storing them."""
+        return self.map(read_pages_job, ((path,) for path in source_paths))
+
+    def dump_text(self, source_paths: Iterable[str]) -> Iterator[PdfJobResult]:
+        """Extracts page text lines of many PDFs in parallel."""
+        return self.map(text_job, ((path,) for path in source_paths))
+
+    def cut(
+        self,
+        jobs: Iterable[Tuple[str, str, int, List[Tuple[int, List[int]]]]],
+    ) -> Iterator[PdfJobResult]:
+        """
+        Warms the cut PDF cache for many source files in parallel.
+
+        Args:
+            jobs: ``(source_path, kind, exam_pk, [(task_pk, pages), ...])`` tuples.
+        """
+        return self.map(cut_job, jobs)
+
+    def _backstop_timeout(self) -> Optional[int]:
+        """
+        Parent-side limit used only if a worker stops responding entirely
+        (the in-worker alarm cannot interrupt it).
+        """
+        if not self.timeout:
+            return None
+        return self.timeout * 2 + 30
+
+    def _abandon(
+        self, pending: Dict[Future, Tuple[Any, ...]]
+    ) -> Iterator[PdfJobResult]:
+        logger.error("%s PDF job(s) stopped responding, aborting batch", len(pending))
+        self._hung = True
+        for future, args in pending.items():
+            future.cancel()
+            yield PdfJobResult(args=args, ok=False, error="Worker stopped responding")
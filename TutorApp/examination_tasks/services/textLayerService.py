@@ -0,0 +1,194 @@
+import gzip
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+
+import pymupdf
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class PageLine:
+    """A single text line of a page together with its bounding box."""
+
+    text: str
+    bbox: BBox
+
+
+@dataclass(frozen=True)
+class PageText:
+    """Text lines of one page (1-based number) and the page size."""
+
+    number: int
+    width: float
+    height: float
+    lines: Tuple[PageLine, ...]
+
+
+class TextLayerService:
+    """
+    Persisted per-page text layer of a PDF.
+
+    The lines and line bounding boxes of every page are parsed once and
+    stored in a gzip-compressed JSON sidecar next to the PDF
+    (``<file>.pdf.textlayer.json.gz``). The sidecar records the size and
+    modification time of the PDF it was built from and is rebuilt when they
+    no longer match. Loaded layers are additionally memoized per process.
+    """
+
+    VERSION = 1
+    SUFFIX = ".textlayer.json.gz"
+
+    @staticmethod
+    def load(pdf_path: str) -> List[PageText]:
+        """
+        Returns the text layer of a PDF, building the sidecar if it is missing
+        or stale.
+
+        Args:
+            pdf_path: Path to the PDF file.
+
+        Returns:
+            Text of every page in document order.
+
+        Raises:
+            FileNotFoundError: If the PDF does not exist.
+        """
+        stat = os.stat(pdf_path)
+        return list(
+            TextLayerService._load_cached(pdf_path, stat.st_mtime_ns, stat.st_size)
+        )
+
+    @staticmethod
+    def build(pdf_path: str) -> List[PageText]:
+        """
+        Parses the PDF once and (re)writes its sidecar.
+
+        Args:
+            pdf_path: Path to the PDF file.
+
+        Returns:
+            Text of every page in document order.
+        """
+        with pymupdf.open(pdf_path) as doc:
+            pages = TextLayerService.read_pages(doc)
+        TextLayerService.store(pdf_path, pages)
+        return pages
+
+    @staticmethod
+    def read_pages(doc: pymupdf.Document) -> List[PageText]:
+        """Reads the text lines with bounding boxes of every page once."""
+        pages = []
+        for page in doc:
+            text_dict = page.get_text("dict")
+            lines = []
+            for block in text_dict.get("blocks", []):
+                for line in block.get("lines", []):
+                    text = "".join(span["text"] for span in line.get("spans", []))
+                    lines.append(PageLine(text=text, bbox=tuple(line["bbox"])))
+            pages.append(
+                PageText(
+                    number=page.number + 1,
+                    width=page.rect.width,
+                    height=page.rect.height,
+                    lines=tuple(lines),
+                )
+            )
+        return pages
+
+    @staticmethod
+    def sidecar_path(pdf_path: str) -> str:
+        return pdf_path + TextLayerService.SUFFIX
+
+    @staticmethod
+    def delete(pdf_path: str) -> None:
+        """Removes the sidecar of a PDF, if there is one."""
+        try:
+            os.remove(TextLayerService.sidecar_path(pdf_path))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_cached(pdf_path: str, mtime_ns: int, size: int) -> Tuple[PageText, ...]:
+        pages = TextLayerService._read(pdf_path, mtime_ns, size)
+        if pages is None:
+            pages = TextLayerService.build(pdf_path)
+        return tuple(pages)
+
+    @staticmethod
+    def _read(pdf_path: str, mtime_ns: int, size: int):
+        """Reads the sidecar, returning None when it is missing or stale."""
+        try:
+            with gzip.open(
+                TextLayerService.sidecar_path(pdf_path), "rt", encoding="utf-8"
+            ) as sidecar:
+                data = json.load(sidecar)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Unreadable text layer for %s, rebuilding", pdf_path)
+            return None
+
+        if (
+            data.get("version") != TextLayerService.VERSION
+            or data.get("source_mtime_ns") != mtime_ns
+            or data.get("source_size") != size
+        ):
+            return None
+
+        return [
+            PageText(
+                number=page["number"],
+                width=page["width"],
+                height=page["height"],
+                lines=tuple(
+                    PageLine(text=text, bbox=(x0, y0, x1, y1))
+                    for text, x0, y0, x1, y1 in page["lines"]
+                ),
+            )
+            for page in data["pages"]
+        ]
+
+    @staticmethod
+    def store(pdf_path: str, pages: List[PageText]) -> None:
+        """
+        Writes the sidecar of a PDF from already read pages, e.g. when the
+        pages were parsed from another copy of the same file.
+        """
+        stat = os.stat(pdf_path)
+        data = {
+            "version": TextLayerService.VERSION,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "pages": [
+                {
+                    "number": page.number,
+                    "width": page.width,
+                    "height": page.height,
+                    "lines": [
+                        [line.text, *(round(value, 2) for value in line.bbox)]
+                        for line in page.lines
+                    ],
+                }
+                for page in pages
+            ],
+        }
+        path = TextLayerService.sidecar_path(pdf_path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                with gzip.GzipFile(fileobj=tmp_file, mode="wb") as sidecar:
+                    sidecar.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            logger.warning("Could not write text layer for %s", pdf_path)
@@ -0,0 +1,109 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Exam, ExamTask
+from .services.cutPdfCacheService import CutPdfCacheService
+from .services.textLayerService import TextLayerService
+
+EXAM_PDF_FIELDS = ("tasks_link", "solutions_link")
+TASK_PAGE_FIELDS = ("task_pages", "answer_pages")
+
+
+@receiver(pre_save, sender=Exam)
+def invalidate_cut_pdfs_on_exam_change(sender, instance: Exam, **kwargs) -> None:
+    """Drops cached cut PDFs of an exam whose source PDF files are replaced."""
+    if not instance.pk:
+        return
+
+    previous = Exam.objects.filter(pk=instance.pk).values(*EXAM_PDF_FIELDS).first()
+    if previous is None:
+        return
+
+    changed = [
+        field
+        for field in EXAM_PDF_FIELDS
+        if (previous[field] or None) != (getattr(instance, field).name or None)
+    ]
+    if changed:
+        instance._pdf_files_changed = True
+        CutPdfCacheService().invalidate_exam(instance.pk)
+        for field in changed:
+            if previous[field]:
+                storage = getattr(instance, field).storage
+                TextLayerService.delete(storage.path(previous[field]))
+
+
+@receiver(pre_save, sender=ExamTask)
+def invalidate_cut_pdfs_on_task_change(sender, instance: ExamTask, **kwargs) -> None:
+    """Drops cached cut PDFs of a task whose page ranges change."""
+    if not instance.pk:
+        return
+
+    previous = (
+        ExamTask.objects.filter(pk=instance.pk)
+        .values("exam_id", *TASK_PAGE_FIELDS)
+        .first()
+    )
+    if previous is None:
+        return
+
+    if previous["exam_id"] != instance.exam_id or any(
+        previous[field] != getattr(instance, field) for field in TASK_PAGE_FIELDS
+    ):
+        instance._pages_changed = True
+        CutPdfCacheService().invalidate_task(previous["exam_id"], instance.pk)
+
+
+def schedule_precut(exam_id: int) -> None:
+    """Queues background pre-cutting of an exam once the transaction commits."""
+    from .tasks import precut_exam_pdfs
+
+    transaction.on_commit(lambda: precut_exam_pdfs.delay(exam_id))
+
+
+@receiver(post_save, sender=Exam)
+def precut_pdfs_on_exam_save(sender, instance: Exam, **kwargs) -> None:
+    """Pre-cuts task PDFs after an exam is uploaded or its files are replaced."""
+    if instance.tasks.exists():
+        schedule_precut(instance.pk)
+
+
+@receiver(post_save, sender=Exam)
+def build_text_layers_on_exam_save(
+    sender, instance: Exam, created: bool, **kwargs
+) -> None:
+    """
+    Builds the text layer of newly uploaded exam PDF files, unless the caller
+    already stored them (flagged with ``_text_layers_stored``).
+    """
+    if getattr(instance, "_text_layers_stored", False):
+        return
+    if created or getattr(instance, "_pdf_files_changed", False):
+        from .tasks import build_exam_text_layers
+
+        exam_id = instance.pk
+        transaction.on_commit(lambda: build_exam_text_layers.delay(exam_id))
+
+
+@receiver(post_save, sender=ExamTask)
+def precut_pdfs_on_task_save(
+    sender, instance: ExamTask, created: bool, **kwargs
+) -> None:
+    """Pre-cuts PDFs of a newly added task or a task with changed pages."""
+    if created or getattr(instance, "_pages_changed", False):
+        schedule_precut(instance.exam_id)
+
+
+@receiver(post_delete, sender=Exam)
+def invalidate_cut_pdfs_on_exam_delete(sender, instance: Exam, **kwargs) -> None:
+    CutPdfCacheService().invalidate_exam(instance.pk)
+    for field in EXAM_PDF_FIELDS:
+        field_file = getattr(instance, field)
+        if field_file:
+            TextLayerService.delete(field_file.path)
+
+
+@receiver(post_delete, sender=ExamTask)
+def invalidate_cut_pdfs_on_task_delete(sender, instance: ExamTask, **kwargs) -> None:
+    CutPdfCacheService().invalidate_task(instance.exam_id, instance.pk)
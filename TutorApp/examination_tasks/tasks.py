@@ -0,0 +1,130 @@
+import logging
+from typing import Dict, Optional
+
+from celery import shared_task
+
+from .models import Exam
+from .services.cutPdfCacheService import CutPdfCacheService
+from .services.pdfProcessingPool import PdfProcessingPool
+from .services.textLayerService import TextLayerService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(OSError,),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": 3},
+    acks_late=True,
+)
+def precut_exam_pdfs(self, exam_id: int) -> Dict[str, int]:
+    """
+    Cuts and caches task/answer PDFs of every task of an exam, so the first
+    student request for each task is already a cache hit.
+
+    Progress is reported as a ``PROGRESS`` state with ``current``/``total``
+    meta. Transient I/O errors (e.g. the upload not yet visible on the shared
+    volume) are retried; broken PDFs are logged and skipped.
+
+    Args:
+        exam_id: Primary key of the exam to pre-cut.
+
+    Returns:
+        Dict with the number of newly cut entries and the total entry count.
+    """
+    exam = Exam.objects.filter(pk=exam_id).first()
+    if exam is None:
+        logger.warning("Exam %s no longer exists, skipping pre-cut", exam_id)
+        return {"cut": 0, "total": 0}
+
+    def report_progress(current: int, total: int) -> None:
+        if not self.request.is_eager:
+            self.update_state(
+                state="PROGRESS", meta={"current": current, "total": total}
+            )
+
+    try:
+        cut, total = CutPdfCacheService().warm_exam(
+            exam, progress_callback=report_progress
+        )
+    except (RuntimeError, ValueError):
+        # PyMuPDF reports broken/encrypted files as RuntimeError subclasses.
+        logger.exception("Could not pre-cut PDFs of exam %s", exam_id)
+        return {"cut": 0, "total": 0}
+
+    logger.info("Pre-cut %s of %s PDF(s) for exam %s", cut, total, exam_id)
+    return {"cut": cut, "total": total}
+
+
+@shared_task(
+    autoretry_for=(OSError,),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": 3},
+    acks_late=True,
+)
+def build_exam_text_layers(exam_id: int) -> int:
+    """
+    Parses the exam (and solutions) PDF once and stores its text layer, so
+    later text extraction and task segmentation never re-parse the PDF.
+    Files which already have an up-to-date text layer are left alone.
+
+    Args:
+        exam_id: Primary key of the exam.
+
+    Returns:
+        Number of built text layers.
+    """
+    exam = Exam.objects.filter(pk=exam_id).first()
+    if exam is None:
+        return 0
+
+    built = 0
+    for field_file in (exam.tasks_link, exam.solutions_link):
+        if not field_file:
+            continue
+        try:
+            TextLayerService.load(field_file.path)
+            built += 1
+        except (RuntimeError, ValueError):
+            logger.exception("Could not build text layer of %s", field_file.name)
+    return built
+
+
+@shared_task(bind=True, acks_late=True)
+def precut_all_exams(self, processes: Optional[int] = None) -> Dict[str, int]:
+    """
+    Re-cuts the whole archive, fanning the work out over a process pool
+    with one job per source PDF.
+
+    Args:
+        processes: Number of worker processes (defaults to PDF_POOL_PROCESSES).
+
+    Returns:
+        Dict with the number of newly cut entries and failed source files.
+    """
+    service = CutPdfCacheService()
+    jobs = [
+        (source_path, kind, exam.pk, entries)
+        for exam in Exam.objects.all().iterator()
+        for source_path, kind, entries in service.plan_exam(exam)
+    ]
+
+    cut = 0
+    failed = 0
+    with PdfProcessingPool(processes=processes) as pool:
+        for done, result in enumerate(pool.cut(jobs), start=1):
+            if result.ok:
+                cut += result.value
+            else:
+                failed += 1
+                logger.error("Pre-cut of %s failed: %s", result.args[0], result.error)
+            if not self.request.is_eager:
+                self.update_state(
+                    state="PROGRESS", meta={"current": done, "total": len(jobs)}
+                )
+
+    # Workers only estimate the cache size of their own writes.
+    service.evict()
+    logger.info("Archive pre-cut finished: %s cut, %s failed", cut, failed)
+    return {"cut": cut, "failed": failed}
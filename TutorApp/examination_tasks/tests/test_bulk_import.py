@@ -0,0 +1,133 @@
+import pymupdf
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+from examination_tasks.models import Exam, ExamTask
+from examination_tasks.tests.utils import build_exam_pdf, use_temp_media
+from users.factories import TeacherFactory
+
+
+class BulkAddExamTasksWizardTests(TestCase):
+    PREFIX = "bulk_add_exam_tasks_wizard"
+
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+
+        self.teacher = TeacherFactory.create()
+        self.client.force_login(self.teacher)
+        self.url = reverse("examination_tasks:bulk_add_exam_tasks")
+        self.exam = Exam.objects.create(
+            year=2024,
+            month=5,
+            level_type=1,
+            tasks_count=3,
+            tasks_link=SimpleUploadedFile(
+                "exam.pdf",
+                build_exam_pdf(
+                    [
+                        ["Zadanie 1.", "Oblicz 2 + 2."],
+                        ["Zadanie 2.", "Rozwiaz rownanie."],
+                        ["dalsza tresc", "Zadanie 3.", "Narysuj wykres."],
+                    ]
+                ),
+            ),
+            solutions_link=SimpleUploadedFile(
+                "answers.pdf",
+                build_exam_pdf([["Zadanie 1.", "4"], ["Zadanie 2.", "x = 2"]]),
+            ),
+        )
+
+    def _post_exam_step(self):
+        return self.client.post(
+            self.url,
+            {f"{self.PREFIX}-current_step": "exam", "exam-exam": self.exam.pk},
+        )
+
+    def _tasks_step_data(self, rows):
+        data = {
+            f"{self.PREFIX}-current_step": "tasks",
+            "tasks-TOTAL_FORMS": len(rows),
+            "tasks-INITIAL_FORMS": len(rows),
+            "tasks-MIN_NUM_FORMS": 0,
+            "tasks-MAX_NUM_FORMS": 1000,
+        }
+        for index, row in enumerate(rows):
+            for field, value in row.items():
+                data[f"tasks-{index}-{field}"] = value
+        return data
+
+    def test_preview_lists_all_detected_tasks(self):
+        """Test case that checks if every task of the exam is pre-filled at once"""
+        response = self._post_exam_step()
+
+        self.assertEqual(response.status_code, 200)
+        initial = [form.initial for form in response.context["wizard"]["form"]]
+        self.assertEqual(
+            [
+                (row["task_id"], row["task_pages"], row["answer_pages"])
+                for row in initial
+            ],
+            [(1, "1", "1"), (2, "2-3", "2"), (3, "3", "")],
+        )
+        self.assertEqual(initial[1]["task_content"], "Rozwiaz rownanie.\ndalsza tresc")
+
+    def test_saves_all_included_tasks(self):
+        """Test case that checks if included rows become ExamTasks with PDFs"""
+        self._post_exam_step()
+        response = self.client.post(
+            self.url,
+            self._tasks_step_data(
+                [
+                    {
+                        "include": "on",
+                        "task_id": 1,
+                        "task_pages": "1",
+                        "answer_pages": "1",
+                    },
+                    {
+                        "include": "on",
+                        "task_id": 2,
+                        "task_pages": "2-3",
+                        "task_content": "Rozwiaz rownanie x + 1 = 3.",
+                    },
+                    {"task_id": 3, "task_pages": "3"},
+                ]
+            ),
+        )
+
+        self.assertRedirects(
+            response,
+            reverse(
+                "examination_tasks:exam_task_list", kwargs={"exam_pk": self.exam.pk}
+            ),
+            fetch_redirect_response=False,
+        )
+        tasks = list(ExamTask.objects.filter(exam=self.exam).order_by("task_id"))
+        self.assertEqual([task.task_id for task in tasks], [1, 2])
+        self.assertEqual(tasks[0].answer_pages, "1")
+        self.assertEqual(tasks[1].task_content, "Rozwiaz rownanie x + 1 = 3.")
+        with pymupdf.open(tasks[1].task_screen.path) as task_pdf:
+            self.assertEqual(task_pdf.page_count, 2)
+
+    def test_duplicated_task_numbers_are_rejected(self):
+        """Test case that checks if the same task number cannot be used twice"""
+        self._post_exam_step()
+        response = self.client.post(
+            self.url,
+            self._tasks_step_data(
+                [
+                    {"include": "on", "task_id": 1, "task_pages": "1"},
+                    {"include": "on", "task_id": 1, "task_pages": "2"},
+                ]
+            ),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["wizard"]["form"].non_form_errors())
+        self.assertFalse(ExamTask.objects.exists())
+
+    def test_requires_teacher(self):
+        """Test case that checks if students cannot open the bulk import"""
+        self.client.force_login(TeacherFactory.create(role_type=1))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
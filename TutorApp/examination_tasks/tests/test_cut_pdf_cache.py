@@ -0,0 +1,329 @@
+import os
+from unittest.mock import patch
+
+import pymupdf
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from examination_tasks.models import Exam, ExamTask
+from examination_tasks.services import CutPdfCacheService
+from examination_tasks.tests.utils import (
+    build_tasks_pdf,
+    make_temp_dir,
+    use_temp_media,
+)
+from users.factories import UserFactory
+
+
+class CutPdfCacheServiceTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = make_temp_dir(self)
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.source_path = os.path.join(self.tmp_dir, "exam.pdf")
+        with open(self.source_path, "wb") as source:
+            source.write(build_tasks_pdf(4))
+        self.service = CutPdfCacheService(
+            cache_dir=self.cache_dir, max_bytes=10 * 1024 * 1024
+        )
+
+    def test_miss_cuts_and_stores_pdf(self):
+        """Test case that checks if a cache miss produces a cut PDF on disk"""
+        path = self.service.get_or_create(self.source_path, [2, 3], "task", 1, 7)
+
+        self.assertTrue(os.path.exists(path))
+        with pymupdf.open(path) as doc:
+            self.assertEqual(doc.page_count, 2)
+
+    def test_hit_does_not_cut_again(self):
+        """Test case that checks if a cache hit skips PyMuPDF entirely"""
+        first = self.service.get_or_create(self.source_path, [1], "task", 1, 7)
+
+        with patch(
+            "examination_tasks.services.cutPdfCacheService."
+            "ExtractTaskPagesFromPdf.get_single_task_pdf"
+        ) as cut:
+            second = self.service.get_or_create(self.source_path, [1], "task", 1, 7)
+
+        cut.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_changed_pages_replace_stale_entry(self):
+        """Test case that checks if a new page range drops the old entry"""
+        old = self.service.get_or_create(self.source_path, [1], "task", 1, 7)
+        new = self.service.get_or_create(self.source_path, [1, 2], "task", 1, 7)
+
+        self.assertNotEqual(old, new)
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+
+    def test_kinds_are_cached_separately(self):
+        """Test case that checks if task and answer entries do not collide"""
+        task = self.service.get_or_create(self.source_path, [1], "task", 1, 7)
+        answer = self.service.get_or_create(self.source_path, [1], "answer", 1, 7)
+
+        self.assertNotEqual(task, answer)
+        self.assertTrue(os.path.exists(task))
+        self.assertTrue(os.path.exists(answer))
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test case that checks if LRU entries are evicted over the size limit"""
+        oldest = self.service.get_or_create(self.source_path, [1], "task", 1, 1)
+        newest = self.service.get_or_create(self.source_path, [2], "task", 1, 2)
+        os.utime(oldest, (1, 1))
+
+        self.service.max_bytes = os.path.getsize(newest)
+        removed = self.service.evict()
+
+        self.assertEqual(removed, 1)
+        self.assertFalse(os.path.exists(oldest))
+        self.assertTrue(os.path.exists(newest))
+
+    def test_store_walks_cache_only_when_over_budget(self):
+        """Test case that checks if a miss does not scan the cache under budget"""
+        self.service.get_or_create(self.source_path, [1], "task", 1, 1)
+
+        with patch(
+            "examination_tasks.services.cutPdfCacheService.os.walk",
+            side_effect=os.walk,
+        ) as walk:
+            second = self.service.get_or_create(self.source_path, [2], "task", 1, 2)
+            walk.assert_not_called()
+
+            self.service.max_bytes = os.path.getsize(second)
+            self.service.get_or_create(self.source_path, [3], "task", 1, 3)
+            walk.assert_called_once()
+
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir, "1"))), 1)
+
+    def test_store_rescans_cache_periodically(self):
+        """Test case that checks if other processes' writes are picked up"""
+        self.service.get_or_create(self.source_path, [1], "task", 1, 1)
+        foreign = os.path.join(self.cache_dir, "2", "1-task-foreign.pdf")
+        os.makedirs(os.path.dirname(foreign))
+        with open(foreign, "wb") as entry:
+            entry.write(b"%PDF" * 16 * 1024)
+        os.utime(foreign, (1, 1))
+        self.service.max_bytes = os.path.getsize(foreign) + 1024 * 1024
+
+        with patch.object(CutPdfCacheService, "RESCAN_EVERY", 2):
+            self.service.get_or_create(self.source_path, [2], "task", 1, 2)
+            self.assertTrue(os.path.exists(foreign))
+            self.service.max_bytes = os.path.getsize(foreign)
+            self.service.get_or_create(self.source_path, [3], "task", 1, 3)
+
+        self.assertFalse(os.path.exists(foreign))
+
+    def test_invalidate_task_lowers_estimate(self):
+        """Test case that checks if removed entries are not counted any more"""
+        path = self.service.get_or_create(self.source_path, [1], "task", 1, 1)
+        size = os.path.getsize(path)
+        estimate = CutPdfCacheService._estimated_bytes[self.cache_dir]
+
+        self.service.invalidate_task(1, 1)
+
+        self.assertEqual(
+            CutPdfCacheService._estimated_bytes[self.cache_dir], estimate - size
+        )
+
+    def test_invalidate_exam_removes_all_entries(self):
+        """Test case that checks if exam invalidation clears its entries"""
+        path = self.service.get_or_create(self.source_path, [1], "task", 3, 7)
+
+        self.service.invalidate_exam(3)
+
+        self.assertFalse(os.path.exists(path))
+
+
+class CutPdfCacheInvalidationTests(TestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+        self.cache_dir = os.path.join(self.media_root, "cut_pdf_cache")
+
+        self.exam = Exam.objects.create(
+            year=2024,
+            month=5,
+            level_type=1,
+            tasks_link=SimpleUploadedFile("exam.pdf", build_tasks_pdf(3)),
+        )
+        self.task = ExamTask.objects.create(
+            exam=self.exam,
+            task_id=1,
+            task_pages="1",
+            task_screen="exam_tasks/zadanie_1.pdf",
+        )
+
+    def _cache_task(self) -> str:
+        return CutPdfCacheService().get_or_create(
+            self.exam.tasks_link.path, [1], "task", self.exam.pk, self.task.pk
+        )
+
+    def test_changing_task_pages_invalidates_entry(self):
+        """Test case that checks if editing task pages drops cached PDFs"""
+        path = self._cache_task()
+
+        self.task.task_pages = "2"
+        self.task.save()
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_saving_unchanged_task_keeps_entry(self):
+        """Test case that checks if unrelated saves keep cached PDFs"""
+        path = self._cache_task()
+
+        self.task.task_content = "Updated content"
+        self.task.save()
+
+        self.assertTrue(os.path.exists(path))
+
+    def test_replacing_exam_pdf_invalidates_entries(self):
+        """Test case that checks if uploading a new exam PDF drops cached PDFs"""
+        path = self._cache_task()
+
+        self.exam.tasks_link = SimpleUploadedFile("new_exam.pdf", build_tasks_pdf(3))
+        self.exam.save()
+
+        self.assertFalse(os.path.exists(path))
+
+
+class TaskCutPdfStreamViewDeliveryTests(TestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+        self.cache_dir = os.path.join(self.media_root, "cut_pdf_cache")
+
+        self.user = UserFactory.create()
+        self.exam = Exam.objects.create(
+            year=2024,
+            month=5,
+            level_type=1,
+            tasks_link=SimpleUploadedFile("exam.pdf", build_tasks_pdf(3)),
+        )
+        self.task = ExamTask.objects.create(
+            exam=self.exam,
+            task_id=2,
+            task_pages="2-3",
+            task_screen="exam_tasks/zadanie_2.pdf",
+        )
+        self.url = reverse(
+            "examination_tasks:task-pdf-stream-kind",
+            kwargs={"pk": self.task.pk, "kind": "task"},
+        )
+
+    def test_requires_login(self):
+        """Test case that checks if anonymous users cannot download PDFs"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(PDF_DELIVERY_MODE="file")
+    def test_file_mode_streams_pdf(self):
+        """Test case that checks if file mode streams the cut PDF"""
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertNotIn("X-Accel-Redirect", response)
+        with pymupdf.open(stream=b"".join(response.streaming_content)) as doc:
+            self.assertEqual(doc.page_count, 2)
+
+    @override_settings(PDF_DELIVERY_MODE="x-accel")
+    def test_x_accel_mode_delegates_to_nginx(self):
+        """Test case that checks if x-accel mode only returns a redirect header"""
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"")
+        accel_path = response["X-Accel-Redirect"]
+        self.assertTrue(accel_path.startswith("/protected/cut_pdf_cache/"))
+        relative_path = accel_path.removeprefix("/protected/cut_pdf_cache/")
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, relative_path)))
+
+
+class PrecutExamPdfsTests(TestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+        self.cache_dir = os.path.join(self.media_root, "cut_pdf_cache")
+
+        self.exam = Exam.objects.create(
+            year=2024,
+            month=5,
+            level_type=1,
+            tasks_link=SimpleUploadedFile("exam.pdf", build_tasks_pdf(4)),
+            solutions_link=SimpleUploadedFile("answers.pdf", build_tasks_pdf(2)),
+        )
+
+    def _create_task(self, task_id: int, task_pages: str, answer_pages: str):
+        return ExamTask.objects.create(
+            exam=self.exam,
+            task_id=task_id,
+            task_pages=task_pages,
+            answer_pages=answer_pages,
+            task_screen=f"exam_tasks/zadanie_{task_id}.pdf",
+        )
+
+    def test_adding_task_precuts_pdfs_after_commit(self):
+        """Test case that checks if a new task is cut in the background on commit"""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            task = self._create_task(1, "1-2", "1")
+
+        self.assertEqual(len(callbacks), 1)
+        service = CutPdfCacheService()
+        self.assertIsNotNone(
+            service.get(
+                self.exam.tasks_link.path, [1, 2], "task", self.exam.pk, task.pk
+            )
+        )
+        self.assertIsNotNone(
+            service.get(
+                self.exam.solutions_link.path, [1], "answer", self.exam.pk, task.pk
+            )
+        )
+
+    def test_warm_exam_opens_each_source_once(self):
+        """Test case that checks if every source PDF is opened a single time"""
+        self._create_task(1, "1", "1")
+        self._create_task(2, "2-3", "2")
+        self._create_task(3, "4", "")
+        progress = []
+
+        with patch(
+            "examination_tasks.services.cutPdfCacheService.pymupdf.open",
+            wraps=pymupdf.open,
+        ) as opened:
+            cut, total = CutPdfCacheService().warm_exam(
+                self.exam, progress_callback=lambda done, of: progress.append(done)
+            )
+
+        opened_files = [call.args[0] for call in opened.call_args_list if call.args]
+        self.assertEqual(
+            sorted(opened_files),
+            sorted([self.exam.tasks_link.path, self.exam.solutions_link.path]),
+        )
+        self.assertEqual((cut, total), (5, 5))
+        self.assertEqual(progress[-1], 5)
+
+    def test_warm_exam_skips_cached_entries(self):
+        """Test case that checks if already cached tasks are not cut again"""
+        self._create_task(1, "1", "1")
+        service = CutPdfCacheService()
+        service.warm_exam(self.exam)
+
+        with patch(
+            "examination_tasks.services.cutPdfCacheService.pymupdf.open"
+        ) as opened:
+            cut, total = service.warm_exam(self.exam)
+
+        opened.assert_not_called()
+        self.assertEqual((cut, total), (0, 2))
+
+    def test_broken_pdf_is_skipped(self):
+        """Test case that checks if a corrupted exam PDF does not crash the task"""
+        from examination_tasks.tasks import precut_exam_pdfs
+
+        self._create_task(1, "1", "")
+        with open(self.exam.tasks_link.path, "wb") as broken:
+            broken.write(b"not a pdf")
+
+        result = precut_exam_pdfs.delay(self.exam.pk).get()
+
+        self.assertEqual(result, {"cut": 0, "total": 0})
@@ -0,0 +1,125 @@
+import os
+from unittest.mock import patch
+
+import pymupdf
+from django.test import SimpleTestCase
+from examination_tasks.services import ExamSegmentationService, TextLayerService
+from examination_tasks.tests.utils import build_exam_pdf, make_temp_dir
+
+
+class ExamSegmentationServiceTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp_dir = make_temp_dir(self)
+        self.path = os.path.join(self.tmp_dir, "exam.pdf")
+        with open(self.path, "wb") as exam:
+            exam.write(
+                build_exam_pdf(
+                    [
+                        ["Zadanie 1. (0-1)", "Oblicz 2 + 2.", "Brudnopis", "notatki"],
+                        ["Zadanie 2. (0-2)", "Rozwiaz rownanie x + 1 = 3."],
+                        [
+                            "Podaj wszystkie rozwiazania.",
+                            "Zadanie 3.",
+                            "Narysuj wykres.",
+                        ],
+                    ],
+                    footer="Strona {number} z 3",
+                )
+            )
+
+    def test_finds_all_tasks_with_page_ranges(self):
+        """Test case that checks if every task header is found with its pages"""
+        segments = ExamSegmentationService.segment(self.path)
+
+        self.assertEqual(
+            [(s.task_number, s.pages_string) for s in segments],
+            [(1, "1"), (2, "2-3"), (3, "3")],
+        )
+
+    def test_content_is_cleaned(self):
+        """Test case that checks if headers, markers and footers are dropped"""
+        segments = ExamSegmentationService.segment(self.path)
+
+        self.assertEqual(segments[0].content, "Oblicz 2 + 2.")
+        self.assertEqual(
+            segments[1].content,
+            "Rozwiaz rownanie x + 1 = 3.\nPodaj wszystkie rozwiazania.",
+        )
+
+    def test_brudnopis_ends_task_region(self):
+        """Test case that checks if the region stops before the draft area"""
+        segments = ExamSegmentationService.segment(self.path)
+
+        _x0, y0, _x1, y1 = segments[0].regions[0].bbox
+        self.assertLess(y0, 72)
+        self.assertLess(y1, 72 + 2 * 20)
+
+    def test_continuation_region_excludes_footer(self):
+        """Test case that checks if regions stop above the page footer"""
+        segments = ExamSegmentationService.segment(self.path)
+
+        page_height = pymupdf.paper_rect("a4").height
+        first, second = segments[1].regions
+        self.assertGreater(first.bbox[3], page_height - 60)
+        self.assertLess(first.bbox[3], page_height - 30 - 5)
+        self.assertLess(second.bbox[3], 72 + 20)
+
+    def test_region_keeps_figure_below_text_and_figure_only_page(self):
+        """Test case that checks if figures and text-less pages stay in a task"""
+        doc = pymupdf.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), "Zadanie 1. (0-1)")
+        page.insert_text((72, 92), "Odczytaj z wykresu.")
+        page.draw_rect(pymupdf.Rect(72, 300, 300, 500), fill=(0, 0, 0))
+        page.insert_text((72, page.rect.height - 30), "1")
+        figure_page = doc.new_page()
+        figure_page.draw_rect(pymupdf.Rect(72, 100, 300, 300), fill=(0, 0, 0))
+        page = doc.new_page()
+        page.insert_text((72, 200), "Zadanie 2.")
+        pages = TextLayerService.read_pages(doc)
+        doc.close()
+
+        first, second = ExamSegmentationService.segment_pages(pages)
+
+        self.assertEqual(first.pages_string, "1-2")
+        self.assertGreater(first.regions[0].bbox[3], 500)
+        self.assertEqual(first.regions[1].page_number, 2)
+        self.assertGreater(first.regions[1].bbox[3], 300)
+        self.assertEqual(second.pages_string, "3")
+        self.assertLess(second.regions[0].bbox[1], 200 - 11)
+
+    def test_numbers_inside_task_are_kept(self):
+        """Test case that checks if only numbers in page bands count as footer"""
+        doc = pymupdf.open()
+        page = doc.new_page()
+        for y, text in ((72, "Zadanie 1."), (92, "Wybierz wynik:"), (112, "3/4")):
+            page.insert_text((72, y), text)
+        page.insert_text((72, 132), "12")
+        page.insert_text((72, page.rect.height - 30), "1 / 2")
+        pages = TextLayerService.read_pages(doc)
+        doc.close()
+
+        (segment,) = ExamSegmentationService.segment_pages(pages)
+
+        self.assertEqual(segment.content, "Wybierz wynik:\n3/4\n12")
+
+    def test_reads_every_page_text_once(self):
+        """Test case that checks if the text dict is read once per page"""
+        with patch.object(
+            pymupdf.Page, "get_text", autospec=True, side_effect=pymupdf.Page.get_text
+        ) as get_text:
+            ExamSegmentationService.segment(self.path)
+
+        self.assertEqual(get_text.call_count, 3)
+
+    def test_render_segment_produces_page_per_region(self):
+        """Test case that checks if a multi-page task renders to clipped pages"""
+        with pymupdf.open(self.path) as doc:
+            segment = ExamSegmentationService.segment_pages(
+                TextLayerService.read_pages(doc)
+            )[1]
+            pdf_bytes = ExamSegmentationService.render_segment(doc, segment)
+
+        with pymupdf.open(stream=pdf_bytes) as rendered:
+            self.assertEqual(rendered.page_count, 2)
+            self.assertIn("Rozwiaz", rendered[0].get_text())
@@ -0,0 +1,100 @@
+from core.search import HIGHLIGHT_START, HIGHLIGHT_STOP, render_headline
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from examination_tasks.filters import ExamTaskFilter
+from examination_tasks.models import Exam, ExamTask
+from examination_tasks.tests.utils import build_exam_pdf, use_temp_media
+from users.factories import UserFactory
+
+
+class ExamTaskFullTextSearchTests(TestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+
+        self.exam = Exam.objects.create(year=2024, month=5, level_type=1, tasks_count=3)
+        self.exam.tasks_link.save(
+            "exam.pdf", ContentFile(build_exam_pdf([["Zadanie 1."]])), save=True
+        )
+        self.equation = self._create_task(1, "Rozwiąż równanie kwadratowe x^2 = 4.")
+        self.triangle = self._create_task(2, "Oblicz pole trójkąta prostokątnego.")
+        self.both = self._create_task(
+            3, "Równanie prostej przechodzi przez wierzchołek trójkąta. Równanie?"
+        )
+
+    def _create_task(self, task_id, content):
+        return ExamTask.objects.create(
+            exam=self.exam,
+            task_id=task_id,
+            task_content=content,
+            task_screen=ContentFile(b"%PDF", name=f"task_{task_id}.pdf"),
+        )
+
+    def _search(self, query):
+        user = UserFactory.create(school_type=None)
+        request = type("Request", (), {"user": user})()
+        return ExamTaskFilter(
+            data={"search": query},
+            queryset=ExamTask.objects.all(),
+            request=request,
+        ).qs
+
+    def test_search_vector_filled_on_create(self):
+        """Test case that checks if the trigger fills the vector on insert"""
+        self.equation.refresh_from_db()
+        self.assertIn("równanie", self.equation.search_vector)
+
+    def test_search_vector_filled_on_bulk_create(self):
+        """Test case that checks if bulk-created tasks are searchable"""
+        ExamTask.objects.bulk_create(
+            [ExamTask(exam=self.exam, task_id=4, task_content="Ciąg geometryczny")]
+        )
+        self.assertEqual(
+            list(self._search("geometryczny").values_list("task_id", flat=True)), [4]
+        )
+
+    def test_search_vector_updated_on_save(self):
+        """Test case that checks if changing the content updates the vector"""
+        self.triangle.task_content = "Wyznacz granicę ciągu."
+        self.triangle.save()
+
+        self.assertFalse(self._search("trójkąta").filter(pk=self.triangle.pk).exists())
+        self.assertTrue(self._search("granicę").filter(pk=self.triangle.pk).exists())
+
+    def test_results_ordered_by_rank(self):
+        """Test case that checks if better matches come first"""
+        results = list(self._search("równanie"))
+
+        self.assertEqual(results, [self.both, self.equation])
+        self.assertGreater(results[0].rank, results[1].rank)
+
+    def test_headline_marks_matches(self):
+        """Test case that checks if the snippet marks the matched words"""
+        task = self._search("trójkąta").get(pk=self.triangle.pk)
+
+        self.assertIn(
+            f"{HIGHLIGHT_START}trójkąta{HIGHLIGHT_STOP}", task.search_headline
+        )
+
+    def test_blank_query_returns_all_tasks(self):
+        """Test case that checks if an empty search does not filter"""
+        self.assertEqual(self._search("").count(), 3)
+
+    def test_search_engine_view_shows_snippet(self):
+        """Test case that checks if the search engine renders highlighted snippets"""
+        self.client.force_login(UserFactory.create(school_type=None))
+
+        response = self.client.get(
+            reverse("examination_tasks:task_search_engine"), {"search": "trójkąta"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "<mark>trójkąta</mark>")
+
+
+class RenderHeadlineTests(SimpleTestCase):
+    def test_escapes_content_and_marks_matches(self):
+        """Test case that checks if only the match markers become HTML"""
+        html = render_headline(f"a < b and {HIGHLIGHT_START}x{HIGHLIGHT_STOP}")
+
+        self.assertEqual(html, "a &lt; b and <mark>x</mark>")
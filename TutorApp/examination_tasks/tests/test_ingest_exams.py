@@ -0,0 +1,202 @@
+import os
+from io import StringIO
+from unittest.mock import patch
+
+import pymupdf
+from django.core.management import call_command
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+)
+from examination_tasks.choices import ExamTypeChoices
+from examination_tasks.management.commands.ingest_exams import Command
+from examination_tasks.models import Exam, ExamTask
+from examination_tasks.services import (
+    ExamFileNameParser,
+    ExamSegmentationService,
+    TextLayerService,
+)
+from examination_tasks.tests.utils import (
+    build_tasks_pdf,
+    make_temp_dir,
+    use_temp_media,
+)
+
+
+class ExamFileNameParserTests(SimpleTestCase):
+    def test_parses_matriculation_file_name(self):
+        """Test case that checks if all exam attributes are read from the name"""
+        parsed = ExamFileNameParser.parse(
+            "/data/matematyka-2025-czerwiec-matura-rozszerzona.pdf"
+        )
+
+        self.assertEqual(
+            (parsed.year, parsed.month, parsed.level_type, parsed.exam_type),
+            (2025, 6, 2, ExamTypeChoices.MATRICULATION),
+        )
+        self.assertFalse(parsed.is_solutions)
+
+    def test_parses_solutions_and_polish_month_forms(self):
+        """Test case that checks if answer files and genitive months are handled"""
+        parsed = ExamFileNameParser.parse("Matura_maja_2023_podstawowa_odpowiedzi.pdf")
+
+        self.assertEqual((parsed.year, parsed.month, parsed.level_type), (2023, 5, 1))
+        self.assertTrue(parsed.is_solutions)
+
+    def test_eighth_grade_exam_has_no_level(self):
+        """Test case that checks if the level is dropped for eighth grade exams"""
+        parsed = ExamFileNameParser.parse("egzamin-osmoklasisty-2024-maj-pp.pdf")
+
+        self.assertEqual(parsed.exam_type, ExamTypeChoices.EIGHTH_GRADE)
+        self.assertIsNone(parsed.level_type)
+
+    def test_unrecognised_name_returns_none(self):
+        """Test case that checks if names without year or month are rejected"""
+        self.assertIsNone(ExamFileNameParser.parse("skan_arkusza.pdf"))
+        self.assertIsNone(ExamFileNameParser.parse("matura-2024-maj.docx"))
+
+
+class IngestExamsCommandTests(TestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+        self.source_dir = make_temp_dir(self)
+
+        self._write("matematyka-2024-maj-matura-podstawowa.pdf", build_tasks_pdf(3))
+        self._write(
+            "matematyka-2024-maj-matura-podstawowa-odpowiedzi.pdf", build_tasks_pdf(3)
+        )
+        self._write(
+            "matematyka-2023-czerwiec-matura-rozszerzona.pdf", build_tasks_pdf(2)
+        )
+
+    def _write(self, name: str, content: bytes) -> None:
+        with open(os.path.join(self.source_dir, name), "wb") as pdf:
+            pdf.write(content)
+
+    def _ingest(self, *args) -> str:
+        out = StringIO()
+        call_command(
+            "ingest_exams", self.source_dir, "--workers", "2", *args, stdout=out
+        )
+        return out.getvalue()
+
+    def test_creates_exams_with_all_tasks(self):
+        """Test case that checks if exams and their tasks are created in bulk"""
+        output = self._ingest()
+
+        exam = Exam.objects.get(year=2024, month=5, level_type=1)
+        self.assertEqual(exam.tasks_count, 3)
+        self.assertTrue(exam.solutions_link)
+        tasks = list(exam.tasks.order_by("task_id"))
+        self.assertEqual([task.task_id for task in tasks], [1, 2, 3])
+        self.assertEqual(tasks[1].task_pages, "2")
+        self.assertEqual(tasks[1].answer_pages, "2")
+        self.assertEqual(tasks[1].task_content, "Tresc zadania 2.")
+        self.assertTrue(os.path.exists(tasks[0].task_screen.path))
+        self.assertTrue(
+            os.path.exists(TextLayerService.sidecar_path(exam.tasks_link.path))
+        )
+        self.assertFalse(
+            any(
+                name.endswith(TextLayerService.SUFFIX)
+                for name in os.listdir(self.source_dir)
+            )
+        )
+        self.assertEqual(ExamTask.objects.count(), 5)
+        self.assertIn("2 exams, 5 tasks, 8 PDFs pre-cut, 0 failed", output)
+
+    def test_does_not_queue_text_layer_build(self):
+        """Test case that checks if stored text layers are not built again"""
+        with (
+            patch("examination_tasks.tasks.build_exam_text_layers.delay") as delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self._ingest()
+
+        delay.assert_not_called()
+
+    def test_dry_run_saves_nothing(self):
+        """Test case that checks if dry run only reports detected tasks"""
+        output = self._ingest("--dry-run")
+
+        self.assertFalse(Exam.objects.exists())
+        self.assertIn("Dry run: 2 exams, 5 tasks", output)
+
+    def test_rerun_resumes_after_failure(self):
+        """Test case that checks if a re-run only ingests what previously failed"""
+        broken_name = "matematyka-2022-maj-matura-podstawowa.pdf"
+        self._write(broken_name, b"not a pdf")
+
+        first = self._ingest()
+        self.assertIn(f"Failed: {broken_name}", first)
+        self.assertEqual(Exam.objects.count(), 2)
+
+        self._write(broken_name, build_tasks_pdf(1))
+        second = self._ingest()
+
+        self.assertEqual(second.count("Already ingested"), 2)
+        self.assertIn("1 exams, 1 tasks", second)
+        self.assertEqual(Exam.objects.count(), 3)
+
+
+class IngestExamCommitTests(TransactionTestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+
+        self.tasks_path = os.path.join(
+            self.media_root, "matematyka-2024-maj-matura-podstawowa.pdf"
+        )
+        self.solutions_path = os.path.join(
+            self.media_root, "matematyka-2024-maj-matura-podstawowa-odpowiedzi.pdf"
+        )
+        for path in (self.tasks_path, self.solutions_path):
+            with open(path, "wb") as pdf:
+                pdf.write(build_tasks_pdf(2))
+
+    def _ingest_exam(self):
+        with pymupdf.open(self.tasks_path) as doc:
+            pages = TextLayerService.read_pages(doc)
+            rendered = [
+                (segment, ExamSegmentationService.render_segment(doc, segment))
+                for segment in ExamSegmentationService.segment_pages(pages)
+            ]
+        group = {
+            "tasks": ExamFileNameParser.parse(self.tasks_path),
+            "solutions": ExamFileNameParser.parse(self.solutions_path),
+            "exam": None,
+        }
+        return Command._ingest_exam(group, pages, rendered, (None, {}))
+
+    def test_failing_commit_hook_keeps_committed_files(self):
+        """Test case that checks if files of committed rows are not deleted"""
+        with patch(
+            "examination_tasks.tasks.build_exam_text_layers.delay",
+            side_effect=OSError("broker unavailable"),
+        ):
+            with self.assertRaises(OSError):
+                self._ingest_exam()
+
+        exam = Exam.objects.get()
+        self.assertTrue(os.path.exists(exam.tasks_link.path))
+        self.assertTrue(os.path.exists(exam.solutions_link.path))
+        for task in exam.tasks.all():
+            self.assertTrue(os.path.exists(task.task_screen.path))
+
+    def test_rollback_removes_stored_files(self):
+        """Test case that checks if files are removed when nothing is saved"""
+        with patch.object(
+            ExamTask.objects, "bulk_create", side_effect=ValueError("broken")
+        ):
+            with self.assertRaises(ValueError):
+                self._ingest_exam()
+
+        self.assertFalse(Exam.objects.exists())
+        self.assertEqual(
+            {
+                os.path.join(root, name)
+                for root, _dirs, files in os.walk(self.media_root)
+                for name in files
+            },
+            {self.tasks_path, self.solutions_path},
+        )
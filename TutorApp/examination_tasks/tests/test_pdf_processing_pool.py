@@ -0,0 +1,106 @@
+import os
+import time
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from examination_tasks.models import Exam, ExamTask
+from examination_tasks.services import CutPdfCacheService, PdfProcessingPool
+from examination_tasks.tasks import precut_all_exams
+from examination_tasks.tests.utils import (
+    build_tasks_pdf,
+    make_temp_dir,
+    use_temp_media,
+)
+
+
+class PdfProcessingPoolTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = make_temp_dir(self)
+
+    def _write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "wb") as pdf:
+            pdf.write(content)
+        return path
+
+    def test_segments_many_documents_in_worker_processes(self):
+        """Test case that checks if documents are processed across processes"""
+        paths = [self._write(f"exam_{i}.pdf", build_tasks_pdf(i)) for i in (2, 3)]
+
+        with PdfProcessingPool(processes=2, timeout=30) as pool:
+            results = {result.args[0]: result for result in pool.segment(paths)}
+
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(len(results[paths[0]].value), 2)
+        self.assertEqual(len(results[paths[1]].value), 3)
+
+    def test_broken_document_does_not_stop_batch(self):
+        """Test case that checks if one corrupted file only fails its own job"""
+        good = self._write("good.pdf", build_tasks_pdf(1))
+        broken = self._write("broken.pdf", b"not a pdf")
+
+        with PdfProcessingPool(processes=2, timeout=30) as pool:
+            results = {
+                result.args[0]: result for result in pool.dump_text([good, broken])
+            }
+
+        self.assertTrue(results[good].ok)
+        self.assertFalse(results[broken].ok)
+        self.assertTrue(results[broken].error)
+
+    def test_job_exceeding_timeout_is_reported(self):
+        """Test case that checks if a slow document is stopped by its time limit"""
+        with PdfProcessingPool(processes=2, timeout=1) as pool:
+            started = time.monotonic()
+            results = list(pool.map(time.sleep, [(10,), (0,)]))
+
+        self.assertLess(time.monotonic() - started, 5)
+        by_args = {result.args: result for result in results}
+        self.assertFalse(by_args[(10,)].ok)
+        self.assertIn("Timed out", by_args[(10,)].error)
+        self.assertTrue(by_args[(0,)].ok)
+
+    def test_single_process_runs_inline(self):
+        """Test case that checks if processes=1 runs jobs without a pool"""
+        path = self._write("exam.pdf", build_tasks_pdf(2))
+
+        with PdfProcessingPool(processes=1) as pool:
+            results = list(pool.segment([path]))
+
+        self.assertIsNone(pool._executor)
+        self.assertEqual(len(results[0].value), 2)
+
+
+class PrecutAllExamsTests(TestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+
+    def test_archive_is_cut_with_the_pool(self):
+        """Test case that checks if every exam of the archive gets pre-cut"""
+        tasks = []
+        for month in (5, 6):
+            exam = Exam.objects.create(
+                year=2024,
+                month=month,
+                level_type=1,
+                tasks_link=SimpleUploadedFile("exam.pdf", build_tasks_pdf(2)),
+            )
+            tasks.append(
+                ExamTask.objects.create(
+                    exam=exam,
+                    task_id=1,
+                    task_pages="1-2",
+                    task_screen="exam_tasks/zadanie_1.pdf",
+                )
+            )
+
+        result = precut_all_exams.delay(processes=2).get()
+
+        self.assertEqual(result, {"cut": 2, "failed": 0})
+        service = CutPdfCacheService()
+        for task in tasks:
+            self.assertIsNotNone(
+                service.get(
+                    task.exam.tasks_link.path, [1, 2], "task", task.exam.pk, task.pk
+                )
+            )
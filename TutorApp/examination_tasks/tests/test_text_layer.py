@@ -0,0 +1,112 @@
+import os
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from examination_tasks.models import Exam
+from examination_tasks.services import ExtractTaskTextFromPdf, TextLayerService
+from examination_tasks.tests.utils import (
+    build_tasks_pdf,
+    make_temp_dir,
+    use_temp_media,
+)
+
+
+class TextLayerServiceTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = make_temp_dir(self)
+        self.path = os.path.join(self.tmp_dir, "exam.pdf")
+        with open(self.path, "wb") as pdf:
+            pdf.write(build_tasks_pdf(2))
+        TextLayerService._load_cached.cache_clear()
+        self.addCleanup(TextLayerService._load_cached.cache_clear)
+
+    def test_load_builds_sidecar_once(self):
+        """Test case that checks if the PDF is parsed once and then read from disk"""
+        pages = TextLayerService.load(self.path)
+        TextLayerService._load_cached.cache_clear()
+
+        with patch(
+            "examination_tasks.services.textLayerService.pymupdf.open"
+        ) as opened:
+            reloaded = TextLayerService.load(self.path)
+
+        opened.assert_not_called()
+        self.assertTrue(os.path.exists(TextLayerService.sidecar_path(self.path)))
+        self.assertEqual(
+            [line.text for line in reloaded[1].lines],
+            ["Zadanie 2.", "Tresc zadania 2."],
+        )
+        self.assertEqual(len(pages), len(reloaded))
+
+    def test_stale_sidecar_is_rebuilt(self):
+        """Test case that checks if replacing the PDF invalidates its text layer"""
+        TextLayerService.load(self.path)
+        with open(self.path, "wb") as pdf:
+            pdf.write(build_tasks_pdf(3))
+
+        pages = TextLayerService.load(self.path)
+
+        self.assertEqual(len(pages), 3)
+
+    def test_extraction_helpers_read_the_text_layer(self):
+        """Test case that checks if text helpers do not re-open the PDF"""
+        TextLayerService.build(self.path)
+        TextLayerService._load_cached.cache_clear()
+
+        with patch(
+            "examination_tasks.services.textLayerService.pymupdf.open"
+        ) as opened:
+            by_page = ExtractTaskTextFromPdf.extract_lines_by_page(self.path, [2])
+            page_count = ExtractTaskTextFromPdf.count_pages(self.path)
+
+        opened.assert_not_called()
+        self.assertEqual(by_page, {2: ["Zadanie 2.", "Tresc zadania 2."]})
+        self.assertEqual(page_count, 2)
+
+    def test_broken_pdf_raises_value_error(self):
+        """Test case that checks if corrupted PDFs are reported as ValueError"""
+        with open(self.path, "wb") as pdf:
+            pdf.write(b"not a pdf")
+
+        with self.assertRaises(ValueError):
+            ExtractTaskTextFromPdf.extract_lines(self.path)
+
+
+class ExamTextLayerUploadTests(TestCase):
+    def setUp(self):
+        self.media_root = use_temp_media(self)
+
+    def test_upload_builds_text_layers(self):
+        """Test case that checks if uploading an exam builds its text layers"""
+        with self.captureOnCommitCallbacks(execute=True):
+            exam = Exam.objects.create(
+                year=2024,
+                month=5,
+                level_type=1,
+                tasks_link=SimpleUploadedFile("exam.pdf", build_tasks_pdf(2)),
+                solutions_link=SimpleUploadedFile("answers.pdf", build_tasks_pdf(1)),
+            )
+
+        self.assertTrue(
+            os.path.exists(TextLayerService.sidecar_path(exam.tasks_link.path))
+        )
+        self.assertTrue(
+            os.path.exists(TextLayerService.sidecar_path(exam.solutions_link.path))
+        )
+
+    def test_replacing_pdf_removes_old_text_layer(self):
+        """Test case that checks if the old sidecar is dropped with the old file"""
+        with self.captureOnCommitCallbacks(execute=True):
+            exam = Exam.objects.create(
+                year=2024,
+                month=5,
+                level_type=1,
+                tasks_link=SimpleUploadedFile("exam.pdf", build_tasks_pdf(2)),
+            )
+        old_sidecar = TextLayerService.sidecar_path(exam.tasks_link.path)
+
+        exam.tasks_link = SimpleUploadedFile("new_exam.pdf", build_tasks_pdf(2))
+        exam.save()
+
+        self.assertFalse(os.path.exists(old_sidecar))
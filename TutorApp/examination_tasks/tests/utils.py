@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+from typing import List, Optional
+
+import pymupdf
+from django.test import SimpleTestCase, override_settings
+
+
+def build_exam_pdf(pages: List[List[str]], footer: Optional[str] = None) -> bytes:
+    """
+    Builds a PDF with one page per list of lines, written 20pt apart.
+
+    Args:
+        pages: Lines of every page.
+        footer: Optional footer written at the bottom of every page, formatted
+            with the page ``number``.
+    """
+    doc = pymupdf.open()
+    for number, lines in enumerate(pages, start=1):
+        page = doc.new_page()
+        for index, line in enumerate(lines):
+            page.insert_text((72, 72 + index * 20), line)
+        if footer:
+            page.insert_text((72, page.rect.height - 30), footer.format(number=number))
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
+
+def build_tasks_pdf(task_count: int) -> bytes:
+    """Builds a PDF with a single ``Zadanie N.`` task on each page."""
+    return build_exam_pdf(
+        [
+            [f"Zadanie {number}.", f"Tresc zadania {number}."]
+            for number in range(1, task_count + 1)
+        ]
+    )
+
+
+def make_temp_dir(test_case: SimpleTestCase) -> str:
+    """Creates a directory which is removed after the test."""
+    path = tempfile.mkdtemp()
+    test_case.addCleanup(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def use_temp_media(test_case: SimpleTestCase) -> str:
+    """
+    Points MEDIA_ROOT (and the cut PDF cache inside it) at a temporary
+    directory for the duration of the test.
+
+    Returns:
+        Path of the temporary media root.
+    """
+    media_root = make_temp_dir(test_case)
+    settings_override = override_settings(
+        MEDIA_ROOT=media_root,
+        CUT_PDF_CACHE_DIR=os.path.join(media_root, "cut_pdf_cache"),
+    )
+    settings_override.enable()
+    test_case.addCleanup(settings_override.disable)
+    return media_root
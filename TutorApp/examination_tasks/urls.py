@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views.exam_task_views import (
     AddExamTaskWizard,
+    BulkAddExamTasksWizard,
     ExamTaskListView,
     ExamTaskSearchEngine,
     TaskCutPdfStreamView,
@@ -19,6 +20,11 @@ urlpatterns = [
         AddExamTaskWizard.as_view(),
         name="add_exam_task",
     ),
+    path(
+        "exams/tasks/bulk-add/",
+        BulkAddExamTasksWizard.as_view(),
+        name="bulk_add_exam_tasks",
+    ),
     path("tasks/<int:pk>/pdf/", TaskPdfView.as_view(), name="task-pdf"),
     path("tasks/<int:pk>/", TaskDisplayView.as_view(), name="task-display"),
     path(
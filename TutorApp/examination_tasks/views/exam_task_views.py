@@ -1,16 +1,19 @@
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
 
 import pymupdf
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.files.storage import FileSystemStorage
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
 from django.db import transaction
 from django.db.models import QuerySet
 from django.forms import Form
 from django.http import (
+    FileResponse,
     Http404,
     HttpRequest,
     HttpResponse,
@@ -27,11 +30,26 @@ from examination_tasks.filters import SCHOOL_TO_EXAM_TYPE
 from formtools.wizard.views import SessionWizardView
 from users.mixins import TeacherRequiredMixin
 
-from ..forms.exam_tasks_forms import ExamTaskBasicForm, ExamTaskPreviewForm
+from ..forms.exam_tasks_forms import (
+    ExamBulkSelectForm,
+    ExamBulkTaskFormSet,
+    ExamTaskBasicForm,
+    ExamTaskPreviewForm,
+)
 from ..models import Exam, ExamTask
+from ..services.cutPdfCacheService import CutPdfCacheService
+from ..services.examSegmentationService import (
+    ExamSegmentationService,
+    TaskRegion,
+    TaskSegment,
+)
 from ..services.examTaskDBService import ExamTaskDBService
+from ..services.extractTaskContentFromLines import ExtractTaskContentFromLines
 from ..services.extractTaskFromPdf import ExtractTaskFromPdf
+from ..services.extractTaskPagesFromPdf import ExtractTaskPagesFromPdf
+from ..services.extractTaskTextFromPdf import ExtractTaskTextFromPdf
 from ..services.tempFileService import TempFileService
+from ..signals import schedule_precut
 
 LEVEL_MAP = {
     "B": 1,
@@ -122,7 +140,7 @@ class AddExamTaskWizard(TeacherRequiredMixin, SessionWizardView):
 
         try:
             extracted_pdf_path = ExtractTaskFromPdf.extract_task(
-                file_path=exam.exam_file.path,
+                file_path=exam.tasks_link.path,
                 task_number=task_id,
                 page_number=page_number,
                 output_dir=temp_dir,
@@ -135,13 +153,18 @@ class AddExamTaskWizard(TeacherRequiredMixin, SessionWizardView):
             return {"preview_error": _("Unexpected PDF extraction error")}
 
         try:
-            doc = pymupdf.open(extracted_pdf_path)
-            text = "".join(page.get_text() for page in doc)
-            doc.close()
+            lines = ExtractTaskTextFromPdf.extract_lines(
+                exam.tasks_link.path, ExamTaskDBService.parse_pages_string(task_pages)
+            )
         except Exception:
-            logger.exception("Error reading extracted PDF")
+            logger.exception("Error reading exam text layer")
             return {"preview_error": _("Error reading extracted PDF")}
 
+        try:
+            text = ExtractTaskContentFromLines.get_clean_task_content(lines, task_id)
+        except ValueError:
+            text = "\n".join(lines)
+
         relative_path = os.path.relpath(extracted_pdf_path, settings.MEDIA_ROOT)
 
         self.storage.extra_data.update(
@@ -229,6 +252,208 @@ class AddExamTaskWizard(TeacherRequiredMixin, SessionWizardView):
             logger.warning("Could not clean temp directory: %s", e)
 
 
+class BulkAddExamTasksWizard(TeacherRequiredMixin, SessionWizardView):
+    """
+    Wizard for importing all tasks of an exam at once:
+
+    Step 1 (exam): Choosing the exam
+    Step 2 (tasks): Editable table with every task detected in a single
+                    pass over the exam (and solutions) PDF
+
+    On save every task PDF is clipped from the already opened exam document
+    and all ExamTask rows are created with one bulk_create in a transaction.
+    """
+
+    STEP_EXAM = "exam"
+    STEP_TASKS = "tasks"
+
+    form_list = [
+        (STEP_EXAM, ExamBulkSelectForm),
+        (STEP_TASKS, ExamBulkTaskFormSet),
+    ]
+
+    template_name = "examination_tasks/add_exam_bulk.html"
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if "cancel" in request.GET:
+            return self.cancel()
+
+        return super().get(request, *args, **kwargs)
+
+    def get_context_data(self, form: Form, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(form, **kwargs)
+        context["title"] = _("Bulk Import Exam Tasks")
+
+        if self.steps.current == self.STEP_TASKS:
+            context["exam"] = self._get_exam()
+            context["detected_count"] = len(self._get_detected_tasks())
+
+        return context
+
+    def get_form_kwargs(self, step: Optional[str] = None) -> Dict[str, Any]:
+        kwargs = super().get_form_kwargs(step)
+        if step == self.STEP_TASKS:
+            kwargs["exam"] = self._get_exam()
+        return kwargs
+
+    def get_form_initial(self, step: str) -> Any:
+        if step == self.STEP_TASKS:
+            return [
+                {
+                    "include": True,
+                    "task_id": task["task_id"],
+                    "task_pages": task["task_pages"],
+                    "answer_pages": task["answer_pages"],
+                    "task_content": task["task_content"],
+                }
+                for task in self._get_detected_tasks()
+            ]
+
+        return super().get_form_initial(step)
+
+    def process_step(self, form: Form) -> Dict[str, Any]:
+        if self.steps.current == self.STEP_EXAM:
+            self.storage.extra_data = {}
+        return super().process_step(form)
+
+    def cancel(self) -> HttpResponse:
+        self.storage.reset()
+        messages.info(self.request, _("Bulk import cancelled. No data was saved."))
+        return redirect("examination_tasks:bulk_add_exam_tasks")
+
+    def done(self, form_list: List[Form], **kwargs: Any) -> HttpResponse:
+        exam = self._get_exam()
+        rows = list(form_list)[1].included_data
+        detected = {task["task_id"]: task for task in self._get_detected_tasks()}
+
+        written_files: List[str] = []
+        try:
+            with transaction.atomic():
+                tasks = self._build_tasks(exam, rows, detected, written_files)
+                ExamTask.objects.bulk_create(tasks)
+        except Exception:
+            logger.exception("Bulk import of exam %s failed", exam.pk)
+            for name in written_files:
+                default_storage.delete(name)
+            messages.error(self.request, _("Error saving exam tasks."))
+            return redirect("examination_tasks:bulk_add_exam_tasks")
+        finally:
+            self.storage.reset()
+
+        schedule_precut(exam.pk)
+        messages.success(
+            self.request,
+            _("%(count)s tasks added successfully!") % {"count": len(tasks)},
+        )
+        return redirect("examination_tasks:exam_task_list", exam_pk=exam.pk)
+
+    def _get_exam(self) -> Optional[Exam]:
+        exam_data = self.get_cleaned_data_for_step(self.STEP_EXAM)
+        return exam_data["exam"] if exam_data else None
+
+    def _get_detected_tasks(self) -> List[Dict[str, Any]]:
+        """
+        Returns tasks detected in the selected exam, segmenting the PDF files
+        only once per wizard run (results are kept in the wizard storage).
+        """
+        detected = self.storage.extra_data.get("detected_tasks")
+        if detected is not None:
+            return detected
+
+        exam = self._get_exam()
+        if exam is None:
+            return []
+
+        existing = set(exam.tasks.values_list("task_id", flat=True))
+        try:
+            segments = ExamSegmentationService.segment(exam.tasks_link.path)
+            answers = (
+                {
+                    segment.task_number: segment.pages_string
+                    for segment in ExamSegmentationService.segment(
+                        exam.solutions_link.path
+                    )
+                }
+                if exam.solutions_link
+                else {}
+            )
+        except Exception:
+            logger.exception("Could not segment exam %s", exam.pk)
+            messages.error(self.request, _("Could not detect tasks in the exam PDF."))
+            segments, answers = [], {}
+
+        detected = [
+            {
+                "task_id": segment.task_number,
+                "task_pages": segment.pages_string,
+                "answer_pages": answers.get(segment.task_number, ""),
+                "task_content": segment.content,
+                "regions": [
+                    [region.page_number, list(region.bbox)]
+                    for region in segment.regions
+                ],
+            }
+            for segment in segments
+            if segment.task_number not in existing
+        ]
+        self.storage.extra_data = {
+            **self.storage.extra_data,
+            "detected_tasks": detected,
+        }
+        return detected
+
+    @staticmethod
+    def _build_tasks(
+        exam: Exam,
+        rows: List[Dict[str, Any]],
+        detected: Dict[int, Dict[str, Any]],
+        written_files: List[str],
+    ) -> List[ExamTask]:
+        """
+        Renders and stores the PDF of every row from one opened exam document.
+        Rows whose pages match the detection reuse the detected clip regions,
+        edited rows fall back to whole pages.
+        """
+        tasks = []
+        with pymupdf.open(exam.tasks_link.path) as doc:
+            for row in rows:
+                task_pages = row["task_pages"].strip()
+                detected_task = detected.get(row["task_id"])
+
+                if detected_task and detected_task["task_pages"] == task_pages:
+                    segment = TaskSegment(
+                        task_number=row["task_id"],
+                        regions=tuple(
+                            TaskRegion(page_number=page, bbox=tuple(bbox))
+                            for page, bbox in detected_task["regions"]
+                        ),
+                        content=detected_task["task_content"],
+                    )
+                    pdf_bytes = ExamSegmentationService.render_segment(doc, segment)
+                else:
+                    pdf_bytes = ExtractTaskPagesFromPdf.cut_pages(
+                        doc, ExamTaskDBService.parse_pages_string(task_pages)
+                    )
+
+                if not pdf_bytes:
+                    raise ValueError(f"No pages could be cut for task {row['task_id']}")
+
+                task = ExamTask(
+                    exam=exam,
+                    task_id=row["task_id"],
+                    task_pages=task_pages,
+                    answer_pages=row.get("answer_pages", "").strip(),
+                    task_content=row.get("task_content", ""),
+                )
+                task.task_screen.save(
+                    f"zadanie_{row['task_id']}.pdf", ContentFile(pdf_bytes), save=False
+                )
+                written_files.append(task.task_screen.name)
+                tasks.append(task)
+
+        return tasks
+
+
 class TaskPdfView(LoginRequiredMixin, View):
     template_name = "examination_tasks/exam_task_preview.html"
 
@@ -279,22 +504,22 @@ class TaskCutPdfStreamView(LoginRequiredMixin, View):
     Streams a cut PDF for either the task content ('task') or the solution ('answer').
     """
 
-    VALID_KINDS = ("task", "answer")
+    VALID_KINDS = CutPdfCacheService.KINDS
 
     def get(self, request, *args, **kwargs):
         task_pk = kwargs.get("pk")
-        kind = kwargs.get("kind", "task")
+        kind = kwargs.get("kind", CutPdfCacheService.KIND_TASK)
         if kind not in self.VALID_KINDS:
             return HttpResponseNotFound(_("Incorrect PDF source type."))
 
-        task = get_object_or_404(ExamTask, pk=task_pk)
+        task = get_object_or_404(ExamTask.objects.select_related("exam"), pk=task_pk)
         exam = task.exam
 
-        if kind == "task":  # TODO STALA TASK
+        if kind == CutPdfCacheService.KIND_TASK:
             source_file = exam.tasks_link
             pages_str = task.task_pages
             filename_prefix = "zadanie"
-        elif kind == "answer":
+        else:
             source_file = exam.solutions_link
             pages_str = task.answer_pages
             filename_prefix = "rozwiazanie"
@@ -314,23 +539,42 @@ class TaskCutPdfStreamView(LoginRequiredMixin, View):
             if not pages_to_extract:
                 return HttpResponseNotFound(_("Pages to be cut have not been defined."))
 
-            pdf_bytes = ExtractTaskFromPdf.get_single_task_pdf(
-                task_link=source_pdf_path, pages=pages_to_extract
+            cached_pdf_path = CutPdfCacheService().get_or_create(
+                source_path=source_pdf_path,
+                pages=pages_to_extract,
+                kind=kind,
+                exam_pk=exam.pk,
+                task_pk=task.pk,
             )
-            if not pdf_bytes:
+            if not cached_pdf_path:
                 return HttpResponseNotFound(_("Unable to generate PDF file."))
 
-            response = HttpResponse(pdf_bytes, content_type="application/pdf")
-            response["Content-Disposition"] = (
-                f'inline; filename="{filename_prefix}_{task.exam.year}_{task.task_id}.pdf"'
+            return self._build_pdf_response(
+                cached_pdf_path, f"{filename_prefix}_{exam.year}_{task.task_id}.pdf"
             )
-            response["Content-Length"] = str(len(pdf_bytes))
-            return response
 
         except Exception:
-
+            logger.exception("Could not serve cut PDF for task %s", task_pk)
             return HttpResponse(_("An internal server error has occurred."), status=500)
 
+    def _build_pdf_response(self, pdf_path: str, filename: str) -> HttpResponse:
+        """
+        Returns the cut PDF either as an nginx X-Accel-Redirect hand-off
+        or, when nginx is not in front of the app, as a streamed FileResponse.
+        """
+        if settings.PDF_DELIVERY_MODE == "x-accel":
+            relative_path = os.path.relpath(pdf_path, settings.CUT_PDF_CACHE_DIR)
+            response = HttpResponse(content_type="application/pdf")
+            response["X-Accel-Redirect"] = settings.PDF_ACCEL_REDIRECT_LOCATION + quote(
+                relative_path.replace(os.sep, "/")
+            )
+            response["Content-Disposition"] = f'inline; filename="{filename}"'
+            return response
+
+        return FileResponse(
+            open(pdf_path, "rb"), content_type="application/pdf", filename=filename
+        )
+
 
 class ExamTaskListView(LoginRequiredMixin, ListView):
     """
@@ -1,12 +1,11 @@
 import django_filters
+from core.filters import FuzzyCharFilter
 
 from .models import Motif
 
 
 class MotifFilter(django_filters.FilterSet):
-    content = django_filters.CharFilter(
-        lookup_expr="icontains", label="Search in content"
-    )
+    content = FuzzyCharFilter(label="Search in content")
 
     class Meta:
         model = Motif
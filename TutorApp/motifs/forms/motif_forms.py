@@ -1,7 +1,7 @@
+from core.forms import FuzzyModelSelect2Widget
 from courses.models import Section
 from django import forms
 from django.utils.translation import gettext_lazy as _
-from django_select2.forms import ModelSelect2Widget
 
 from ..models import Motif
 
@@ -29,9 +29,9 @@ class AddMotifForm(forms.ModelForm):
                     "class": "form-select",
                 }
             ),
-            "section": ModelSelect2Widget(
+            "section": FuzzyModelSelect2Widget(
                 model=Section,
-                search_fields=["name__icontains"],
+                search_fields=["name"],
                 attrs={
                     "class": "form-control",
                     "data-placeholder": _("Select a section..."),
@@ -1,3 +1,4 @@
+from core.search import trigram_index
 from courses.choices import SubjectChoices
 from courses.models import Section
 from django.db import models
@@ -75,6 +76,7 @@ class Motif(models.Model):
         verbose_name = _("Motif")
         verbose_name_plural = _("Motifs")
         ordering = ["subject", "section", "level_type"]
+        indexes = [trigram_index("content", "motif_content_trgm_idx")]
 
     def __str__(self):
         level = self.get_level_type_display() if self.level_type else "No Level"
@@ -0,0 +1,19 @@
+from django.utils.functional import SimpleLazyObject
+from plans.services import EntitlementService
+
+
+class EntitlementMiddleware:
+    """
+    Sets request.entitlement, resolved from the cache on first access, so
+    views and templates of a request share a single entitlement lookup.
+    Must come after AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.entitlement = SimpleLazyObject(
+            lambda: EntitlementService.get_for_user(request.user)
+        )
+        return self.get_response(request)
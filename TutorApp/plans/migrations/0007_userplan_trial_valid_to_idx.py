@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plans", "0006_alter_userplan_valid_to"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userplan",
+            index=models.Index(
+                condition=models.Q(("is_trial", True)),
+                fields=["valid_to"],
+                name="userplan_trial_valid_to_idx",
+            ),
+        ),
+    ]
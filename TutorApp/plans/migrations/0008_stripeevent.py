@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plans", "0007_userplan_trial_valid_to_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StripeEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event_id", models.CharField(max_length=255, unique=True)),
+                ("type", models.CharField(max_length=255)),
+                (
+                    "customer_id",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("payload", models.JSONField()),
+                (
+                    "status",
+                    models.IntegerField(
+                        choices=[
+                            (1, "Pending"),
+                            (2, "Processed"),
+                            (3, "Ignored"),
+                            (4, "Failed"),
+                        ],
+                        default=1,
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                ("stripe_created_at", models.DateTimeField()),
+                ("received_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["customer_id", "stripe_created_at"],
+                        name="stripeevent_customer_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -10,6 +10,8 @@ class Plan(models.Model):
         TRIAL = 3, _("Trial")
         ULTIMATE = 4, _("Ultimate")
 
+    PREMIUM_TYPES = (PlanType.PREMIUM, PlanType.TRIAL, PlanType.ULTIMATE)
+
     name = models.CharField(max_length=255)
     type = models.IntegerField(choices=PlanType.choices, default=PlanType.BASE)
     description = models.TextField()
@@ -40,13 +42,48 @@ class UserPlan(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     stripe_customer_id = models.CharField(max_length=255, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["valid_to"],
+                condition=models.Q(is_trial=True),
+                name="userplan_trial_valid_to_idx",
+            ),
+        ]
+
     @property
     def is_premium_or_trial(self):
-        return self.is_active and self.plan.type in [
-            Plan.PlanType.PREMIUM,
-            Plan.PlanType.TRIAL,
-            Plan.PlanType.ULTIMATE,
-        ]
+        return self.is_active and self.plan.type in Plan.PREMIUM_TYPES
 
     def __str__(self):
         return f"{self.user.username} - {self.plan.name}"
+
+
+class StripeEvent(models.Model):
+    class Status(models.IntegerChoices):
+        PENDING = 1, _("Pending")
+        PROCESSED = 2, _("Processed")
+        IGNORED = 3, _("Ignored")
+        FAILED = 4, _("Failed")
+
+    event_id = models.CharField(max_length=255, unique=True)
+    type = models.CharField(max_length=255)
+    customer_id = models.CharField(max_length=255, null=True, blank=True)
+    payload = models.JSONField()
+    status = models.IntegerField(choices=Status.choices, default=Status.PENDING)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    stripe_created_at = models.DateTimeField()
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["customer_id", "stripe_created_at"],
+                name="stripeevent_customer_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.type} ({self.event_id})"
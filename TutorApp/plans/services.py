@@ -1,13 +1,130 @@
+import logging
 from abc import ABC, abstractmethod
-from datetime import date
+from dataclasses import dataclass
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
 from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import stripe
+from core.cache import CacheNamespace
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.db import transaction
 from django.db.models import QuerySet
 from django.utils import timezone
-from plans.models import Plan, UserPlan
+from plans.models import Plan, StripeEvent, UserPlan
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Entitlement:
+    """
+    The plan tier a user is entitled to, None if the user has no plan.
+    A trial stops giving access the day after ``valid_to``, even before
+    the hourly job moves it to the base plan.
+    """
+
+    plan_type: Optional[int] = None
+    is_active: bool = False
+    is_trial: bool = False
+    valid_to: Optional[date] = None
+
+    @property
+    def is_expired_trial(self) -> bool:
+        return (
+            self.is_trial
+            and self.valid_to is not None
+            and self.valid_to < timezone.now().date()
+        )
+
+    @property
+    def is_premium_or_trial(self) -> bool:
+        return (
+            self.is_active
+            and self.plan_type in Plan.PREMIUM_TYPES
+            and not self.is_expired_trial
+        )
+
+
+class EntitlementService:
+    """
+    Class containing services related to user entitlements:
+        -method for getting the cached entitlement of a user
+        -method for building the entitlement from the database
+        -method for invalidating the entitlement of a single user
+        -method for invalidating the entitlements of many users
+        -method for invalidating the entitlements of all users
+
+    Entitlements are read once per user with a single query and cached until
+    the user's plan changes. Editing plans bumps the namespace version, so
+    entitlements of every user on a changed plan are rebuilt.
+    """
+
+    CACHE = CacheNamespace("plans:entitlements", timeout=60 * 60 * 24, versioned=True)
+
+    @classmethod
+    def get_for_user(cls, user) -> Entitlement:
+        """
+        Returns the entitlement of a user, building and caching it on a miss.
+
+        Args:
+            user: The user object, may be anonymous
+
+        Returns:
+            Entitlement of the user
+        """
+        if not user.is_authenticated:
+            return Entitlement()
+        return cls.CACHE.get_or_set(user.pk, lambda: cls.build(user.pk))
+
+    @staticmethod
+    def build(user_id: int) -> Entitlement:
+        """
+        Reads the plan tier of a user together with its plan in one query.
+
+        Args:
+            user_id: The user id
+
+        Returns:
+            Entitlement of the user
+        """
+        row = (
+            UserPlan.objects.filter(user_id=user_id)
+            .values_list("plan__type", "is_active", "is_trial", "valid_to")
+            .first()
+        )
+        if row is None:
+            return Entitlement()
+        return Entitlement(*row)
+
+    @classmethod
+    def invalidate(cls, user_id: int) -> None:
+        """
+        Removes the cached entitlement of a user.
+
+        Args:
+            user_id: The user id
+        """
+        cls.CACHE.delete(user_id)
+
+    @classmethod
+    def invalidate_many(cls, user_ids: Iterable[int]) -> None:
+        """
+        Removes the cached entitlements of many users in one cache call.
+
+        Args:
+            user_ids: The user ids
+        """
+        cls.CACHE.delete_many(user_ids)
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """
+        Makes every cached entitlement stale by bumping the namespace version.
+        """
+        cls.CACHE.invalidate_all()
 
 
 class PlanService:
@@ -29,6 +146,50 @@ class PlanService:
             return self.downgrade_to_base()
         return False
 
+    @staticmethod
+    def downgrade_expired_trials(
+        batch_size: int = 1000, today: Optional[date] = None
+    ) -> Dict[str, int]:
+        """
+        Moves every trial that ended before today to the base plan, one batch
+        of rows per transaction and UPDATE, and drops the cached
+        entitlements of the downgraded users.
+
+        Args:
+            batch_size: The maximum number of plans downgraded per batch
+            today: The date trials are compared against, defaults to today
+
+        Returns:
+            Dictionary with the number of downgraded plans and batches
+        """
+        result = {"downgraded": 0, "batches": 0}
+        base_plan = Plan.objects.filter(type=Plan.PlanType.BASE).first()
+        if base_plan is None:
+            return result
+
+        today = today or timezone.now().date()
+        expired = UserPlan.objects.filter(is_trial=True, valid_to__lt=today)
+
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    expired.order_by("pk")
+                    .select_for_update(skip_locked=True)
+                    .values_list("pk", "user_id")[:batch_size]
+                )
+                if not rows:
+                    break
+
+                downgraded = UserPlan.objects.filter(
+                    pk__in=[pk for pk, _ in rows]
+                ).update(plan=base_plan, is_trial=False, updated_at=timezone.now())
+
+            EntitlementService.invalidate_many(user_id for _, user_id in rows)
+            result["downgraded"] += downgraded
+            result["batches"] += 1
+
+        return result
+
     def activate_ultimate(self) -> None:
         ultimate_plan = Plan.objects.get(type=Plan.PlanType.ULTIMATE)
         self.user_plan.plan = ultimate_plan
@@ -165,3 +326,162 @@ class StripeService:
             payment_method_types=["blik"],
             confirm=True,
         )
+
+
+class StripeEventError(Exception):
+    """
+    Raised when a Stripe event could not be processed yet and should be retried.
+    """
+
+
+class StripeWebhookService:
+    """
+    Class containing services related to Stripe webhook events:
+        -method for recording a verified event in the event log
+        -method for processing the pending events of a customer
+        -method for applying a single event to the customer's plan
+
+    Every event is stored once per Stripe event id, so redelivered events
+    are not processed again. Events of a customer are processed one worker
+    at a time in the order Stripe created them, and events older than an
+    already processed one are ignored as stale.
+    """
+
+    HANDLED_TYPES = (
+        "payment_intent.succeeded",
+        "invoice.paid",
+        "customer.subscription.deleted",
+    )
+    MAX_ATTEMPTS = 5
+
+    @classmethod
+    def record_event(cls, event: Dict[str, Any]) -> Tuple[StripeEvent, bool]:
+        """
+        Stores a verified event unless it was received before.
+
+        Args:
+            event: The raw Stripe event
+
+        Returns:
+            Tuple of the stored StripeEvent and whether it was newly created
+        """
+        customer_id = event["data"]["object"].get("customer")
+        if event["type"] in cls.HANDLED_TYPES and customer_id:
+            status = StripeEvent.Status.PENDING
+        else:
+            status = StripeEvent.Status.IGNORED
+
+        return StripeEvent.objects.get_or_create(
+            event_id=event["id"],
+            defaults={
+                "type": event["type"],
+                "customer_id": customer_id,
+                "payload": event,
+                "status": status,
+                "stripe_created_at": datetime.fromtimestamp(
+                    event["created"], tz=dt_timezone.utc
+                ),
+            },
+        )
+
+    @classmethod
+    def process_customer_events(cls, customer_id: str) -> int:
+        """
+        Applies the pending events of a customer, oldest first. The events
+        are locked for the duration, so concurrent calls for the same
+        customer wait instead of applying events out of order.
+
+        Args:
+            customer_id: The Stripe customer id
+
+        Returns:
+            Number of processed events
+
+        Raises:
+            StripeEventError: If an event failed and should be retried. Later
+              events of the customer are left pending until it succeeds or
+              runs out of attempts.
+        """
+        processed = 0
+        failed_event = None
+
+        with transaction.atomic():
+            events = (
+                StripeEvent.objects.select_for_update()
+                .filter(customer_id=customer_id, status=StripeEvent.Status.PENDING)
+                .order_by("stripe_created_at", "pk")
+            )
+            for event in events:
+                event.attempts += 1
+                try:
+                    with transaction.atomic():
+                        event.status = cls.apply_event(event)
+                except Exception as exc:
+                    logger.exception("Could not process Stripe event %s", event)
+                    event.last_error = repr(exc)
+                    if event.attempts >= cls.MAX_ATTEMPTS:
+                        event.status = StripeEvent.Status.FAILED
+                    else:
+                        failed_event = event
+
+                if event.status != StripeEvent.Status.PENDING:
+                    event.processed_at = timezone.now()
+                event.save(
+                    update_fields=["status", "attempts", "last_error", "processed_at"]
+                )
+
+                if failed_event is not None:
+                    break
+                if event.status == StripeEvent.Status.PROCESSED:
+                    processed += 1
+
+        if failed_event is not None:
+            raise StripeEventError(
+                f"Stripe event {failed_event.event_id} failed: {failed_event.last_error}"
+            )
+
+        return processed
+
+    @staticmethod
+    def apply_event(event: StripeEvent) -> int:
+        """
+        Changes the customer's plan according to an event.
+
+        Args:
+            event: The StripeEvent to apply
+
+        Returns:
+            The resulting StripeEvent status, PROCESSED or IGNORED
+        """
+        is_stale = StripeEvent.objects.filter(
+            customer_id=event.customer_id,
+            status=StripeEvent.Status.PROCESSED,
+            stripe_created_at__gt=event.stripe_created_at,
+        ).exists()
+        user_plan = UserPlan.objects.filter(
+            stripe_customer_id=event.customer_id
+        ).first()
+        if is_stale or user_plan is None:
+            return StripeEvent.Status.IGNORED
+
+        data_object = event.payload["data"]["object"]
+        plan_service = PlanService(user_plan=user_plan)
+
+        match event.type:
+            case "payment_intent.succeeded":
+                metadata = data_object.get("metadata") or {}
+                if metadata.get("plan_type") != "ultimate":
+                    return StripeEvent.Status.IGNORED
+                plan_service.activate_ultimate()
+            case "invoice.paid":
+                parent = data_object.get("parent") or {}
+                subscription_details = parent.get("subscription_details") or {}
+                if not subscription_details.get("subscription"):
+                    return StripeEvent.Status.IGNORED
+                plan_service.activate_premium()
+            case "customer.subscription.deleted":
+                plan_service.downgrade_to_base()
+            case _:
+                return StripeEvent.Status.IGNORED
+
+        return StripeEvent.Status.PROCESSED
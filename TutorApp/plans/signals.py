@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Plan, UserPlan
+from .services import EntitlementService
+
+
+@receiver(post_save, sender=UserPlan)
+@receiver(post_delete, sender=UserPlan)
+def invalidate_entitlement(sender, instance: UserPlan, **kwargs) -> None:
+    """
+    Drops the cached entitlement of the plan's user now and after commit.
+    Covers PlanService activations and downgrades, trial assignment and admin
+    edits alike.
+    """
+    user_id = instance.user_id
+    EntitlementService.invalidate(user_id)
+    transaction.on_commit(lambda: EntitlementService.invalidate(user_id))
+
+
+@receiver(post_save, sender=Plan)
+@receiver(post_delete, sender=Plan)
+def invalidate_all_entitlements(sender, instance: Plan, **kwargs) -> None:
+    """Drops every cached entitlement, a changed plan may change its tier."""
+    EntitlementService.invalidate_all()
+    transaction.on_commit(EntitlementService.invalidate_all)
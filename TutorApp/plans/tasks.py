@@ -0,0 +1,53 @@
+import logging
+from typing import Dict, Optional
+
+from celery import shared_task
+from django.conf import settings
+
+from .services import PlanService, StripeEventError, StripeWebhookService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(acks_late=True)
+def downgrade_expired_trials(batch_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Downgrades all expired trials to the base plan. Scheduled with Celery
+    beat, see CELERY_BEAT_SCHEDULE.
+
+    Args:
+        batch_size: Plans downgraded per batch (defaults to
+          TRIAL_EXPIRY_BATCH_SIZE).
+
+    Returns:
+        Dict with the number of downgraded plans and batches.
+    """
+    result = PlanService.downgrade_expired_trials(
+        batch_size=batch_size or settings.TRIAL_EXPIRY_BATCH_SIZE
+    )
+    logger.info(
+        "Downgraded %s expired trial(s) in %s batch(es)",
+        result["downgraded"],
+        result["batches"],
+    )
+    return result
+
+
+@shared_task(
+    autoretry_for=(StripeEventError,),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": StripeWebhookService.MAX_ATTEMPTS},
+    acks_late=True,
+)
+def process_stripe_events(customer_id: str) -> int:
+    """
+    Applies the pending webhook events of a Stripe customer in order. Routed
+    to the stripe_webhooks queue, see CELERY_TASK_ROUTES.
+
+    Args:
+        customer_id: The Stripe customer id.
+
+    Returns:
+        Number of processed events.
+    """
+    return StripeWebhookService.process_customer_events(customer_id)
@@ -1 +1,456 @@
-# Create your tests here.
+import time
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from plans.gateways import LocalStripeGateway
+from plans.middleware import EntitlementMiddleware
+from plans.models import Plan, StripeEvent, UserPlan
+from plans.services import (
+    Entitlement,
+    EntitlementService,
+    PlanService,
+    StripeEventError,
+    StripeWebhookService,
+)
+from plans.tasks import downgrade_expired_trials
+from users.factories import UserFactory
+
+
+class EntitlementServiceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.plans = {
+            plan_type: Plan.objects.create(
+                name=plan_type.label,
+                type=plan_type,
+                description="",
+                price=10,
+                billing_period="month",
+            )
+            for plan_type in Plan.PlanType
+        }
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory()
+        self.user_plan = UserPlan.objects.create(
+            user=self.user,
+            plan=self.plans[Plan.PlanType.TRIAL],
+            start_date=date.today(),
+            valid_to=date.today(),
+            is_trial=True,
+        )
+
+    def test_build_reads_plan_tier(self) -> None:
+        """Test case that checks if the entitlement matches the user's plan"""
+        with self.assertNumQueries(1):
+            entitlement = EntitlementService.build(self.user.pk)
+
+        self.assertEqual(entitlement.plan_type, Plan.PlanType.TRIAL)
+        self.assertTrue(entitlement.is_trial)
+        self.assertTrue(entitlement.is_premium_or_trial)
+        self.assertEqual(
+            entitlement.is_premium_or_trial, self.user_plan.is_premium_or_trial
+        )
+
+    def test_user_without_plan(self) -> None:
+        """Test case that checks if a user without a plan is not entitled"""
+        user = UserFactory()
+
+        entitlement = EntitlementService.get_for_user(user)
+
+        self.assertEqual(entitlement, Entitlement())
+        self.assertFalse(entitlement.is_premium_or_trial)
+
+    def test_inactive_plan_is_not_entitled(self) -> None:
+        """Test case that checks if an inactive premium plan gives no access"""
+        self.user_plan.is_active = False
+        self.user_plan.save()
+
+        self.assertFalse(EntitlementService.get_for_user(self.user).is_premium_or_trial)
+
+    def test_anonymous_user_needs_no_queries(self) -> None:
+        """Test case that checks if anonymous users are resolved without queries"""
+        with self.assertNumQueries(0):
+            entitlement = EntitlementService.get_for_user(AnonymousUser())
+
+        self.assertFalse(entitlement.is_premium_or_trial)
+
+    def test_entitlement_is_cached(self) -> None:
+        """Test case that checks if a cached entitlement is served without queries"""
+        EntitlementService.get_for_user(self.user)
+
+        with self.assertNumQueries(0):
+            entitlement = EntitlementService.get_for_user(self.user)
+
+        self.assertTrue(entitlement.is_premium_or_trial)
+
+    def test_cached_trial_expires_after_valid_to(self) -> None:
+        """Test case that checks if a cached trial stops giving access once it ends"""
+        self.assertTrue(EntitlementService.get_for_user(self.user).is_premium_or_trial)
+
+        tomorrow = timezone.now() + timedelta(days=1)
+        with mock.patch("plans.services.timezone.now", return_value=tomorrow):
+            with self.assertNumQueries(0):
+                entitlement = EntitlementService.get_for_user(self.user)
+
+            self.assertTrue(entitlement.is_expired_trial)
+            self.assertFalse(entitlement.is_premium_or_trial)
+
+    def test_downgrade_invalidates_entitlement(self) -> None:
+        """Test case that checks if downgrading a plan drops the cached entitlement"""
+        EntitlementService.get_for_user(self.user)
+
+        PlanService(self.user_plan).downgrade_to_base()
+
+        entitlement = EntitlementService.get_for_user(self.user)
+        self.assertEqual(entitlement.plan_type, Plan.PlanType.BASE)
+        self.assertFalse(entitlement.is_premium_or_trial)
+
+    def test_activation_invalidates_entitlement(self) -> None:
+        """Test case that checks if activating a plan drops the cached entitlement"""
+        PlanService(self.user_plan).downgrade_to_base()
+        self.assertFalse(EntitlementService.get_for_user(self.user).is_premium_or_trial)
+
+        PlanService(self.user_plan).activate_premium()
+
+        entitlement = EntitlementService.get_for_user(self.user)
+        self.assertEqual(entitlement.plan_type, Plan.PlanType.PREMIUM)
+        self.assertTrue(entitlement.is_premium_or_trial)
+
+    def test_plan_change_invalidates_all_entitlements(self) -> None:
+        """Test case that checks if editing a plan drops entitlements of its users"""
+        EntitlementService.get_for_user(self.user)
+
+        trial_plan = self.plans[Plan.PlanType.TRIAL]
+        trial_plan.type = Plan.PlanType.BASE
+        trial_plan.save()
+
+        self.assertFalse(EntitlementService.get_for_user(self.user).is_premium_or_trial)
+
+
+class TrialExpiryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_plan = Plan.objects.create(
+            name="Base",
+            type=Plan.PlanType.BASE,
+            description="",
+            price=0,
+            billing_period="month",
+        )
+        cls.trial_plan = Plan.objects.create(
+            name="Trial",
+            type=Plan.PlanType.TRIAL,
+            description="",
+            price=0,
+            billing_period="month",
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.today = date.today()
+
+    def _user_plan(self, valid_to, is_trial=True) -> UserPlan:
+        return UserPlan.objects.create(
+            user=UserFactory(),
+            plan=self.trial_plan,
+            start_date=self.today - timedelta(days=30),
+            valid_to=valid_to,
+            is_trial=is_trial,
+        )
+
+    def test_downgrades_only_expired_trials(self) -> None:
+        """Test case that checks if only trials that ended before today are downgraded"""
+        expired = self._user_plan(self.today - timedelta(days=1))
+        ends_today = self._user_plan(self.today)
+        not_trial = self._user_plan(self.today - timedelta(days=1), is_trial=False)
+
+        result = PlanService.downgrade_expired_trials()
+
+        self.assertEqual(result, {"downgraded": 1, "batches": 1})
+        expired.refresh_from_db()
+        self.assertEqual(expired.plan, self.base_plan)
+        self.assertFalse(expired.is_trial)
+        ends_today.refresh_from_db()
+        self.assertEqual(ends_today.plan, self.trial_plan)
+        not_trial.refresh_from_db()
+        self.assertEqual(not_trial.plan, self.trial_plan)
+
+    def test_downgrades_in_batches(self) -> None:
+        """Test case that checks if expired trials are downgraded batch by batch"""
+        for _ in range(5):
+            self._user_plan(self.today - timedelta(days=3))
+
+        with CaptureQueriesContext(connection) as queries:
+            result = PlanService.downgrade_expired_trials(batch_size=2)
+
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(result, {"downgraded": 5, "batches": 3})
+        self.assertEqual(len(updates), 3)
+        self.assertFalse(UserPlan.objects.filter(is_trial=True).exists())
+
+    def test_invalidates_entitlements_of_downgraded_users(self) -> None:
+        """Test case that checks if downgraded users lose their cached plan"""
+        user_plan = self._user_plan(self.today - timedelta(days=1))
+        entitlement = EntitlementService.get_for_user(user_plan.user)
+        self.assertEqual(entitlement.plan_type, Plan.PlanType.TRIAL)
+        self.assertFalse(entitlement.is_premium_or_trial)
+
+        PlanService.downgrade_expired_trials()
+
+        entitlement = EntitlementService.get_for_user(user_plan.user)
+        self.assertEqual(entitlement.plan_type, Plan.PlanType.BASE)
+        self.assertFalse(entitlement.is_trial)
+
+    def test_without_base_plan_nothing_is_downgraded(self) -> None:
+        """Test case that checks if trials are kept when there is no base plan"""
+        user_plan = self._user_plan(self.today - timedelta(days=1))
+        self.base_plan.delete()
+
+        result = PlanService.downgrade_expired_trials()
+
+        self.assertEqual(result, {"downgraded": 0, "batches": 0})
+        self.assertTrue(UserPlan.objects.get(pk=user_plan.pk).is_trial)
+
+    def test_task_reports_counts(self) -> None:
+        """Test case that checks if the beat task returns the downgrade counts"""
+        self._user_plan(self.today - timedelta(days=1))
+
+        result = downgrade_expired_trials.delay(batch_size=10).get()
+
+        self.assertEqual(result, {"downgraded": 1, "batches": 1})
+
+
+class EntitlementMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory()
+        self.middleware = EntitlementMiddleware(lambda request: HttpResponse())
+
+    def test_entitlement_is_resolved_once_per_request(self) -> None:
+        """Test case that checks if request.entitlement is looked up lazily and once"""
+        request = RequestFactory().get("/")
+        request.user = self.user
+
+        with self.assertNumQueries(0):
+            self.middleware(request)
+
+        with self.assertNumQueries(1):
+            request.entitlement.is_premium_or_trial
+            request.entitlement.is_trial
+
+
+class StripeWebhookTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.plans = {
+            plan_type: Plan.objects.create(
+                name=plan_type.label,
+                type=plan_type,
+                description="",
+                price=10,
+                billing_period="month",
+            )
+            for plan_type in Plan.PlanType
+        }
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.url = reverse("plans:webhook")
+        self.gateway = LocalStripeGateway()
+        self.user_plan = UserPlan.objects.create(
+            user=UserFactory(),
+            plan=self.plans[Plan.PlanType.BASE],
+            start_date=date.today(),
+            stripe_customer_id="cus_local",
+        )
+
+    def _invoice_paid(self, created=None):
+        return self.gateway.create_event(
+            "invoice.paid",
+            {
+                "object": "invoice",
+                "customer": "cus_local",
+                "parent": {"subscription_details": {"subscription": "sub_local"}},
+            },
+            created=created,
+        )
+
+    def _subscription_deleted(self, created=None):
+        return self.gateway.create_event(
+            "customer.subscription.deleted",
+            {"object": "subscription", "customer": "cus_local"},
+            created=created,
+        )
+
+    def _plan_type(self) -> int:
+        self.user_plan.refresh_from_db()
+        return self.user_plan.plan.type
+
+    def test_event_is_stored_and_processed(self) -> None:
+        """Test case that checks if a signed event is logged and applied after the response"""
+        event = self._invoice_paid()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.gateway.send(self.client, self.url, event)
+
+        self.assertEqual(response.status_code, 200)
+        stripe_event = StripeEvent.objects.get(event_id=event["id"])
+        self.assertEqual(stripe_event.status, StripeEvent.Status.PROCESSED)
+        self.assertEqual(stripe_event.attempts, 1)
+        self.assertEqual(self._plan_type(), Plan.PlanType.PREMIUM)
+
+    def test_invalid_signature_is_rejected(self) -> None:
+        """Test case that checks if events with a wrong signature are not stored"""
+        forged = LocalStripeGateway(webhook_secret="whsec_other")
+
+        response = forged.send(self.client, self.url, self._invoice_paid())
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(StripeEvent.objects.exists())
+
+    def test_redelivered_event_is_processed_once(self) -> None:
+        """Test case that checks if a redelivered processed event is not queued again"""
+        event = self._invoice_paid()
+
+        with mock.patch.object(
+            StripeWebhookService,
+            "process_customer_events",
+            wraps=StripeWebhookService.process_customer_events,
+        ) as process:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.gateway.send(self.client, self.url, event)
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.gateway.send(self.client, self.url, event)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(process.call_count, 1)
+        self.assertEqual(StripeEvent.objects.count(), 1)
+
+    def test_redelivery_requeues_event_after_failed_queueing(self) -> None:
+        """Test case that checks if an event left pending by a broker outage is queued on redelivery"""
+        event = self._invoice_paid()
+
+        with mock.patch(
+            "plans.views.plans_views.process_stripe_events.delay",
+            side_effect=OSError("broker down"),
+        ):
+            with (
+                self.assertRaises(OSError),
+                self.captureOnCommitCallbacks(execute=True),
+            ):
+                self.gateway.send(self.client, self.url, event)
+
+        stripe_event = StripeEvent.objects.get(event_id=event["id"])
+        self.assertEqual(stripe_event.status, StripeEvent.Status.PENDING)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.gateway.send(self.client, self.url, event)
+
+        self.assertEqual(response.status_code, 200)
+        stripe_event.refresh_from_db()
+        self.assertEqual(stripe_event.status, StripeEvent.Status.PROCESSED)
+        self.assertEqual(self._plan_type(), Plan.PlanType.PREMIUM)
+
+    def test_unhandled_event_is_ignored(self) -> None:
+        """Test case that checks if events without a handler are logged but not queued"""
+        event = self.gateway.create_event(
+            "customer.created", {"object": "customer", "id": "cus_local"}
+        )
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.gateway.send(self.client, self.url, event)
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(
+            StripeEvent.objects.get(event_id=event["id"]).status,
+            StripeEvent.Status.IGNORED,
+        )
+
+    def test_events_are_applied_in_creation_order(self) -> None:
+        """Test case that checks if pending events of a customer are applied oldest first"""
+        now = int(time.time())
+        StripeWebhookService.record_event(self._subscription_deleted(created=now))
+        StripeWebhookService.record_event(self._invoice_paid(created=now - 60))
+
+        processed = StripeWebhookService.process_customer_events("cus_local")
+
+        self.assertEqual(processed, 2)
+        self.assertEqual(self._plan_type(), Plan.PlanType.BASE)
+
+    def test_stale_event_is_ignored(self) -> None:
+        """Test case that checks if an event older than a processed one is not applied"""
+        now = int(time.time())
+        StripeWebhookService.record_event(self._invoice_paid(created=now))
+        StripeWebhookService.process_customer_events("cus_local")
+
+        stale_event, _ = StripeWebhookService.record_event(
+            self._subscription_deleted(created=now - 60)
+        )
+        StripeWebhookService.process_customer_events("cus_local")
+
+        stale_event.refresh_from_db()
+        self.assertEqual(stale_event.status, StripeEvent.Status.IGNORED)
+        self.assertEqual(self._plan_type(), Plan.PlanType.PREMIUM)
+
+    def test_failed_event_holds_back_later_events(self) -> None:
+        """Test case that checks if a failing event is retried before later events"""
+        now = int(time.time())
+        failing, _ = StripeWebhookService.record_event(
+            self._invoice_paid(created=now - 60)
+        )
+        later, _ = StripeWebhookService.record_event(
+            self._subscription_deleted(created=now)
+        )
+
+        with mock.patch.object(
+            PlanService, "activate_premium", side_effect=RuntimeError("db down")
+        ):
+            with (
+                self.assertRaises(StripeEventError),
+                self.assertLogs("plans.services", "ERROR"),
+            ):
+                StripeWebhookService.process_customer_events("cus_local")
+
+        failing.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual(failing.status, StripeEvent.Status.PENDING)
+        self.assertEqual(failing.attempts, 1)
+        self.assertIn("db down", failing.last_error)
+        self.assertEqual(later.status, StripeEvent.Status.PENDING)
+
+        StripeWebhookService.process_customer_events("cus_local")
+
+        failing.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual(failing.status, StripeEvent.Status.PROCESSED)
+        self.assertEqual(later.status, StripeEvent.Status.PROCESSED)
+        self.assertEqual(self._plan_type(), Plan.PlanType.BASE)
+
+    def test_event_fails_after_max_attempts(self) -> None:
+        """Test case that checks if an event stops blocking the queue after its last attempt"""
+        failing, _ = StripeWebhookService.record_event(self._invoice_paid())
+        StripeEvent.objects.filter(pk=failing.pk).update(
+            attempts=StripeWebhookService.MAX_ATTEMPTS - 1
+        )
+
+        with (
+            mock.patch.object(
+                PlanService, "activate_premium", side_effect=RuntimeError("db down")
+            ),
+            self.assertLogs("plans.services", "ERROR"),
+        ):
+            processed = StripeWebhookService.process_customer_events("cus_local")
+
+        failing.refresh_from_db()
+        self.assertEqual(processed, 0)
+        self.assertEqual(failing.status, StripeEvent.Status.FAILED)
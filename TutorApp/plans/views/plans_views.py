@@ -4,6 +4,7 @@ from datetime import date
 import stripe
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, render
@@ -11,8 +12,10 @@ from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import ListView
-from plans.models import Plan, UserPlan
-from plans.services import PlanService, StripeService
+from plans.gateways import StripeGateway
+from plans.models import Plan, StripeEvent, UserPlan
+from plans.services import PlanService, StripeService, StripeWebhookService
+from plans.tasks import process_stripe_events
 
 
 class PlansListView(LoginRequiredMixin, ListView):
@@ -118,62 +121,27 @@ class ConfirmPlanView(LoginRequiredMixin, View):
 
 @method_decorator(csrf_exempt, name="dispatch")
 class StripeWebhookView(View):
-    def post(self, request):
-        payload = request.body
-        sig_header = request.META.get("HTTP_STRIPE_SIGNATURE")
+    """
+    Verifies and stores Stripe events, leaving their processing to Celery,
+    so Stripe gets its response without waiting for plan changes.
+    """
+
+    gateway_class = StripeGateway
 
+    def post(self, request):
         try:
-            event = stripe.Webhook.construct_event(
-                payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
+            event = self.gateway_class().construct_event(
+                request.body, request.META.get("HTTP_STRIPE_SIGNATURE", "")
             )
-        except stripe.error.SignatureVerificationError:
+        except (ValueError, stripe.error.SignatureVerificationError):
             return HttpResponse(status=400)
 
-        if event.type == "payment_intent.succeeded":
-            payment_intent = event.data.object.to_dict()
-            metadata = payment_intent.get("metadata", {})
-
-            if metadata.get("plan_type") != "ultimate":
-                return HttpResponse(status=200)
-
-            customer_id = payment_intent.get("customer")
-            try:
-                user_plan = UserPlan.objects.get(stripe_customer_id=customer_id)
-            except UserPlan.DoesNotExist:
-                return HttpResponse(status=400)
-
-            PlanService(user_plan=user_plan).activate_ultimate()
-
-        elif event.type == "invoice.paid":
-            invoice = event.data.object.to_dict()
-            parent = invoice.get("parent", {})
-            subscription_details = parent.get("subscription_details", {})
-            subscription_id = (
-                subscription_details.get("subscription")
-                if subscription_details
-                else None
+        # Queued again for redeliveries of pending events, so an event whose
+        # first queueing failed is not stuck. Processing is idempotent.
+        stripe_event, _ = StripeWebhookService.record_event(event)
+        if stripe_event.status == StripeEvent.Status.PENDING:
+            transaction.on_commit(
+                lambda: process_stripe_events.delay(stripe_event.customer_id)
             )
 
-            if not subscription_id:
-                return HttpResponse(status=200)
-
-            subscription = stripe.Subscription.retrieve(subscription_id)
-            customer_id = subscription.customer
-
-            try:
-                user_plan = UserPlan.objects.get(stripe_customer_id=customer_id)
-            except UserPlan.DoesNotExist:
-                return HttpResponse(status=400)
-
-            PlanService(user_plan=user_plan).activate_premium()
-
-        elif event.type == "customer.subscription.deleted":
-            subscription = event.data.object.to_dict()
-            customer_id = subscription.get("customer")
-            try:
-                user_plan = UserPlan.objects.get(stripe_customer_id=customer_id)
-            except UserPlan.DoesNotExist:
-                return HttpResponse(status=400)
-            PlanService(user_plan=user_plan).downgrade_to_base()
-
         return HttpResponse(status=200)
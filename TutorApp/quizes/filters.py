@@ -1,20 +1,18 @@
 import django_filters
+from core.filters import FuzzyCharFilter
+from core.forms import FuzzyModelSelect2Widget
 from courses.choices import SubjectChoices
 from courses.models import Section
 from django import forms
-from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
-from django_select2.forms import ModelSelect2Widget
 from quizes.models import Quiz
 
 
 class QuizFilterSet(django_filters.FilterSet):
 
-    title = django_filters.CharFilter(
+    title = FuzzyCharFilter(
         field_name="title",
-        lookup_expr="icontains",
         label=_("Title"),
-        method="filter_strip_title",
         widget=forms.TextInput(
             attrs={
                 "placeholder": _("Search by title"),
@@ -26,9 +24,9 @@ class QuizFilterSet(django_filters.FilterSet):
         queryset=Section.objects.all(),
         label=_("Section"),
         empty_label=_("All Sections"),
-        widget=ModelSelect2Widget(
+        widget=FuzzyModelSelect2Widget(
             model=Section,
-            search_fields=["name__icontains"],
+            search_fields=["name"],
             attrs={
                 "data-placeholder": _("Search Section"),
                 "data-allow-clear": "true",
@@ -47,13 +45,3 @@ class QuizFilterSet(django_filters.FilterSet):
     class Meta:
         model = Quiz
         fields = ["title", "section"]
-
-    def filter_strip_title(
-        self, queryset: QuerySet[Quiz], name: str, value: str
-    ) -> QuerySet[Quiz]:
-        if value:
-            stripped_value: str = value.strip()
-            lookup: str = f"{name}__icontains"
-            return queryset.filter(**{lookup: stripped_value})
-
-        return queryset
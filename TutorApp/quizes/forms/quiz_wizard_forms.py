@@ -1,4 +1,5 @@
 from django import forms
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from examination_tasks.choices import LEVEL_CHOICES
 
@@ -24,6 +25,13 @@ class QuizStartForm(forms.Form):
         ("all", _("All questions")),
     ]
 
+    SOLVE_MODE_WIZARD = "wizard"
+    SOLVE_MODE_SINGLE_PAGE = "single_page"
+    SOLVE_MODE_CHOICES = [
+        (SOLVE_MODE_WIZARD, _("One question per page")),
+        (SOLVE_MODE_SINGLE_PAGE, _("All questions on one page")),
+    ]
+
     question_count = forms.ChoiceField(
         choices=QUESTION_CHOICES,
         widget=forms.Select,
@@ -38,6 +46,13 @@ class QuizStartForm(forms.Form):
         initial=1,
     )
 
+    solve_mode = forms.ChoiceField(
+        choices=SOLVE_MODE_CHOICES,
+        label=_("Solve mode"),
+        widget=forms.Select,
+        initial=SOLVE_MODE_WIZARD,
+    )
+
     def __init__(self, quiz: Quiz, *args, **kwargs):
         self.quiz = quiz
         super().__init__(*args, **kwargs)
@@ -68,3 +83,31 @@ class QuizStartForm(forms.Form):
             )
 
         return question_count
+
+    def clean(self) -> dict:
+        cleaned_data = super().clean()
+        question_count = cleaned_data.get("question_count")
+        level_type = cleaned_data.get("level_type")
+
+        if not question_count or not level_type:
+            return cleaned_data
+
+        available_questions = self.quiz.questions.filter(
+            Q(level_type=level_type) | Q(level_type__isnull=True)
+        ).count()
+
+        if available_questions == 0:
+            self.add_error(
+                "level_type", _("This quiz has no questions for the selected level.")
+            )
+        elif question_count != "all" and available_questions < int(question_count):
+            self.add_error(
+                "question_count",
+                _(
+                    "This quiz has only %(available)d question(s) for the selected "
+                    "level. You cannot select %(requested)d."
+                )
+                % {"available": available_questions, "requested": int(question_count)},
+            )
+
+        return cleaned_data
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from quizes.models import Quiz
+from quizes.services.quiz_statistics_services import QuizStatisticsService
+
+
+class Command(BaseCommand):
+    help = "Rebuild quiz and question statistics from all saved attempts"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "quiz_ids",
+            nargs="*",
+            type=int,
+            help="Ids of quizzes to rebuild (defaults to all quizzes)",
+        )
+
+    def handle(self, *args, **options):
+        quizzes = Quiz.objects.all()
+        if options["quiz_ids"]:
+            quizzes = quizzes.filter(id__in=options["quiz_ids"])
+
+        for quiz in quizzes.iterator():
+            statistics = QuizStatisticsService.rebuild(quiz)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Rebuilt: {quiz.title} ({statistics.attempt_count} attempts)"
+                )
+            )
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:37
+
+import django.contrib.postgres.indexes
+import django.db.models
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0014_trigram_search"),
+        ("quizes", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="quiz",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.Func(
+                        django.db.models.functions.text.Lower("title"),
+                        function="immutable_unaccent",
+                        output_field=django.db.models.TextField(),
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="quiz_title_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:47
+
+import django.db.models.deletion
+import quizes.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizes", "0003_trigram_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuestionStatistics",
+            fields=[
+                (
+                    "question",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="statistics",
+                        serialize=False,
+                        to="quizes.question",
+                    ),
+                ),
+                ("times_shown", models.PositiveIntegerField(default=0)),
+                ("times_fully_correct", models.PositiveIntegerField(default=0)),
+                ("points_sum", models.FloatField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "Question statistics",
+            },
+        ),
+        migrations.CreateModel(
+            name="QuizStatistics",
+            fields=[
+                (
+                    "quiz",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="statistics",
+                        serialize=False,
+                        to="quizes.quiz",
+                    ),
+                ),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("score_percent_sum", models.FloatField(default=0)),
+                (
+                    "score_histogram",
+                    models.JSONField(default=quizes.models.empty_score_histogram),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name_plural": "Quiz statistics",
+            },
+        ),
+    ]
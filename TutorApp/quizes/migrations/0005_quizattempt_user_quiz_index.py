@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizes", "0004_statistics"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="quizattempt",
+            index=models.Index(
+                fields=["user", "quiz", "-completed_at"],
+                name="quizattempt_user_quiz_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from core.search import trigram_index
 from courses.models import Section
 from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser
@@ -22,6 +23,7 @@ class Quiz(models.Model):
     class Meta:
         verbose_name_plural = "Quizzes"
         ordering = ["section", "title"]
+        indexes = [trigram_index("title", "quiz_title_trgm_idx")]
 
     def __str__(self):
         return f"{self.title} {self.section}"
@@ -50,40 +52,6 @@ class Quiz(models.Model):
             quiz=self, user=user, completed_at__isnull=False
         ).first()
 
-    def get_random_questions(self, number_of_questions: int) -> List["Question"]:
-        """
-        Return a list of randomly selected questions for  quiz.
-
-        Args:
-        number_of_questions: The number of questions to pick
-
-
-        Returns:
-        List of Question objects
-
-        Raises:
-            ValueError: If number_of_questions is not positive or exceeds available questions"
-
-        """
-
-        available_questions = self.questions.count()
-
-        if number_of_questions <= 0:
-            raise ValueError(_("Number of questions must be positive"))
-
-        if number_of_questions > available_questions:
-            raise ValueError(
-                _(
-                    "Cannot request %(requested)d questions. Only %(available)d available."
-                )
-                % {"requested": number_of_questions, "available": available_questions}
-            )
-
-        questions = self.questions.order_by("?")
-        questions = questions[:number_of_questions]
-
-        return list(questions)
-
 
 class Question(models.Model):
     text = models.TextField()
@@ -137,6 +105,12 @@ class QuizAttempt(models.Model):
 
     class Meta:
         ordering = ["-completed_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "quiz", "-completed_at"],
+                name="quizattempt_user_quiz_idx",
+            )
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.quiz} - {self.score}/{self.max_score}"
@@ -164,3 +138,114 @@ class UserAnswer(models.Model):
 
     def __str__(self):
         return f"{self.attempt.user} - Q{self.question.id} - {self.points_earned}pts"
+
+
+def empty_score_histogram() -> List[int]:
+    """
+    Attempt counts for every whole score percentage from 0 to 100.
+    """
+    return [0] * 101
+
+
+class QuizStatistics(models.Model):
+    """
+    Aggregates over all attempts of a quiz, updated together with every saved
+    attempt so they can be read without scanning QuizAttempt.
+    """
+
+    quiz = models.OneToOneField(
+        Quiz,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="statistics",
+    )
+    attempt_count = models.PositiveIntegerField(default=0)
+    score_percent_sum = models.FloatField(default=0)
+    score_histogram = models.JSONField(default=empty_score_histogram)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Quiz statistics"
+
+    def __str__(self):
+        return f"{self.quiz} - {self.attempt_count} attempts"
+
+    @property
+    def mean_score_percent(self) -> Optional[float]:
+        """
+        Mean attempt score as a percentage of the max score.
+        """
+        if not self.attempt_count:
+            return None
+        return round(self.score_percent_sum / self.attempt_count, 2)
+
+    def score_percentile(self, percentile: float) -> Optional[int]:
+        """
+        Return the score percentage below or at which the given share of
+        attempts fall, with a precision of one percentage point.
+
+        Args:
+        percentile: Percentile between 0 and 100, e.g. 50 for the median
+
+
+        Returns:
+        Score percentage, or None if the quiz has no attempts
+
+        Raises:
+            ValueError: If percentile is outside of 0-100
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(_("Percentile must be between 0 and 100"))
+
+        if not self.attempt_count:
+            return None
+
+        threshold = percentile / 100 * self.attempt_count
+        cumulative = 0
+        for score_percent, count in enumerate(self.score_histogram):
+            cumulative += count
+            if count and cumulative >= threshold:
+                return score_percent
+
+        return len(self.score_histogram) - 1
+
+
+class QuestionStatistics(models.Model):
+    """
+    Aggregates over all answers given to a question, updated together with
+    every saved attempt.
+    """
+
+    question = models.OneToOneField(
+        Question,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="statistics",
+    )
+    times_shown = models.PositiveIntegerField(default=0)
+    times_fully_correct = models.PositiveIntegerField(default=0)
+    points_sum = models.FloatField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Question statistics"
+
+    def __str__(self):
+        return f"Q{self.question_id} - {self.times_fully_correct}/{self.times_shown}"
+
+    @property
+    def average_points(self) -> Optional[float]:
+        """
+        Average points earned for the question, between 0 and 1.
+        """
+        if not self.times_shown:
+            return None
+        return round(self.points_sum / self.times_shown, 2)
+
+    @property
+    def fully_correct_rate(self) -> Optional[float]:
+        """
+        Share of answers that selected exactly the correct answers.
+        """
+        if not self.times_shown:
+            return None
+        return round(self.times_fully_correct / self.times_shown, 2)
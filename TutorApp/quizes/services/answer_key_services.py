@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet
+
+from core.cache import CacheNamespace
+
+from ..models import Answer
+
+
+@dataclass(frozen=True)
+class QuestionKey:
+    """
+    Ids of the correct and incorrect answers of a single question.
+    """
+
+    correct: FrozenSet[int]
+    incorrect: FrozenSet[int]
+
+
+class AnswerKeyService:
+    """
+    Class containing services related to quiz answer keys:
+        -method for getting the cached answer key of a quiz
+        -method for building the answer key from the database
+        -method for invalidating the cached answer key
+
+    An answer key maps question ids to QuestionKey objects, so answers can be
+    graded in memory without querying the database for every question.
+    """
+
+    CACHE = CacheNamespace("quizes:answer_key", timeout=60 * 60 * 24)
+
+    @classmethod
+    def get_for_quiz(cls, quiz_id: int) -> Dict[int, QuestionKey]:
+        """
+        Returns the answer key of a quiz, building and caching it on a miss.
+
+        Args:
+            quiz_id: The quiz id
+
+        Returns:
+            Dictionary mapping question ids to their QuestionKey
+        """
+        return cls.CACHE.get_or_set(quiz_id, lambda: cls.build(quiz_id))
+
+    @staticmethod
+    def build(quiz_id: int) -> Dict[int, QuestionKey]:
+        """
+        Builds the answer key of a quiz with a single query.
+
+        Args:
+            quiz_id: The quiz id
+
+        Returns:
+            Dictionary mapping question ids to their QuestionKey.
+            Questions without answers are left out.
+        """
+        correct: Dict[int, set] = {}
+        incorrect: Dict[int, set] = {}
+
+        rows = Answer.objects.filter(question__quiz_id=quiz_id).values_list(
+            "question_id", "id", "is_correct"
+        )
+        for question_id, answer_id, is_correct in rows:
+            correct.setdefault(question_id, set())
+            incorrect.setdefault(question_id, set())
+            if is_correct:
+                correct[question_id].add(answer_id)
+            else:
+                incorrect[question_id].add(answer_id)
+
+        return {
+            question_id: QuestionKey(
+                correct=frozenset(correct[question_id]),
+                incorrect=frozenset(incorrect[question_id]),
+            )
+            for question_id in correct
+        }
+
+    @classmethod
+    def invalidate(cls, quiz_id: int) -> None:
+        """
+        Removes the cached answer key of a quiz.
+
+        Args:
+            quiz_id: The quiz id
+        """
+        cls.CACHE.delete(quiz_id)
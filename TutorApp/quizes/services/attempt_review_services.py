@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from core.cache import CacheNamespace
+
+from ..models import QuizAttempt, UserAnswer
+
+
+@dataclass(frozen=True)
+class ReviewAnswer:
+    """
+    An answer choice of a reviewed question.
+    """
+
+    id: int
+    text: str
+    is_correct: bool
+    is_selected: bool
+
+
+@dataclass(frozen=True)
+class ReviewQuestion:
+    """
+    A question of a reviewed attempt with the user's result.
+    """
+
+    question_id: int
+    text: str
+    picture_url: Optional[str]
+    explanation: str
+    explanation_picture_url: Optional[str]
+    points_earned: float
+    answers: Tuple[ReviewAnswer, ...]
+
+    @property
+    def correct_answers(self) -> Tuple[ReviewAnswer, ...]:
+        return tuple(answer for answer in self.answers if answer.is_correct)
+
+
+@dataclass(frozen=True)
+class AttemptReview:
+    """
+    Everything needed to review an attempt, ordered by question id.
+    """
+
+    attempt_id: int
+    user_id: int
+    questions: Tuple[ReviewQuestion, ...]
+
+
+class AttemptReviewService:
+    """
+    Class containing services related to reviewing quiz attempts:
+        -method for getting the cached review of an attempt
+        -method for building the review from the database
+        -method for invalidating the review of a single attempt
+        -method for invalidating the reviews of all attempts
+
+    A review is built once per attempt and then serves every question number
+    from cache. Editing questions or answers bumps a version that is part of
+    the cache key, since the attempts showing them are not known up front.
+    """
+
+    CACHE = CacheNamespace(
+        "quizes:attempt_review", timeout=60 * 60 * 24, versioned=True
+    )
+
+    @classmethod
+    def get_for_attempt(cls, attempt_id: int) -> Optional[AttemptReview]:
+        """
+        Returns the review of an attempt, building and caching it on a miss.
+
+        Args:
+            attempt_id: The attempt id
+
+        Returns:
+            AttemptReview, or None if the attempt does not exist
+        """
+        return cls.CACHE.get_or_set(attempt_id, lambda: cls.build(attempt_id))
+
+    @staticmethod
+    def build(attempt_id: int) -> Optional[AttemptReview]:
+        """
+        Builds the review of an attempt with a fixed number of queries.
+
+        Args:
+            attempt_id: The attempt id
+
+        Returns:
+            AttemptReview, or None if the attempt does not exist
+        """
+        user_id = (
+            QuizAttempt.objects.filter(pk=attempt_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        if user_id is None:
+            return None
+
+        user_answers = (
+            UserAnswer.objects.filter(attempt_id=attempt_id)
+            .select_related("question")
+            .prefetch_related("selected_answers", "question__answers")
+            .order_by("question__id")
+        )
+
+        questions = []
+        for user_answer in user_answers:
+            question = user_answer.question
+            selected_ids = {answer.id for answer in user_answer.selected_answers.all()}
+            questions.append(
+                ReviewQuestion(
+                    question_id=question.id,
+                    text=question.text,
+                    picture_url=question.picture.url if question.picture else None,
+                    explanation=question.explanation,
+                    explanation_picture_url=(
+                        question.explanation_picture.url
+                        if question.explanation_picture
+                        else None
+                    ),
+                    points_earned=user_answer.points_earned,
+                    answers=tuple(
+                        ReviewAnswer(
+                            id=answer.id,
+                            text=answer.text,
+                            is_correct=answer.is_correct,
+                            is_selected=answer.id in selected_ids,
+                        )
+                        for answer in question.answers.all()
+                    ),
+                )
+            )
+
+        return AttemptReview(
+            attempt_id=attempt_id, user_id=user_id, questions=tuple(questions)
+        )
+
+    @classmethod
+    def invalidate(cls, attempt_id: int) -> None:
+        """
+        Removes the cached review of an attempt.
+
+        Args:
+            attempt_id: The attempt id
+        """
+        cls.CACHE.delete(attempt_id)
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """
+        Makes every cached review stale by bumping the namespace version.
+        """
+        cls.CACHE.invalidate_all()
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from core.cache import CacheNamespace
+
+from ..models import QuizAttempt
+
+
+@dataclass(frozen=True)
+class LastAttempt:
+    """
+    The latest completed attempt of a user at a quiz.
+    """
+
+    id: int
+    quiz_id: int
+    score: float
+    max_score: int
+    completed_at: datetime
+
+
+class LastAttemptService:
+    """
+    Class containing services related to the latest attempts of users:
+        -method for getting the cached latest attempts of a user
+        -method for getting the cached latest attempt of a user at a quiz
+        -method for building the latest attempts from the database
+        -method for invalidating the cached latest attempts of a user
+
+    Latest attempts of a user are read with a single DISTINCT ON query served
+    by the (user, quiz, completed_at) index and cached until the user saves
+    or deletes an attempt.
+    """
+
+    CACHE = CacheNamespace("quizes:last_attempts", timeout=60 * 60 * 24)
+
+    @classmethod
+    def get_for_user(cls, user_id: int) -> Dict[int, LastAttempt]:
+        """
+        Returns the latest attempts of a user, building and caching them on a miss.
+
+        Args:
+            user_id: The user id
+
+        Returns:
+            Dictionary mapping quiz ids to the user's latest attempt at the quiz
+        """
+        return cls.CACHE.get_or_set(user_id, lambda: cls.build(user_id))
+
+    @classmethod
+    def get_for_quiz(cls, user_id: int, quiz_id: int) -> Optional[LastAttempt]:
+        """
+        Returns the latest attempt of a user at a quiz.
+
+        Args:
+            user_id: The user id
+            quiz_id: The quiz id
+
+        Returns:
+            The latest LastAttempt, or None if the user has never completed the quiz
+        """
+        return cls.get_for_user(user_id).get(quiz_id)
+
+    @staticmethod
+    def build(user_id: int) -> Dict[int, LastAttempt]:
+        """
+        Reads the latest completed attempt at every quiz of a user in one query.
+
+        Args:
+            user_id: The user id
+
+        Returns:
+            Dictionary mapping quiz ids to the user's latest attempt at the quiz
+        """
+        rows = (
+            QuizAttempt.objects.filter(user_id=user_id, completed_at__isnull=False)
+            .order_by("quiz_id", "-completed_at")
+            .distinct("quiz_id")
+            .values_list("id", "quiz_id", "score", "max_score", "completed_at")
+        )
+
+        return {row[1]: LastAttempt(*row) for row in rows}
+
+    @classmethod
+    def invalidate(cls, user_id: int) -> None:
+        """
+        Removes the cached latest attempts of a user.
+
+        Args:
+            user_id: The user id
+        """
+        cls.CACHE.delete(user_id)
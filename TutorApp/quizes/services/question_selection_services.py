@@ -0,0 +1,192 @@
+import heapq
+import secrets
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from core.cache import CacheNamespace
+from django.db.models import Count
+from django.utils.translation import gettext_lazy as _
+from users.models import User
+
+from ..models import Question, UserAnswer
+from .quiz_statistics_services import FULL_POINTS
+
+_random = secrets.SystemRandom()
+
+
+@dataclass(frozen=True)
+class QuestionCandidate:
+    """
+    A question that can be drawn for an attempt, with its difficulty between
+    0 (always answered correctly) and 1 (never answered correctly).
+    """
+
+    id: int
+    level_type: Optional[int]
+    difficulty: float
+
+
+class QuestionSelectionService:
+    """
+    Class containing services related to adaptive question selection:
+        -method for drawing questions for an attempt
+        -method for getting the cached candidate pool of a quiz
+        -method for building the candidate pool from the database
+        -method for counting the questions a user got wrong before
+        -method for invalidating the cached candidate pool
+
+    Questions are filtered by level and drawn with weighted sampling without
+    replacement, favouring difficult questions and questions the user missed
+    in earlier attempts. The candidate pool of a quiz is kept in cache, so a
+    draw reads only the user's misses from the database.
+    """
+
+    CACHE = CacheNamespace("quizes:question_pool", timeout=60 * 60)
+
+    MIN_TIMES_SHOWN = 5
+    DEFAULT_DIFFICULTY = 0.5
+    DIFFICULTY_WEIGHT = 1.0
+    MISS_WEIGHT = 1.0
+    MAX_MISSES = 3
+
+    @classmethod
+    def draw(
+        cls,
+        quiz_id: int,
+        user: User,
+        number_of_questions: Optional[int] = None,
+        level_type: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Draws question ids for an attempt, most heavily weighted first.
+
+        Args:
+            quiz_id: The quiz id
+            user: The user solving the quiz
+            number_of_questions: The number of questions to pick, or None for
+              all questions of the level
+            level_type: Level to draw questions of, or None for every level.
+              Questions without a level are drawn for every level.
+
+        Returns:
+            List of Question ids
+
+        Raises:
+            ValueError: If number_of_questions is not positive or exceeds
+              the questions available for the level
+        """
+        candidates = [
+            candidate
+            for candidate in cls.get_pool(quiz_id)
+            if level_type is None
+            or candidate.level_type is None
+            or candidate.level_type == level_type
+        ]
+        available_questions = len(candidates)
+
+        if number_of_questions is None:
+            number_of_questions = available_questions
+
+        if number_of_questions <= 0:
+            raise ValueError(_("Number of questions must be positive"))
+
+        if number_of_questions > available_questions:
+            raise ValueError(
+                _(
+                    "Cannot request %(requested)d questions. Only %(available)d available."
+                )
+                % {"requested": number_of_questions, "available": available_questions}
+            )
+
+        misses = cls.get_misses(user, quiz_id)
+
+        def sort_key(candidate: QuestionCandidate) -> float:
+            weight = (
+                1.0
+                + cls.DIFFICULTY_WEIGHT * candidate.difficulty
+                + cls.MISS_WEIGHT * min(misses.get(candidate.id, 0), cls.MAX_MISSES)
+            )
+            # Efraimidis-Spirakis: the k largest of u ** (1 / weight) form a
+            # weighted sample without replacement.
+            return _random.random() ** (1.0 / weight)
+
+        selected = heapq.nlargest(number_of_questions, candidates, key=sort_key)
+
+        return [candidate.id for candidate in selected]
+
+    @classmethod
+    def get_pool(cls, quiz_id: int) -> List[QuestionCandidate]:
+        """
+        Returns the candidate pool of a quiz, building and caching it on a miss.
+
+        Args:
+            quiz_id: The quiz id
+
+        Returns:
+            List of QuestionCandidate objects
+        """
+        return cls.CACHE.get_or_set(quiz_id, lambda: cls.build_pool(quiz_id))
+
+    @classmethod
+    def build_pool(cls, quiz_id: int) -> List[QuestionCandidate]:
+        """
+        Builds the candidate pool of a quiz with a single query. Difficulty
+        comes from QuestionStatistics once a question was shown often enough.
+
+        Args:
+            quiz_id: The quiz id
+
+        Returns:
+            List of QuestionCandidate objects
+        """
+        rows = Question.objects.filter(quiz_id=quiz_id).values_list(
+            "id",
+            "level_type",
+            "statistics__times_shown",
+            "statistics__points_sum",
+        )
+
+        pool = []
+        for question_id, level_type, times_shown, points_sum in rows:
+            if times_shown and times_shown >= cls.MIN_TIMES_SHOWN:
+                difficulty = 1.0 - points_sum / times_shown
+            else:
+                difficulty = cls.DEFAULT_DIFFICULTY
+            pool.append(QuestionCandidate(question_id, level_type, difficulty))
+
+        return pool
+
+    @staticmethod
+    def get_misses(user: User, quiz_id: int) -> Dict[int, int]:
+        """
+        Counts how many times a user did not answer each question fully correctly.
+
+        Args:
+            user: The user object
+            quiz_id: The quiz id
+
+        Returns:
+            Dictionary mapping question ids to the number of misses
+        """
+        rows = (
+            UserAnswer.objects.filter(
+                attempt__user=user,
+                attempt__quiz_id=quiz_id,
+                points_earned__lt=FULL_POINTS,
+            )
+            .order_by()
+            .values("question_id")
+            .annotate(misses=Count("id"))
+        )
+
+        return {row["question_id"]: row["misses"] for row in rows}
+
+    @classmethod
+    def invalidate(cls, quiz_id: int) -> None:
+        """
+        Removes the cached candidate pool of a quiz.
+
+        Args:
+            quiz_id: The quiz id
+        """
+        cls.CACHE.delete(quiz_id)
@@ -0,0 +1,103 @@
+from typing import Any, Dict, List
+
+from core.cache import CacheNamespace
+
+from ..models import Question
+
+QuizBundle = Dict[int, Question]
+
+
+class QuizBundleService:
+    """
+    Class containing services related to the question bundle of a quiz attempt:
+        -method for getting the cached bundle of drawn questions
+        -method for loading the bundle from the database
+        -method for serializing the bundle for client-side solving
+        -method for dropping the bundle once the attempt is finished
+
+    A bundle maps the ids of the questions drawn for an attempt to Question
+    objects with their answers prefetched, so wizard steps can render
+    questions and answer choices without querying the database.
+    """
+
+    CACHE = CacheNamespace("quizes:bundle", timeout=60 * 60 * 3)
+
+    @classmethod
+    def get_bundle(cls, attempt_key: str, question_ids: List[int]) -> QuizBundle:
+        """
+        Returns the question bundle of an attempt, loading and caching it on a miss.
+
+        Args:
+            attempt_key: Key identifying the attempt (its question draw)
+            question_ids: Ids of the questions drawn for the attempt
+
+        Returns:
+            Dictionary mapping question ids to Question objects
+        """
+        bundle = cls.CACHE.get(attempt_key)
+
+        if bundle is None or set(bundle) != set(question_ids):
+            bundle = cls.load(question_ids)
+            cls.CACHE.set(attempt_key, bundle)
+
+        return bundle
+
+    @staticmethod
+    def load(question_ids: List[int]) -> QuizBundle:
+        """
+        Loads questions with their answers in two queries.
+
+        Args:
+            question_ids: Ids of the questions to load
+
+        Returns:
+            Dictionary mapping question ids to Question objects, in the order
+            of question_ids. Questions deleted in the meantime are left out.
+        """
+        questions = (
+            Question.objects.filter(id__in=question_ids)
+            .select_related("quiz")
+            .prefetch_related("answers")
+            .in_bulk()
+        )
+
+        return {
+            question_id: questions[question_id]
+            for question_id in question_ids
+            if question_id in questions
+        }
+
+    @staticmethod
+    def to_payload(bundle: QuizBundle) -> List[Dict[str, Any]]:
+        """
+        Serializes a bundle for the single-page solve mode. Only data needed to
+        display the questions is included, never which answers are correct.
+
+        Args:
+            bundle: Question bundle of an attempt
+
+        Returns:
+            List of questions with their answer choices, in the order of the draw
+        """
+        return [
+            {
+                "id": question.id,
+                "text": question.text,
+                "picture": question.picture.url if question.picture else None,
+                "answers": [
+                    {"id": answer.id, "text": answer.text}
+                    for answer in question.answers.all()
+                ],
+            }
+            for question in bundle.values()
+        ]
+
+    @classmethod
+    def invalidate(cls, attempt_key: str) -> None:
+        """
+        Removes the cached bundle of an attempt.
+
+        Args:
+            attempt_key: Key identifying the attempt
+        """
+        cls.CACHE.delete(attempt_key)
@@ -0,0 +1,189 @@
+from typing import Dict
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    FloatField,
+    Func,
+    IntegerField,
+    JSONField,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+from ..models import (
+    QuestionStatistics,
+    Quiz,
+    QuizAttempt,
+    QuizStatistics,
+    UserAnswer,
+    empty_score_histogram,
+)
+
+FULL_POINTS = 1.0
+
+
+class QuizStatisticsService:
+    """
+    Class containing services related to quiz statistics:
+        -method for adding a saved attempt to the quiz and question statistics
+        -method for rebuilding the statistics of a quiz from all its attempts
+
+    Statistics are updated incrementally with a constant number of queries per
+    attempt, so reading them never requires scanning attempts or answers.
+    """
+
+    @staticmethod
+    def score_percent(score: float, max_score: float) -> int:
+        """
+        Converts an attempt score to a whole percentage of the max score.
+        """
+        return min(100, max(0, round(score / max_score * 100)))
+
+    @classmethod
+    def record_attempt(
+        cls, attempt: QuizAttempt, question_scores: Dict[int, float]
+    ) -> None:
+        """
+        Adds a saved attempt to the statistics of its quiz and questions.
+        Should be called in the transaction that saves the attempt.
+
+        Args:
+            attempt: The saved QuizAttempt
+            question_scores: Dictionary mapping question ids to points earned
+        """
+        with transaction.atomic(savepoint=False):
+            cls._record_quiz_score(attempt)
+            cls._record_question_scores(question_scores)
+
+    @classmethod
+    def _record_quiz_score(cls, attempt: QuizAttempt) -> None:
+        QuizStatistics.objects.bulk_create(
+            [QuizStatistics(quiz_id=attempt.quiz_id)], ignore_conflicts=True
+        )
+
+        # A single UPDATE, so concurrent attempts of a quiz never hold its row
+        # locked across a read and a write.
+        score_percent = cls.score_percent(attempt.score, attempt.max_score)
+        bucket = Coalesce(
+            Cast(
+                KeyTextTransform(str(score_percent), "score_histogram"),
+                IntegerField(),
+            ),
+            Value(0),
+        )
+        QuizStatistics.objects.filter(quiz_id=attempt.quiz_id).update(
+            attempt_count=F("attempt_count") + 1,
+            score_percent_sum=F("score_percent_sum") + score_percent,
+            score_histogram=Func(
+                F("score_histogram"),
+                Value(f"{{{score_percent}}}"),
+                Func(bucket + 1, function="to_jsonb"),
+                function="jsonb_set",
+                output_field=JSONField(),
+            ),
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def _record_question_scores(question_scores: Dict[int, float]) -> None:
+        if not question_scores:
+            return
+
+        QuestionStatistics.objects.bulk_create(
+            [
+                QuestionStatistics(question_id=question_id)
+                for question_id in question_scores
+            ],
+            ignore_conflicts=True,
+        )
+
+        fully_correct_ids = [
+            question_id
+            for question_id, points in question_scores.items()
+            if points >= FULL_POINTS
+        ]
+
+        QuestionStatistics.objects.filter(question_id__in=question_scores).update(
+            times_shown=F("times_shown") + 1,
+            times_fully_correct=F("times_fully_correct")
+            + Case(
+                When(question_id__in=fully_correct_ids, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            points_sum=F("points_sum")
+            + Case(
+                *[
+                    When(question_id=question_id, then=Value(points))
+                    for question_id, points in question_scores.items()
+                ],
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+        )
+
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls, quiz: Quiz) -> QuizStatistics:
+        """
+        Recomputes the statistics of a quiz and its questions from all saved
+        attempts, e.g. after attempts were deleted.
+
+        Args:
+            quiz: The quiz object
+
+        Returns:
+            QuizStatistics: The rebuilt statistics of the quiz
+        """
+        histogram = empty_score_histogram()
+        score_percent_sum = 0
+        attempt_count = 0
+        for score, max_score in QuizAttempt.objects.filter(quiz=quiz).values_list(
+            "score", "max_score"
+        ):
+            score_percent = cls.score_percent(score, max_score)
+            histogram[score_percent] += 1
+            score_percent_sum += score_percent
+            attempt_count += 1
+
+        statistics, _ = QuizStatistics.objects.update_or_create(
+            quiz=quiz,
+            defaults={
+                "attempt_count": attempt_count,
+                "score_percent_sum": score_percent_sum,
+                "score_histogram": histogram,
+            },
+        )
+
+        question_rows = (
+            UserAnswer.objects.filter(question__quiz=quiz)
+            .order_by()
+            .values("question_id")
+            .annotate(
+                shown=Count("id"),
+                fully_correct=Count("id", filter=Q(points_earned__gte=FULL_POINTS)),
+                points=Sum("points_earned"),
+            )
+        )
+        QuestionStatistics.objects.filter(question__quiz=quiz).delete()
+        QuestionStatistics.objects.bulk_create(
+            [
+                QuestionStatistics(
+                    question_id=row["question_id"],
+                    times_shown=row["shown"],
+                    times_fully_correct=row["fully_correct"],
+                    points_sum=row["points"],
+                )
+                for row in question_rows
+            ]
+        )
+
+        return statistics
@@ -1,10 +1,13 @@
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from users.models import User
 
 from ..models import Answer, Question, Quiz, QuizAttempt, UserAnswer
+from .answer_key_services import AnswerKeyService, QuestionKey
+from .quiz_statistics_services import QuizStatisticsService
 
 
 class QuizSolveService:
@@ -14,6 +17,10 @@ class QuizSolveService:
         -method for calculating scores for a single question
         -method for calculating scores for quiz
         -method for saving user solutions to the database
+        -method for saving a whole attempt with bulk inserts and statistics
+
+    Answers are graded in memory against the cached answer key of the quiz
+    (see AnswerKeyService), so scoring does not query the database.
     """
 
     def calculate_score(
@@ -35,9 +42,34 @@ class QuizSolveService:
             ValueError: If question_id in question_map does not exist
         """
 
+        question_scores = self.calculate_question_scores(questions, user_answers)
+
+        total_score = round(sum(question_scores.values()), 2)
+
+        return total_score
+
+    def calculate_question_scores(
+        self, questions: List[Question], user_answers: List[Tuple[str, List[int]]]
+    ) -> Dict[int, float]:
+        """
+        Method for calculating the user's score for every answered question
+
+        Args:
+            questions : A list of the question objects
+            user_answers : List of tuples (question_id, list of selected answer IDs)
+                  Example: [("question_5", [10, 12]), ("question_7", [20])]
+
+        Returns:
+             Dictionary mapping question ids to the user's question score
+
+        Raises:
+            ValueError: If question_id in question_map does not exist
+        """
+
         question_map = {question.id: question for question in questions}
+        answer_keys = self._get_answer_keys(questions)
 
-        total_score = 0.0
+        question_scores = {}
 
         for question_id_str, selected_ids in user_answers:
             question_id_int = int(question_id_str.split("_")[1])
@@ -49,16 +81,17 @@ class QuizSolveService:
 
             question = question_map[question_id_int]
 
-            score = self.calculate_question_score(question, selected_ids)
-
-            total_score += score
-
-        total_score = round(total_score, 2)
+            question_scores[question.id] = self.calculate_question_score(
+                question, selected_ids, answer_keys.get(question.id)
+            )
 
-        return total_score
+        return question_scores
 
     def calculate_question_score(
-        self, question: Question, selected_answer_ids: List[int]
+        self,
+        question: Question,
+        selected_answer_ids: List[int],
+        question_key: Optional[QuestionKey] = None,
     ) -> float:
         """
         A method that compares the user's answers with the correct answers for a given question.
@@ -67,6 +100,8 @@ class QuizSolveService:
         Args:
             question : A question object
             selected_answer_ids: List of Answer IDs that user selected for this question
+            question_key: Answer key of the question, taken from the cached
+                answer key of its quiz when not given
 
         Returns:
 
@@ -76,11 +111,16 @@ class QuizSolveService:
             ValueError: If question doesn't have both correct and incorrect answers
         """
 
-        correct_answers = question.answers.filter(is_correct=True)
-        incorrect_answers = question.answers.filter(is_correct=False)
+        if question_key is None:
+            question_key = AnswerKeyService.get_for_quiz(question.quiz_id).get(
+                question.id
+            )
+
+        if question_key is None:
+            raise ValueError(_("Question must have both correct and incorrect answers"))
 
-        correct_ids = [answer.id for answer in correct_answers]
-        incorrect_ids = [answer.id for answer in incorrect_answers]
+        correct_ids = question_key.correct
+        incorrect_ids = question_key.incorrect
 
         if len(correct_ids) == 0 or len(incorrect_ids) == 0:
             raise ValueError(_("Question must have both correct and incorrect answers"))
@@ -91,7 +131,8 @@ class QuizSolveService:
 
         earned_points = 0.0
 
-        for answer_id in selected_answer_ids:
+        # Each answer counts once, however often it was submitted.
+        for answer_id in dict.fromkeys(selected_answer_ids):
             if answer_id in correct_ids:
                 earned_points += points_per_correct
             elif answer_id in incorrect_ids:
@@ -160,11 +201,15 @@ class QuizSolveService:
               Example: [("question_5", [10, 12]), ("question_7", [20])]
 
         """
+        answer_keys = AnswerKeyService.get_for_quiz(quiz_attempt.quiz_id)
+
         for question_id_str, selected_ids in user_answers:
             question_id_int = int(question_id_str.split("_")[1])
             question = Question.objects.get(id=question_id_int)
 
-            points = self.calculate_question_score(question, selected_ids)
+            points = self.calculate_question_score(
+                question, selected_ids, answer_keys.get(question.id)
+            )
             user_answer = UserAnswer.objects.create(
                 attempt=quiz_attempt, question=question, points_earned=points
             )
@@ -172,3 +217,104 @@ class QuizSolveService:
             answer_objects = Answer.objects.filter(id__in=selected_ids)
 
             user_answer.selected_answers.set(answer_objects)
+
+    def save_attempt_with_answers(
+        self,
+        user: User,
+        quiz: Quiz,
+        user_answers: List[Tuple[str, List[int]]],
+        question_scores: Dict[int, float],
+        max_score: float,
+    ) -> QuizAttempt:
+        """
+        Saves a QuizAttempt together with all its UserAnswers in one transaction,
+        using a constant number of queries regardless of the number of questions.
+        Quiz and question statistics are updated in the same transaction.
+
+        Args:
+            user: The user object
+            quiz: The quiz object
+            user_answers: List of tuples (question_id, list of selected answer IDs)
+              Example: [("question_5", [10, 12]), ("question_7", [20])]
+            question_scores: Already computed scores, see calculate_question_scores
+            max_score: The quiz max possible score
+
+        Returns:
+            QuizAttempt: A QuizAttempt object
+
+        Raises:
+            ValueError: If a question has no score or the attempt score is invalid
+        """
+
+        answer_keys = AnswerKeyService.get_for_quiz(quiz.id)
+        score = round(sum(question_scores.values()), 2)
+
+        with transaction.atomic():
+            quiz_attempt = self.save_quiz_attempt(user, quiz, score, max_score)
+
+            user_answer_objects = []
+            selected_per_answer = []
+            for question_id_str, selected_ids in user_answers:
+                question_id_int = int(question_id_str.split("_")[1])
+
+                if question_id_int not in question_scores:
+                    raise ValueError(
+                        _("Question %(id)s has no score") % {"id": question_id_int}
+                    )
+
+                user_answer_objects.append(
+                    UserAnswer(
+                        attempt=quiz_attempt,
+                        question_id=question_id_int,
+                        points_earned=question_scores[question_id_int],
+                    )
+                )
+
+                question_key = answer_keys.get(question_id_int)
+                valid_ids = (
+                    question_key.correct | question_key.incorrect
+                    if question_key
+                    else frozenset()
+                )
+                selected_per_answer.append(
+                    [answer_id for answer_id in selected_ids if answer_id in valid_ids]
+                )
+
+            user_answer_objects = UserAnswer.objects.bulk_create(user_answer_objects)
+
+            through_model = UserAnswer.selected_answers.through
+            through_model.objects.bulk_create(
+                [
+                    through_model(useranswer_id=user_answer.id, answer_id=answer_id)
+                    for user_answer, selected_ids in zip(
+                        user_answer_objects, selected_per_answer
+                    )
+                    for answer_id in dict.fromkeys(selected_ids)
+                ]
+            )
+
+            QuizStatisticsService.record_attempt(
+                quiz_attempt,
+                {
+                    user_answer.question_id: user_answer.points_earned
+                    for user_answer in user_answer_objects
+                },
+            )
+
+        return quiz_attempt
+
+    @staticmethod
+    def _get_answer_keys(questions: List[Question]) -> Dict[int, QuestionKey]:
+        """
+        Collects the answer keys of every quiz the questions belong to.
+
+        Args:
+            questions : A list of the question objects
+
+        Returns:
+            Dictionary mapping question ids to their QuestionKey
+        """
+        answer_keys: Dict[int, QuestionKey] = {}
+        for quiz_id in {question.quiz_id for question in questions}:
+            answer_keys.update(AnswerKeyService.get_for_quiz(quiz_id))
+        return answer_keys
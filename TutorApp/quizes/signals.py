@@ -0,0 +1,96 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Answer, Question, QuizAttempt
+from .services.answer_key_services import AnswerKeyService
+from .services.attempt_review_services import AttemptReviewService
+from .services.last_attempt_services import LastAttemptService
+from .services.question_selection_services import QuestionSelectionService
+
+
+def invalidate_answer_key(quiz_id: int) -> None:
+    """
+    Drops the cached answer key of a quiz now and again after commit, so a key
+    rebuilt from not yet committed rows in the meantime is not kept.
+    """
+    AnswerKeyService.invalidate(quiz_id)
+    transaction.on_commit(lambda: AnswerKeyService.invalidate(quiz_id))
+
+
+def invalidate_question_pool(quiz_id: int) -> None:
+    """
+    Drops the cached question candidate pool of a quiz now and after commit.
+    """
+    QuestionSelectionService.invalidate(quiz_id)
+    transaction.on_commit(lambda: QuestionSelectionService.invalidate(quiz_id))
+
+
+@receiver(pre_save, sender=Question)
+def invalidate_answer_key_on_question_move(
+    sender, instance: Question, **kwargs
+) -> None:
+    """Drops the cached data of the quiz a question is moved away from."""
+    if not instance.pk:
+        return
+
+    previous_quiz_id = (
+        Question.objects.filter(pk=instance.pk)
+        .values_list("quiz_id", flat=True)
+        .first()
+    )
+    if previous_quiz_id is not None and previous_quiz_id != instance.quiz_id:
+        invalidate_answer_key(previous_quiz_id)
+        invalidate_question_pool(previous_quiz_id)
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def invalidate_answer_key_on_question_change(
+    sender, instance: Question, **kwargs
+) -> None:
+    invalidate_answer_key(instance.quiz_id)
+    invalidate_question_pool(instance.quiz_id)
+
+
+@receiver(post_save, sender=Answer)
+@receiver(post_delete, sender=Answer)
+def invalidate_answer_key_on_answer_change(sender, instance: Answer, **kwargs) -> None:
+    """
+    Drops the answer key of the quiz an answer belongs to. When the whole
+    question is being deleted, the question's own signal takes care of it.
+    """
+    quiz_id = (
+        Question.objects.filter(pk=instance.question_id)
+        .values_list("quiz_id", flat=True)
+        .first()
+    )
+    if quiz_id is not None:
+        invalidate_answer_key(quiz_id)
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+@receiver(post_save, sender=Answer)
+@receiver(post_delete, sender=Answer)
+def invalidate_attempt_reviews(sender, instance, **kwargs) -> None:
+    """
+    Makes cached attempt reviews stale, since any of them may show the
+    changed question or answer.
+    """
+    AttemptReviewService.invalidate_all()
+    transaction.on_commit(AttemptReviewService.invalidate_all)
+
+
+@receiver(post_delete, sender=QuizAttempt)
+def invalidate_attempt_review(sender, instance: QuizAttempt, **kwargs) -> None:
+    AttemptReviewService.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=QuizAttempt)
+@receiver(post_delete, sender=QuizAttempt)
+def invalidate_last_attempts(sender, instance: QuizAttempt, **kwargs) -> None:
+    """Drops the cached latest attempts of the user once the change is committed."""
+    user_id = instance.user_id
+    LastAttemptService.invalidate(user_id)
+    transaction.on_commit(lambda: LastAttemptService.invalidate(user_id))
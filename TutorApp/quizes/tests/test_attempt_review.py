@@ -0,0 +1,103 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from quizes.factories import AnswerFactory, QuestionFactory, QuizFactory
+from quizes.models import QuizAttempt, UserAnswer
+from quizes.services.attempt_review_services import AttemptReviewService
+from users.factories import UserFactory
+
+
+class AttemptReviewTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory.create()
+        self.client.force_login(self.user)
+        self.quiz = QuizFactory.create()
+        self.attempt = QuizAttempt.objects.create(
+            user=self.user, quiz=self.quiz, score=1, max_score=3
+        )
+        self.questions = []
+        for _ in range(3):
+            question = QuestionFactory.create(quiz=self.quiz)
+            correct = AnswerFactory.create(question=question, is_correct=True)
+            wrong = AnswerFactory.create(question=question, is_correct=False)
+            user_answer = UserAnswer.objects.create(
+                attempt=self.attempt, question=question, points_earned=0
+            )
+            user_answer.selected_answers.set([wrong])
+            self.questions.append((question, correct, wrong))
+
+    def _url(self, question_number, attempt=None):
+        return reverse(
+            "quizes:question_review",
+            kwargs={
+                "attempt_pk": (attempt or self.attempt).pk,
+                "question_number": question_number,
+            },
+        )
+
+    def test_review_marks_selected_and_correct_answers(self) -> None:
+        """Test case that checks if the review shows the user's selections"""
+        response = self.client.get(self._url(1))
+
+        self.assertEqual(response.status_code, 200)
+        question, correct, wrong = self.questions[0]
+        review_question = response.context["question"]
+        self.assertEqual(review_question.question_id, question.id)
+        self.assertEqual(
+            [answer.id for answer in review_question.correct_answers], [correct.id]
+        )
+        self.assertEqual(
+            [answer.id for answer in review_question.answers if answer.is_selected],
+            [wrong.id],
+        )
+        self.assertEqual(response.context["total_questions"], 3)
+        self.assertTrue(response.context["has_next"])
+
+    def test_paging_does_not_query_quiz_tables(self) -> None:
+        """Test case that checks if later pages are served from the cached review"""
+        self.client.get(self._url(1))
+
+        for question_number in (2, 3):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self._url(question_number))
+
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(
+                [q["sql"] for q in queries.captured_queries if "quizes_" in q["sql"]]
+            )
+
+    def test_build_uses_fixed_number_of_queries(self) -> None:
+        """Test case that checks if building a review does not query per question"""
+        # Attempt, user answers, selected answers, question answers.
+        with self.assertNumQueries(4):
+            review = AttemptReviewService.build(self.attempt.pk)
+
+        self.assertEqual(len(review.questions), 3)
+
+    def test_other_users_attempt_is_not_found(self) -> None:
+        """Test case that checks if an attempt of another user cannot be reviewed"""
+        attempt = QuizAttempt.objects.create(
+            user=UserFactory.create(), quiz=self.quiz, score=0, max_score=1
+        )
+
+        self.assertEqual(self.client.get(self._url(1, attempt)).status_code, 404)
+
+    def test_question_number_out_of_range_is_not_found(self) -> None:
+        """Test case that checks if a missing question number returns 404"""
+        self.assertEqual(self.client.get(self._url(0)).status_code, 404)
+        self.assertEqual(self.client.get(self._url(4)).status_code, 404)
+
+    def test_answer_change_refreshes_review(self) -> None:
+        """Test case that checks if editing an answer drops cached reviews"""
+        self.client.get(self._url(1))
+        _, _, wrong = self.questions[0]
+
+        wrong.text = "Changed answer"
+        wrong.save()
+
+        response = self.client.get(self._url(1))
+        texts = [answer.text for answer in response.context["question"].answers]
+        self.assertIn("Changed answer", texts)
@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from quizes.factories import QuizFactory
+from quizes.models import QuizAttempt
+from quizes.services.last_attempt_services import LastAttemptService
+from users.factories import UserFactory
+
+
+class LastAttemptServiceTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory.create()
+        self.quiz = QuizFactory.create()
+        self.other_quiz = QuizFactory.create()
+        now = timezone.now()
+        self.older = self._attempt(self.quiz, 1, now - timedelta(days=2))
+        self.latest = self._attempt(self.quiz, 2, now - timedelta(days=1))
+        self.other = self._attempt(self.other_quiz, 3, now)
+
+    def _attempt(self, quiz, score, completed_at):
+        return QuizAttempt.objects.create(
+            user=self.user,
+            quiz=quiz,
+            score=score,
+            max_score=5,
+            completed_at=completed_at,
+        )
+
+    def test_build_returns_latest_attempt_per_quiz(self) -> None:
+        """Test case that checks if only the newest attempt of each quiz is kept"""
+        with self.assertNumQueries(1):
+            last_attempts = LastAttemptService.build(self.user.id)
+
+        self.assertEqual(last_attempts[self.quiz.id].id, self.latest.id)
+        self.assertEqual(last_attempts[self.other_quiz.id].id, self.other.id)
+
+    def test_last_attempts_are_cached(self) -> None:
+        """Test case that checks if repeated lookups do not query the database"""
+        LastAttemptService.get_for_user(self.user.id)
+
+        with self.assertNumQueries(0):
+            last_attempt = LastAttemptService.get_for_quiz(self.user.id, self.quiz.id)
+
+        self.assertEqual(last_attempt.score, 2)
+
+    def test_saved_attempt_refreshes_cache(self) -> None:
+        """Test case that checks if a new attempt becomes the latest one"""
+        LastAttemptService.get_for_user(self.user.id)
+
+        newest = self._attempt(self.quiz, 4, timezone.now())
+
+        self.assertEqual(
+            LastAttemptService.get_for_quiz(self.user.id, self.quiz.id).id, newest.id
+        )
+
+    def test_deleted_attempt_refreshes_cache(self) -> None:
+        """Test case that checks if deleting the latest attempt restores the previous"""
+        LastAttemptService.get_for_user(self.user.id)
+
+        self.latest.delete()
+
+        self.assertEqual(
+            LastAttemptService.get_for_quiz(self.user.id, self.quiz.id).id,
+            self.older.id,
+        )
+
+    def test_quiz_list_shows_last_attempts(self) -> None:
+        """Test case that checks if the quiz list annotates the latest attempts"""
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("quizes:quiz_list"))
+
+        last_attempts = {
+            quiz.id: quiz.last_attempt for quiz in response.context["quiz_list"]
+        }
+        self.assertEqual(last_attempts[self.quiz.id].id, self.latest.id)
+        self.assertEqual(last_attempts[self.other_quiz.id].id, self.other.id)
@@ -0,0 +1,54 @@
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import RequestFactory, TestCase
+from formtools.wizard.storage import get_storage
+from quizes.factories import QuestionFactory, QuizFactory
+from quizes.views.quiz_solve_views import SolveQuizWizard
+from users.factories import UserFactory
+
+
+class SolveQuizWizardDrawTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.user = UserFactory.create()
+        self.session = SessionStore()
+        self.quiz = QuizFactory.create()
+        for _ in range(30):
+            QuestionFactory.create(quiz=self.quiz)
+
+    def _wizard(self, quiz, query=""):
+        request = self.factory.get(f"/quiz/{quiz.pk}/solve/{query}")
+        request.user = self.user
+        request.session = self.session
+        view = SolveQuizWizard(**SolveQuizWizard.get_initkwargs())
+        view.setup(request, quiz_pk=quiz.pk)
+        view.prefix = view.get_prefix(request)
+        view.storage = get_storage(view.storage_name, view.prefix, request)
+        return view
+
+    def test_form_list_is_stable_within_attempt(self) -> None:
+        """Test case that checks if every call returns the same steps"""
+        wizard = self._wizard(self.quiz, "?question_count=10")
+
+        first = list(wizard.get_form_list())
+
+        self.assertEqual(len(first), 10)
+        self.assertEqual(list(wizard.get_form_list()), first)
+
+    def test_draw_is_pinned_across_requests(self) -> None:
+        """Test case that checks if later requests reuse the pinned draw"""
+        first = list(self._wizard(self.quiz, "?question_count=10").get_form_list())
+
+        with self.assertNumQueries(0):
+            second = list(self._wizard(self.quiz).get_form_list())
+
+        self.assertEqual(second, first)
+
+    def test_other_quiz_gets_new_draw(self) -> None:
+        """Test case that checks if a draw is not reused for another quiz"""
+        self._wizard(self.quiz, "?question_count=10").get_form_list()
+        other_quiz = QuizFactory.create()
+        other_question = QuestionFactory.create(quiz=other_quiz)
+
+        steps = list(self._wizard(other_quiz).get_form_list())
+
+        self.assertEqual(steps, [f"question_{other_question.id}"])
@@ -0,0 +1,121 @@
+from courses.choices import GradeChoices
+from django.core.cache import cache
+from django.test import TestCase
+from quizes.factories import QuestionFactory, QuizFactory
+from quizes.forms.quiz_wizard_forms import QuizStartForm
+from quizes.models import QuestionStatistics, QuizAttempt, UserAnswer
+from quizes.services.question_selection_services import QuestionSelectionService
+from users.factories import UserFactory
+
+
+class QuestionSelectionServiceTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory.create()
+        self.quiz = QuizFactory.create()
+        self.basic = QuestionFactory.create_batch(4, quiz=self.quiz, level_type=1)
+        self.extended = QuestionFactory.create_batch(3, quiz=self.quiz, level_type=2)
+        self.no_level = QuestionFactory.create(quiz=self.quiz, level_type=None)
+
+    def _ids(self, questions):
+        return {question.id for question in questions}
+
+    def test_draw_filters_by_level(self) -> None:
+        """Test case that checks if only questions of the level are drawn"""
+        question_ids = QuestionSelectionService.draw(self.quiz.id, self.user, None, 1)
+
+        self.assertEqual(set(question_ids), self._ids(self.basic + [self.no_level]))
+        self.assertEqual(len(question_ids), len(set(question_ids)))
+
+    def test_draw_without_level_uses_every_question(self) -> None:
+        """Test case that checks if no level means the whole quiz"""
+        question_ids = QuestionSelectionService.draw(self.quiz.id, self.user)
+
+        self.assertEqual(len(question_ids), 8)
+
+    def test_draw_too_many_questions_raises(self) -> None:
+        """Test case that checks if a draw cannot exceed the level's questions"""
+        with self.assertRaises(ValueError):
+            QuestionSelectionService.draw(self.quiz.id, self.user, 5, 2)
+
+    def test_pool_is_cached(self) -> None:
+        """Test case that checks if a repeated draw only reads the user's misses"""
+        QuestionSelectionService.draw(self.quiz.id, self.user, 3)
+
+        with self.assertNumQueries(1):
+            QuestionSelectionService.draw(self.quiz.id, self.user, 3)
+
+    def test_new_question_invalidates_pool(self) -> None:
+        """Test case that checks if an added question can be drawn"""
+        QuestionSelectionService.draw(self.quiz.id, self.user)
+
+        question = QuestionFactory.create(quiz=self.quiz, level_type=2)
+
+        self.assertIn(
+            question.id, QuestionSelectionService.draw(self.quiz.id, self.user)
+        )
+
+    def test_difficulty_comes_from_statistics(self) -> None:
+        """Test case that checks if question statistics set the difficulty"""
+        hard, rarely_shown = self.basic[:2]
+        QuestionStatistics.objects.create(question=hard, times_shown=10, points_sum=2)
+        QuestionStatistics.objects.create(
+            question=rarely_shown, times_shown=1, points_sum=1
+        )
+
+        pool = {c.id: c for c in QuestionSelectionService.build_pool(self.quiz.id)}
+
+        self.assertAlmostEqual(pool[hard.id].difficulty, 0.8)
+        self.assertEqual(
+            pool[rarely_shown.id].difficulty,
+            QuestionSelectionService.DEFAULT_DIFFICULTY,
+        )
+
+    def test_missed_questions_are_drawn_more_often(self) -> None:
+        """Test case that checks if questions the user missed are favoured"""
+        missed = self.basic[0]
+        attempt = QuizAttempt.objects.create(
+            user=self.user, quiz=self.quiz, score=0, max_score=1
+        )
+        UserAnswer.objects.create(attempt=attempt, question=missed, points_earned=0)
+        for _ in range(3):
+            attempt = QuizAttempt.objects.create(
+                user=self.user, quiz=self.quiz, score=0, max_score=1
+            )
+            UserAnswer.objects.create(attempt=attempt, question=missed, points_earned=0)
+
+        draws = 400
+        first_picks = sum(
+            QuestionSelectionService.draw(self.quiz.id, self.user, 1)[0] == missed.id
+            for _ in range(draws)
+        )
+
+        # Weight 4.5 against 1.5 for the seven other questions: expected share
+        # is 0.3, a uniform draw would give 0.125.
+        self.assertGreater(first_picks / draws, 0.2)
+
+
+class QuizStartFormLevelTests(TestCase):
+    def setUp(self) -> None:
+        self.quiz = QuizFactory.create(section__grade=GradeChoices.SECONDARY_1)
+        QuestionFactory.create_batch(2, quiz=self.quiz, level_type=1)
+        QuestionFactory.create_batch(10, quiz=self.quiz, level_type=2)
+
+    def test_rejects_count_above_questions_of_level(self) -> None:
+        """Test case that checks if the count is validated against the level"""
+        form = QuizStartForm(
+            self.quiz,
+            data={"question_count": 10, "level_type": 1, "solve_mode": "wizard"},
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("question_count", form.errors)
+
+    def test_accepts_count_within_questions_of_level(self) -> None:
+        """Test case that checks if a count the level can fill is accepted"""
+        form = QuizStartForm(
+            self.quiz,
+            data={"question_count": 10, "level_type": 2, "solve_mode": "wizard"},
+        )
+
+        self.assertTrue(form.is_valid())
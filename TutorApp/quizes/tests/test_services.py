@@ -0,0 +1,216 @@
+from django.core.cache import cache
+from django.test import TestCase
+from quizes.factories import AnswerFactory, QuestionFactory, QuizFactory
+from quizes.models import QuizAttempt, UserAnswer
+from quizes.services.answer_key_services import AnswerKeyService, QuestionKey
+from quizes.services.solve_quiz_services import QuizSolveService
+from users.factories import UserFactory
+
+
+class AnswerKeyServiceTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.quiz = QuizFactory.create()
+        self.question = QuestionFactory.create(quiz=self.quiz)
+        self.correct = AnswerFactory.create(question=self.question, is_correct=True)
+        self.incorrect = AnswerFactory.create(question=self.question, is_correct=False)
+
+    def test_build_groups_answers_by_question(self) -> None:
+        """Test case that checks if the answer key is built in a single query"""
+        with self.assertNumQueries(1):
+            answer_key = AnswerKeyService.build(self.quiz.id)
+
+        self.assertEqual(
+            answer_key,
+            {
+                self.question.id: QuestionKey(
+                    correct=frozenset({self.correct.id}),
+                    incorrect=frozenset({self.incorrect.id}),
+                )
+            },
+        )
+
+    def test_get_for_quiz_is_cached(self) -> None:
+        """Test case that checks if the answer key is read from cache"""
+        AnswerKeyService.get_for_quiz(self.quiz.id)
+
+        with self.assertNumQueries(0):
+            AnswerKeyService.get_for_quiz(self.quiz.id)
+
+    def test_answer_change_invalidates_key(self) -> None:
+        """Test case that checks if changing an answer drops the cached key"""
+        AnswerKeyService.get_for_quiz(self.quiz.id)
+
+        self.incorrect.is_correct = True
+        self.incorrect.save()
+
+        question_key = AnswerKeyService.get_for_quiz(self.quiz.id)[self.question.id]
+        self.assertEqual(
+            question_key.correct, frozenset({self.correct.id, self.incorrect.id})
+        )
+
+    def test_new_question_invalidates_key(self) -> None:
+        """Test case that checks if adding a question drops the cached key"""
+        AnswerKeyService.get_for_quiz(self.quiz.id)
+
+        question = QuestionFactory.create(quiz=self.quiz)
+        AnswerFactory.create(question=question, is_correct=True)
+
+        self.assertIn(question.id, AnswerKeyService.get_for_quiz(self.quiz.id))
+
+    def test_question_move_invalidates_previous_quiz(self) -> None:
+        """Test case that checks if moving a question drops both quiz keys"""
+        AnswerKeyService.get_for_quiz(self.quiz.id)
+        other_quiz = QuizFactory.create()
+
+        self.question.quiz = other_quiz
+        self.question.save()
+
+        self.assertEqual(AnswerKeyService.get_for_quiz(self.quiz.id), {})
+        self.assertIn(self.question.id, AnswerKeyService.get_for_quiz(other_quiz.id))
+
+
+class QuizSolveServiceScoringTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.service = QuizSolveService()
+        self.quiz = QuizFactory.create()
+        self.questions = []
+        self.user_answers = []
+        for _ in range(50):
+            question = QuestionFactory.create(quiz=self.quiz)
+            correct = AnswerFactory.create(question=question, is_correct=True)
+            AnswerFactory.create(question=question, is_correct=False)
+            self.questions.append(question)
+            self.user_answers.append((f"question_{question.id}", [correct.id]))
+
+    def test_calculate_score_uses_one_query(self) -> None:
+        """Test case that checks if grading a whole quiz needs a single query"""
+        with self.assertNumQueries(1):
+            score = self.service.calculate_score(self.questions, self.user_answers)
+
+        self.assertEqual(score, 50.0)
+
+    def test_calculate_score_with_cached_key_runs_no_queries(self) -> None:
+        """Test case that checks if a cached answer key grades in memory"""
+        self.service.calculate_score(self.questions, self.user_answers)
+
+        with self.assertNumQueries(0):
+            self.service.calculate_score(self.questions, self.user_answers)
+
+    def test_calculate_question_score_partial_credit(self) -> None:
+        """Test case that checks if an incorrect answer subtracts points"""
+        question = QuestionFactory.create(quiz=self.quiz)
+        first = AnswerFactory.create(question=question, is_correct=True)
+        AnswerFactory.create(question=question, is_correct=True)
+        wrong = AnswerFactory.create(question=question, is_correct=False)
+        AnswerFactory.create(question=question, is_correct=False)
+
+        self.assertEqual(
+            self.service.calculate_question_score(question, [first.id]), 0.5
+        )
+        self.assertEqual(
+            self.service.calculate_question_score(question, [first.id, wrong.id]),
+            0.0,
+        )
+
+    def test_calculate_question_score_counts_repeated_ids_once(self) -> None:
+        """Test case that checks if a repeated correct answer is scored once"""
+        question = QuestionFactory.create(quiz=self.quiz)
+        first = AnswerFactory.create(question=question, is_correct=True)
+        AnswerFactory.create(question=question, is_correct=True)
+        AnswerFactory.create(question=question, is_correct=False)
+
+        self.assertEqual(
+            self.service.calculate_question_score(
+                question, [first.id, first.id, first.id]
+            ),
+            0.5,
+        )
+
+    def test_question_without_incorrect_answers_raises(self) -> None:
+        """Test case that checks if a question needs both kinds of answers"""
+        question = QuestionFactory.create(quiz=self.quiz)
+        answer = AnswerFactory.create(question=question, is_correct=True)
+
+        with self.assertRaises(ValueError):
+            self.service.calculate_question_score(question, [answer.id])
+
+
+class QuizSolveServiceBulkSaveTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.service = QuizSolveService()
+        self.user = UserFactory.create()
+        self.quiz = QuizFactory.create()
+
+    def _answer_questions(self, count):
+        questions = []
+        user_answers = []
+        for _ in range(count):
+            question = QuestionFactory.create(quiz=self.quiz)
+            correct = AnswerFactory.create(question=question, is_correct=True)
+            wrong = AnswerFactory.create(question=question, is_correct=False)
+            questions.append(question)
+            user_answers.append((f"question_{question.id}", [correct.id, wrong.id]))
+        return questions, user_answers
+
+    def _save(self, questions, user_answers):
+        scores = self.service.calculate_question_scores(questions, user_answers)
+        return self.service.save_attempt_with_answers(
+            self.user, self.quiz, user_answers, scores, len(user_answers)
+        )
+
+    def test_saves_attempt_answers_and_selections(self) -> None:
+        """Test case that checks if the attempt is saved with every selection"""
+        questions, user_answers = self._answer_questions(3)
+
+        attempt = self._save(questions, user_answers)
+
+        self.assertEqual(attempt.answers.count(), 3)
+        for question_id_str, selected_ids in user_answers:
+            user_answer = attempt.answers.get(
+                question_id=int(question_id_str.split("_")[1])
+            )
+            self.assertEqual(user_answer.points_earned, 0.0)
+            self.assertCountEqual(
+                user_answer.selected_answers.values_list("id", flat=True),
+                selected_ids,
+            )
+
+    def test_query_count_does_not_depend_on_question_count(self) -> None:
+        """Test case that checks if a 50-question submit uses constant queries"""
+        for count in (5, 50):
+            questions, user_answers = self._answer_questions(count)
+            scores = self.service.calculate_question_scores(questions, user_answers)
+
+            # Savepoint, attempt, user answers, selections, quiz statistics
+            # (insert, update), question statistics (insert, update), release.
+            with self.assertNumQueries(9):
+                self.service.save_attempt_with_answers(
+                    self.user, self.quiz, user_answers, scores, count
+                )
+
+    def test_ignores_answers_of_other_questions(self) -> None:
+        """Test case that checks if foreign answer ids are not saved"""
+        questions, user_answers = self._answer_questions(2)
+        foreign_answer_id = user_answers[1][1][0]
+        user_answers[0] = (user_answers[0][0], [foreign_answer_id])
+
+        attempt = self._save(questions, user_answers)
+
+        first = attempt.answers.get(question=questions[0])
+        self.assertFalse(first.selected_answers.exists())
+
+    def test_rolls_back_on_invalid_score(self) -> None:
+        """Test case that checks if nothing is saved when validation fails"""
+        questions, user_answers = self._answer_questions(2)
+        scores = self.service.calculate_question_scores(questions, user_answers)
+
+        with self.assertRaises(ValueError):
+            self.service.save_attempt_with_answers(
+                self.user, self.quiz, user_answers, scores, 0
+            )
+
+        self.assertFalse(QuizAttempt.objects.exists())
+        self.assertFalse(UserAnswer.objects.exists())
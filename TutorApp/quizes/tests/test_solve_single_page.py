@@ -0,0 +1,123 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from quizes.factories import AnswerFactory, QuestionFactory, QuizFactory
+from quizes.models import QuizAttempt
+from quizes.views.quiz_solve_views import SolveQuizSinglePageView
+from users.factories import UserFactory
+
+
+class SolveQuizSinglePageTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory.create()
+        self.client.force_login(self.user)
+        self.quiz = QuizFactory.create()
+        self.correct_answers = {}
+        for _ in range(5):
+            question = QuestionFactory.create(quiz=self.quiz, level_type=1)
+            self.correct_answers[question.id] = AnswerFactory.create(
+                question=question, is_correct=True
+            ).id
+            AnswerFactory.create(question=question, is_correct=False)
+        self.url = reverse(
+            "quizes:solve_quiz_single_page", kwargs={"quiz_pk": self.quiz.pk}
+        )
+
+    def test_renders_drawn_questions_as_payload(self) -> None:
+        """Test case that checks if the drawn questions are rendered at once"""
+        response = self.client.get(self.url, {"question_count": 3})
+
+        self.assertEqual(response.status_code, 200)
+        questions = response.context["questions"]
+        draw = self.client.session[SolveQuizSinglePageView.session_key]
+        self.assertEqual([q["id"] for q in questions], draw["question_ids"])
+        for question in questions:
+            self.assertEqual(len(question["answers"]), 2)
+            self.assertNotIn("is_correct", question["answers"][0])
+
+    def test_solves_quiz_with_single_submit(self) -> None:
+        """Test case that checks if all answers are graded from one POST"""
+        response = self.client.get(self.url, {"question_count": 3})
+        question_ids = [q["id"] for q in response.context["questions"]]
+
+        response = self.client.post(
+            self.url,
+            {
+                f"question_{question_id}": [self.correct_answers[question_id]]
+                for question_id in question_ids
+            },
+        )
+
+        attempt = QuizAttempt.objects.get(user=self.user, quiz=self.quiz)
+        self.assertRedirects(
+            response,
+            reverse(
+                "quizes:question_review",
+                kwargs={"attempt_pk": attempt.id, "question_number": 1},
+            ),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(attempt.score, 3.0)
+        self.assertEqual(attempt.max_score, 3)
+        self.assertNotIn(SolveQuizSinglePageView.session_key, self.client.session)
+
+    def test_unanswered_questions_score_zero(self) -> None:
+        """Test case that checks if skipped questions are saved without points"""
+        self.client.get(self.url, {"question_count": 3})
+
+        self.client.post(self.url, {})
+
+        attempt = QuizAttempt.objects.get(user=self.user, quiz=self.quiz)
+        self.assertEqual(attempt.score, 0.0)
+        self.assertEqual(attempt.answers.count(), 3)
+
+    def test_repeated_answer_ids_count_once(self) -> None:
+        """Test case that checks if repeated or foreign answer ids add no points"""
+        response = self.client.get(self.url, {"question_count": 3})
+        question_ids = [q["id"] for q in response.context["questions"]]
+        other_question_answer = next(
+            answer_id
+            for question_id, answer_id in self.correct_answers.items()
+            if question_id not in question_ids
+        )
+
+        response = self.client.post(
+            self.url,
+            {
+                f"question_{question_id}": [
+                    self.correct_answers[question_id],
+                    self.correct_answers[question_id],
+                    other_question_answer,
+                ]
+                for question_id in question_ids
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        attempt = QuizAttempt.objects.get(user=self.user, quiz=self.quiz)
+        self.assertEqual(attempt.score, 3.0)
+        for user_answer in attempt.answers.all():
+            self.assertEqual(user_answer.points_earned, 1.0)
+            self.assertEqual(user_answer.selected_answers.count(), 1)
+
+    def test_post_without_draw_redirects_to_start(self) -> None:
+        """Test case that checks if a submit without a started attempt is rejected"""
+        response = self.client.post(self.url, {})
+
+        self.assertRedirects(
+            response,
+            reverse("quizes:quiz_start", kwargs={"quiz_pk": self.quiz.pk}),
+            fetch_redirect_response=False,
+        )
+        self.assertFalse(QuizAttempt.objects.exists())
+
+    def test_start_view_redirects_to_selected_mode(self) -> None:
+        """Test case that checks if the start form leads to the single-page mode"""
+        response = self.client.post(
+            reverse("quizes:quiz_start", kwargs={"quiz_pk": self.quiz.pk}),
+            {"question_count": "all", "level_type": 1, "solve_mode": "single_page"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith(self.url + "?"))
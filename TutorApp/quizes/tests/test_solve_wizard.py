@@ -0,0 +1,80 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from quizes.factories import AnswerFactory, QuestionFactory, QuizFactory
+from quizes.models import QuizAttempt
+from users.factories import UserFactory
+
+
+class SolveQuizWizardTests(TestCase):
+    PREFIX = "solve_quiz_wizard"
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory.create()
+        self.client.force_login(self.user)
+        self.quiz = QuizFactory.create()
+        self.correct_answers = {}
+        for _ in range(5):
+            question = QuestionFactory.create(quiz=self.quiz)
+            self.correct_answers[question.id] = AnswerFactory.create(
+                question=question, is_correct=True
+            ).id
+            AnswerFactory.create(question=question, is_correct=False)
+        self.url = reverse("quizes:solve_quiz", kwargs={"quiz_pk": self.quiz.pk})
+
+    def _post_step(self, step):
+        question_id = int(step.split("_")[1])
+        return self.client.post(
+            self.url,
+            {
+                f"{self.PREFIX}-current_step": step,
+                f"{step}-selected_answers": [self.correct_answers[question_id]],
+            },
+        )
+
+    def test_solves_quiz_with_drawn_questions(self) -> None:
+        """Test case that checks if a whole attempt can be solved and saved"""
+        response = self.client.get(self.url, {"question_count": 3})
+        self.assertEqual(response.status_code, 200)
+
+        steps = list(response.context["wizard"]["steps"].all)
+        self.assertEqual(len(steps), 3)
+        self.assertEqual(response.context["question"].id, int(steps[0].split("_")[1]))
+
+        for step in steps:
+            response = self._post_step(step)
+
+        attempt = QuizAttempt.objects.get(user=self.user, quiz=self.quiz)
+        self.assertRedirects(
+            response,
+            reverse(
+                "quizes:question_review",
+                kwargs={"attempt_pk": attempt.id, "question_number": 1},
+            ),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(attempt.score, 3.0)
+        self.assertEqual(
+            sorted(attempt.answers.values_list("question_id", flat=True)),
+            sorted(int(step.split("_")[1]) for step in steps),
+        )
+
+    def test_steps_are_served_from_question_bundle(self) -> None:
+        """Test case that checks if question pages do not query questions again"""
+        response = self.client.get(self.url, {"question_count": 5})
+        steps = list(response.context["wizard"]["steps"].all)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._post_step(steps[0])
+
+        self.assertEqual(response.context["question"].id, int(steps[1].split("_")[1]))
+        self.assertFalse(
+            [
+                query["sql"]
+                for query in queries
+                if "quizes_question" in query["sql"] or "quizes_answer" in query["sql"]
+            ]
+        )
@@ -0,0 +1,144 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from quizes.factories import AnswerFactory, QuestionFactory, QuizFactory
+from quizes.models import QuestionStatistics, QuizAttempt, QuizStatistics
+from quizes.services.quiz_statistics_services import QuizStatisticsService
+from quizes.services.solve_quiz_services import QuizSolveService
+from users.factories import UserFactory
+
+
+class QuizStatisticsTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.service = QuizSolveService()
+        self.user = UserFactory.create()
+        self.quiz = QuizFactory.create()
+        self.questions = []
+        self.correct = {}
+        self.wrong = {}
+        for _ in range(4):
+            question = QuestionFactory.create(quiz=self.quiz)
+            self.correct[question.id] = AnswerFactory.create(
+                question=question, is_correct=True
+            ).id
+            self.wrong[question.id] = AnswerFactory.create(
+                question=question, is_correct=False
+            ).id
+            self.questions.append(question)
+
+    def _solve(self, correct_count):
+        user_answers = [
+            (
+                f"question_{question.id}",
+                [
+                    (
+                        self.correct[question.id]
+                        if index < correct_count
+                        else self.wrong[question.id]
+                    )
+                ],
+            )
+            for index, question in enumerate(self.questions)
+        ]
+        scores = self.service.calculate_question_scores(self.questions, user_answers)
+        return self.service.save_attempt_with_answers(
+            self.user, self.quiz, user_answers, scores, len(user_answers)
+        )
+
+    def test_attempt_does_not_lock_quiz_statistics_row(self) -> None:
+        """Test case that checks if quiz statistics are updated in one statement"""
+        self._solve(1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._solve(3)
+
+        sqls = [query["sql"] for query in queries]
+        self.assertFalse(any("FOR UPDATE" in sql for sql in sqls))
+        self.assertEqual(
+            len(
+                [
+                    sql
+                    for sql in sqls
+                    if sql.startswith('UPDATE "quizes_quizstatistics"')
+                ]
+            ),
+            1,
+        )
+        statistics = QuizStatistics.objects.get(quiz=self.quiz)
+        self.assertEqual(statistics.score_histogram[25], 1)
+        self.assertEqual(statistics.score_histogram[75], 1)
+
+    def test_attempt_updates_quiz_statistics(self) -> None:
+        """Test case that checks if saved attempts are aggregated per quiz"""
+        for correct_count in (1, 2, 4):
+            self._solve(correct_count)
+
+        statistics = QuizStatistics.objects.get(quiz=self.quiz)
+        self.assertEqual(statistics.attempt_count, 3)
+        self.assertEqual(statistics.mean_score_percent, round(175 / 3, 2))
+        self.assertEqual(statistics.score_percentile(0), 25)
+        self.assertEqual(statistics.score_percentile(50), 50)
+        self.assertEqual(statistics.score_percentile(100), 100)
+
+    def test_attempt_updates_question_statistics(self) -> None:
+        """Test case that checks if saved answers are aggregated per question"""
+        self._solve(1)
+        self._solve(4)
+
+        first = QuestionStatistics.objects.get(question=self.questions[0])
+        last = QuestionStatistics.objects.get(question=self.questions[-1])
+        self.assertEqual(first.times_shown, 2)
+        self.assertEqual(first.times_fully_correct, 2)
+        self.assertEqual(first.average_points, 1.0)
+        self.assertEqual(last.times_shown, 2)
+        self.assertEqual(last.times_fully_correct, 1)
+        self.assertEqual(last.fully_correct_rate, 0.5)
+
+    def test_statistics_without_attempts(self) -> None:
+        """Test case that checks if empty statistics have no averages"""
+        statistics = QuizStatistics(quiz=self.quiz)
+
+        self.assertIsNone(statistics.mean_score_percent)
+        self.assertIsNone(statistics.score_percentile(50))
+        with self.assertRaises(ValueError):
+            statistics.score_percentile(101)
+
+    def test_rebuild_matches_incremental_statistics(self) -> None:
+        """Test case that checks if a rebuild recomputes the same aggregates"""
+        for correct_count in (0, 3, 4):
+            self._solve(correct_count)
+        incremental = QuizStatistics.objects.get(quiz=self.quiz)
+        incremental_questions = {
+            statistics.question_id: statistics.points_sum
+            for statistics in QuestionStatistics.objects.all()
+        }
+
+        QuizStatistics.objects.all().delete()
+        QuestionStatistics.objects.all().delete()
+        rebuilt = QuizStatisticsService.rebuild(self.quiz)
+
+        self.assertEqual(rebuilt.attempt_count, incremental.attempt_count)
+        self.assertEqual(rebuilt.score_histogram, incremental.score_histogram)
+        self.assertEqual(
+            {
+                statistics.question_id: statistics.points_sum
+                for statistics in QuestionStatistics.objects.all()
+            },
+            incremental_questions,
+        )
+
+    def test_rebuild_command_drops_deleted_attempts(self) -> None:
+        """Test case that checks if the command rebuilds from remaining attempts"""
+        self._solve(4)
+        self._solve(0).delete()
+
+        call_command("rebuild_quiz_statistics", self.quiz.id, stdout=StringIO())
+
+        statistics = QuizStatistics.objects.get(quiz=self.quiz)
+        self.assertEqual(statistics.attempt_count, QuizAttempt.objects.count())
+        self.assertEqual(statistics.mean_score_percent, 100.0)
@@ -1,11 +1,10 @@
 from courses.tests.factories import SectionFactory
 from django.test import Client, TestCase
 from django.urls import reverse
+from quizes.factories import QuizFactory
 from quizes.models import Answer, Question, Quiz
 from users.factories import TeacherFactory, UserFactory
 
-from TutorApp.quizes.factories import QuizFactory
-
 
 class AddQuizViewTests(TestCase):
     def setUp(self) -> None:
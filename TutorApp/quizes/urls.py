@@ -7,7 +7,11 @@ from .views.question_views import (
     QuestionReviewView,
     QuestionUpdateView,
 )
-from .views.quiz_solve_views import QuizStartView, SolveQuizWizard
+from .views.quiz_solve_views import (
+    QuizStartView,
+    SolveQuizSinglePageView,
+    SolveQuizWizard,
+)
 from .views.quiz_views import AddQuiz, DeleteQuiz, QuizList
 
 app_name = "quizes"
@@ -19,6 +23,11 @@ urlpatterns = [
         "quiz/<int:quiz_pk>/add-question/", AddQuestion.as_view(), name="add_question"
     ),
     path("quiz/<int:quiz_pk>/solve/", SolveQuizWizard.as_view(), name="solve_quiz"),
+    path(
+        "quiz/<int:quiz_pk>/solve/single-page/",
+        SolveQuizSinglePageView.as_view(),
+        name="solve_quiz_single_page",
+    ),
     path("quiz/<int:quiz_pk>/start/", QuizStartView.as_view(), name="quiz_start"),
     path(
         "quiz/attempt/<int:attempt_pk>/question/<int:question_number>/",
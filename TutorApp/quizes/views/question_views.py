@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Union
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -11,14 +11,15 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic import (
     CreateView,
     DeleteView,
-    DetailView,
     ListView,
+    TemplateView,
     UpdateView,
 )
 from users.mixins import TeacherRequiredMixin
 
 from ..forms.question_forms import AnswerFormSet, QuestionForm
-from ..models import Question, Quiz, QuizAttempt, UserAnswer
+from ..models import Question, Quiz
+from ..services.attempt_review_services import AttemptReviewService
 
 
 class AddQuestion(TeacherRequiredMixin, CreateView):
@@ -59,55 +60,30 @@ class AddQuestion(TeacherRequiredMixin, CreateView):
         return reverse("quizes:add_question", kwargs={"quiz_pk": quiz_pk})
 
 
-class QuestionReviewView(LoginRequiredMixin, DetailView):
-    model = UserAnswer
+class QuestionReviewView(LoginRequiredMixin, TemplateView):
     template_name = "quizes/question_review.html"
-    context_object_name = "user_answer"
 
-    def get_object(self, queryset: Optional[QuerySet[UserAnswer]] = None) -> UserAnswer:
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+
         attempt_pk: int = self.kwargs["attempt_pk"]
         question_number: int = self.kwargs["question_number"]
 
-        try:
-            attempt: QuizAttempt = QuizAttempt.objects.get(
-                pk=attempt_pk,
-                user=self.request.user,
-            )
-        except QuizAttempt.DoesNotExist:
+        review = AttemptReviewService.get_for_attempt(attempt_pk)
+        if review is None or review.user_id != self.request.user.pk:
             raise Http404("There is no attempt in this quiz for this user")
 
-        qs: QuerySet[UserAnswer] = (
-            UserAnswer.objects.filter(attempt=attempt)
-            .select_related("question")
-            .prefetch_related(
-                "selected_answers",
-                "question__answers",
-            )
-            .order_by("question__id")
-        )
-
-        try:
-            return qs[question_number - 1]
-        except IndexError:
+        if not 1 <= question_number <= len(review.questions):
             raise Http404("There is no question in this attempt")
 
-    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-
-        user_answer = self.object
-
-        context["correct_answers"] = user_answer.question.answers.filter(
-            is_correct=True
-        )
-
-        question_number = self.kwargs["question_number"]
-        total_questions = user_answer.attempt.answers.count()
+        total_questions = len(review.questions)
 
+        context["question"] = review.questions[question_number - 1]
         context["question_number"] = question_number
         context["total_questions"] = total_questions
         context["has_previous"] = question_number > 1
         context["has_next"] = question_number < total_questions
-        context["attempt_pk"] = self.kwargs["attempt_pk"]
+        context["attempt_pk"] = attempt_pk
         context["previous_number"] = question_number - 1
         context["next_number"] = question_number + 1
 
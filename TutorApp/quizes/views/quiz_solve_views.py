@@ -1,63 +1,149 @@
 import logging
-from typing import Any, Dict, OrderedDict
+import uuid
+from typing import Any, Dict, List, OrderedDict, Tuple
 from urllib.parse import urlencode
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.utils.functional import cached_property
-from django.views.generic import FormView
+from django.views.generic import FormView, TemplateView
 from formtools.wizard.views import SessionWizardView
 
 from ..forms.quiz_wizard_forms import QuizStartForm, QuizStepForm
-from ..models import SECONDS_PER_QUESTION, Question, Quiz
+from ..models import SECONDS_PER_QUESTION, Question, Quiz, QuizStatistics
+from ..services.last_attempt_services import LastAttemptService
+from ..services.question_selection_services import QuestionSelectionService
+from ..services.quiz_bundle_services import QuizBundle, QuizBundleService
 from ..services.solve_quiz_services import QuizSolveService
 
 logger = logging.getLogger(__name__)
 
 
-class SolveQuizWizard(LoginRequiredMixin, SessionWizardView):
+class QuizAttemptMixin:
+    """
+    Mixin shared by the quiz solving modes:
+        -method for drawing the questions of a new attempt
+        -method for grading and saving a finished attempt
+    """
 
-    form_list = [("dummy", QuizStepForm)]
-    template_name = "quizes/quiz_solve_wizard.html"
-
-    def get_form_list(self) -> OrderedDict[str, type]:
-        """
-        Build dynamic form list based on quiz questions.
-        """
-
-        quiz_pk = self.kwargs["quiz_pk"]
+    def new_question_draw(self, quiz_pk: int) -> Dict[str, Any]:
         quiz = get_object_or_404(Quiz, pk=quiz_pk)
         question_count = self.request.GET.get("question_count", "all")
 
         if question_count == "all":
-            questions = quiz.questions.all().order_by("?")
+            count = None
         else:
             try:
                 count = int(question_count)
             except (ValueError, TypeError):
                 logger.warning(f"Invalid question_count '{question_count}', using 10")
                 count = 10
-            questions = quiz.get_random_questions(count)
 
-        if not questions:
+        try:
+            level_type = int(self.request.GET["level_type"])
+        except (KeyError, ValueError):
+            level_type = None
+
+        if not quiz.questions.exists():
             logger.error(f"Quiz {quiz_pk} has no questions!")
             raise ValueError(f"Quiz '{quiz.title}' has no questions.")
 
-        form_list = [
-            (f"question_{question.id}", QuizStepForm) for question in questions
-        ]
+        return {
+            "quiz_pk": quiz_pk,
+            "question_ids": QuestionSelectionService.draw(
+                quiz.pk, self.request.user, count, level_type
+            ),
+            "attempt_key": uuid.uuid4().hex,
+        }
 
-        return OrderedDict(form_list)
+    def finish_attempt(
+        self,
+        draw: Dict[str, Any],
+        bundle: QuizBundle,
+        user_answers: List[Tuple[str, List[int]]],
+    ) -> HttpResponseRedirect:
+        service = QuizSolveService()
+        quiz = get_object_or_404(Quiz, pk=draw["quiz_pk"])
 
-    def done(self, form_list, **kwargs) -> HttpResponse:
+        question_scores = service.calculate_question_scores(
+            list(bundle.values()), user_answers
+        )
 
-        service = QuizSolveService()
-        user = self.request.user
+        attempt = service.save_attempt_with_answers(
+            self.request.user, quiz, user_answers, question_scores, len(user_answers)
+        )
+
+        QuizBundleService.invalidate(draw["attempt_key"])
+
+        return redirect(
+            "quizes:question_review", attempt_pk=attempt.id, question_number=1
+        )
+
+
+class SolveQuizWizard(LoginRequiredMixin, QuizAttemptMixin, SessionWizardView):
+
+    form_list = [("dummy", QuizStepForm)]
+    template_name = "quizes/quiz_solve_wizard.html"
+
+    def get_form_list(self) -> OrderedDict[str, type]:
+        """
+        Build dynamic form list based on the questions drawn for this attempt.
+        """
+
+        self.form_list = OrderedDict(
+            (f"question_{question_id}", QuizStepForm)
+            for question_id in self.get_question_ids()
+        )
+
+        return super().get_form_list()
+
+    def get_question_ids(self) -> List[int]:
+        """
+        Return the question ids drawn for the current attempt.
+
+        Questions are drawn once, when the wizard is started (formtools resets
+        its storage on GET), and pinned in wizard storage, so every step and
+        done() see the same sequence.
+        """
 
+        return self._get_question_draw()["question_ids"]
+
+    def _get_question_draw(self) -> Dict[str, Any]:
         quiz_pk = self.kwargs["quiz_pk"]
-        quiz = get_object_or_404(Quiz, pk=quiz_pk)
+        draw = self.storage.extra_data.get("question_draw")
+        if draw and draw["quiz_pk"] == quiz_pk:
+            return draw
+
+        draw = self.new_question_draw(quiz_pk)
+
+        self.storage.extra_data = {**self.storage.extra_data, "question_draw": draw}
+
+        return draw
+
+    @cached_property
+    def question_bundle(self) -> QuizBundle:
+        """
+        Drawn questions with their answers, loaded once per attempt and
+        shared by the step forms, the template context and done().
+        """
+        draw = self._get_question_draw()
+        return QuizBundleService.get_bundle(draw["attempt_key"], draw["question_ids"])
+
+    def get_question(self, step: str) -> Question:
+        try:
+            return self.question_bundle[int(step.split("_")[1])]
+        except KeyError:
+            raise Http404("Question no longer exists.")
+
+    def get_form_kwargs(self, step: str = None) -> Dict[str, Any]:
+        kwargs = super().get_form_kwargs(step)
+
+        kwargs["question"] = self.get_question(step or self.steps.current)
+        return kwargs
+
+    def done(self, form_list, **kwargs) -> HttpResponse:
 
         user_answers = []
         for step_name in self.get_form_list().keys():
@@ -67,28 +153,70 @@ class SolveQuizWizard(LoginRequiredMixin, SessionWizardView):
             selected_ids = [int(id) for id in selected]
             user_answers.append((step_name, selected_ids))
 
-        max_score = len(user_answers)
+        return self.finish_attempt(
+            self._get_question_draw(), self.question_bundle, user_answers
+        )
 
-        question_ids = [int(step_name.split("_")[1]) for step_name, _ in user_answers]
-        questions = Question.objects.filter(id__in=question_ids)
+    def get_context_data(self, form: QuizStepForm, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(form=form, **kwargs)
 
-        score = service.calculate_score(list(questions), user_answers)
+        context["question"] = self.get_question(self.steps.current)
+        return context
 
-        attempt = service.save_quiz_attempt(user, quiz, score, max_score)
 
-        service.save_user_answers(attempt, user_answers)
+class SolveQuizSinglePageView(LoginRequiredMixin, QuizAttemptMixin, TemplateView):
+    """
+    Alternative to SolveQuizWizard rendering the whole drawn question set at
+    once. Questions are browsed and timed client-side and all answers are
+    submitted in a single POST, so an attempt takes two requests.
+    """
 
-        return redirect("quizes:quiz_summary", attempt_id=attempt.id)
+    template_name = "quizes/quiz_solve_single_page.html"
+    session_key = "quiz_single_page_draw"
 
-    def get_context_data(self, form: QuizStepForm, **kwargs: Any) -> Dict[str, Any]:
-        context = super().get_context_data(form=form, **kwargs)
+    def get(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        draw = self.new_question_draw(self.kwargs["quiz_pk"])
+        request.session[self.session_key] = draw
 
-        current_step = self.steps.current
+        bundle = QuizBundleService.get_bundle(draw["attempt_key"], draw["question_ids"])
+        if not bundle:
+            raise Http404("Question no longer exists.")
 
-        question_id = int(current_step.split("_")[1])
-        question = get_object_or_404(Question, pk=question_id)
-        context["question"] = question
-        return context
+        context = self.get_context_data(
+            quiz=next(iter(bundle.values())).quiz,
+            questions=QuizBundleService.to_payload(bundle),
+            seconds_per_question=SECONDS_PER_QUESTION,
+        )
+        return self.render_to_response(context)
+
+    def post(self, request, *args: Any, **kwargs: Any) -> HttpResponseRedirect:
+        quiz_pk = self.kwargs["quiz_pk"]
+        draw = request.session.get(self.session_key)
+        if not draw or draw["quiz_pk"] != quiz_pk:
+            return redirect("quizes:quiz_start", quiz_pk=quiz_pk)
+
+        bundle = QuizBundleService.get_bundle(draw["attempt_key"], draw["question_ids"])
+
+        user_answers = []
+        for question_id, question in bundle.items():
+            step_name = f"question_{question_id}"
+            # Unlike the wizard's MultipleChoiceField, a raw POST may repeat
+            # ids or send ids of other questions, which must not add points.
+            answer_ids = {answer.id for answer in question.answers.all()}
+            selected_ids = [
+                answer_id
+                for answer_id in dict.fromkeys(
+                    int(answer_id)
+                    for answer_id in request.POST.getlist(step_name)
+                    if answer_id.isdigit()
+                )
+                if answer_id in answer_ids
+            ]
+            user_answers.append((step_name, selected_ids))
+
+        del request.session[self.session_key]
+
+        return self.finish_attempt(draw, bundle, user_answers)
 
 
 class QuizStartView(LoginRequiredMixin, FormView):
@@ -115,13 +243,19 @@ class QuizStartView(LoginRequiredMixin, FormView):
         context["quiz"] = self.quiz
         context["question_count"] = self.quiz.questions.count()
         context["seconds_per_question"] = SECONDS_PER_QUESTION
-        context["last_attempt"] = self.quiz.get_last_attempt_for_user(self.request.user)
+        context["last_attempt"] = LastAttemptService.get_for_quiz(
+            self.request.user.pk, self.quiz.pk
+        )
+        context["quiz_statistics"] = QuizStatistics.objects.filter(
+            quiz=self.quiz
+        ).first()
 
         return context
 
     def form_valid(self, form: QuizStartForm) -> HttpResponseRedirect:
         question_count = form.cleaned_data["question_count"]
         level_type = form.cleaned_data.get("level_type", 1)
+        solve_mode = form.cleaned_data["solve_mode"]
 
         params = {
             "question_count": question_count,
@@ -129,6 +263,11 @@ class QuizStartView(LoginRequiredMixin, FormView):
         }
         query_string = urlencode(params)
 
-        base_url = reverse("quizes:solve_quiz", kwargs={"quiz_pk": self.quiz.pk})
+        url_name = (
+            "quizes:solve_quiz_single_page"
+            if solve_mode == QuizStartForm.SOLVE_MODE_SINGLE_PAGE
+            else "quizes:solve_quiz"
+        )
+        base_url = reverse(url_name, kwargs={"quiz_pk": self.quiz.pk})
 
         return redirect(f"{base_url}?{query_string}")
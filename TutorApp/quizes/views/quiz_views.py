@@ -13,7 +13,8 @@ from quizes.filters import QuizFilterSet
 from users.mixins import TeacherRequiredMixin
 
 from ..forms.quiz_forms import QuizForm
-from ..models import Quiz, QuizAttempt
+from ..models import Quiz
+from ..services.last_attempt_services import LastAttemptService
 
 
 class AddQuiz(TeacherRequiredMixin, CreateView):
@@ -53,13 +54,7 @@ class QuizList(LoginRequiredMixin, FilterView):
 
         quizzes = list(context["quiz_list"])
 
-        user_attempts = (
-            QuizAttempt.objects.filter(user=self.request.user)
-            .order_by("quiz_id", "-completed_at")
-            .distinct("quiz_id")
-        )
-
-        last_attempts = {attempt.quiz_id: attempt for attempt in user_attempts}
+        last_attempts = LastAttemptService.get_for_user(self.request.user.pk)
 
         for quiz in quizzes:
             quiz.last_attempt = last_attempts.get(quiz.id)
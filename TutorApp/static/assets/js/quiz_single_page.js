@@ -0,0 +1,103 @@
+document.addEventListener("DOMContentLoaded", () => {
+    const questions = JSON.parse(
+        document.getElementById("questions-data").textContent
+    );
+    const secondsPerQuestion = JSON.parse(
+        document.getElementById("seconds-per-question-data").textContent
+    );
+
+    const form = document.getElementById("quiz-single-page-form");
+    const container = document.getElementById("quiz-questions");
+    const progress = document.getElementById("quiz-progress");
+    const timeLeftDisplay = document.getElementById("quiz-time-left");
+    const prevButton = document.getElementById("quiz-prev");
+    const nextButton = document.getElementById("quiz-next");
+
+    let currentIndex = 0;
+    let submitted = false;
+
+    function renderQuestion(question) {
+        const section = document.createElement("section");
+        section.hidden = true;
+
+        const title = document.createElement("h2");
+        title.textContent = question.text;
+        section.appendChild(title);
+
+        if (question.picture) {
+            const picture = document.createElement("img");
+            picture.src = question.picture;
+            picture.alt = "Question image";
+            section.appendChild(picture);
+        }
+
+        question.answers.forEach((answer) => {
+            const label = document.createElement("label");
+            const checkbox = document.createElement("input");
+            checkbox.type = "checkbox";
+            checkbox.name = `question_${question.id}`;
+            checkbox.value = answer.id;
+
+            label.appendChild(checkbox);
+            label.append(` ${answer.text}`);
+
+            const row = document.createElement("p");
+            row.appendChild(label);
+            section.appendChild(row);
+        });
+
+        return section;
+    }
+
+    const sections = questions.map((question) => {
+        const section = renderQuestion(question);
+        container.appendChild(section);
+        return section;
+    });
+
+    function showQuestion(index) {
+        sections[currentIndex].hidden = true;
+        currentIndex = index;
+        sections[currentIndex].hidden = false;
+
+        progress.textContent = `${currentIndex + 1}/${sections.length}`;
+        prevButton.hidden = currentIndex === 0;
+        nextButton.hidden = currentIndex === sections.length - 1;
+    }
+
+    function formatDuration(totalSeconds) {
+        const minutes = Math.floor(totalSeconds / 60);
+        const seconds = totalSeconds % 60;
+
+        return `${minutes}:${String(seconds).padStart(2, "0")}`;
+    }
+
+    function submitAnswers() {
+        if (submitted) return;
+        submitted = true;
+        form.submit();
+    }
+
+    const deadline = Date.now() + questions.length * secondsPerQuestion * 1000;
+
+    function updateTimer() {
+        const remaining = Math.max(0, Math.ceil((deadline - Date.now()) / 1000));
+        timeLeftDisplay.textContent = formatDuration(remaining);
+
+        if (remaining === 0) {
+            clearInterval(timer);
+            submitAnswers();
+        }
+    }
+
+    prevButton.addEventListener("click", () => showQuestion(currentIndex - 1));
+    nextButton.addEventListener("click", () => showQuestion(currentIndex + 1));
+    form.addEventListener("submit", () => {
+        submitted = true;
+    });
+
+    const timer = setInterval(updateTimer, 1000);
+
+    showQuestion(0);
+    updateTimer();
+});
@@ -15,8 +15,6 @@ from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, TemplateView, View
-from plans.models import UserPlan
-from plans.services import PlanService
 
 from .forms import LoginForm, UserRegisterForm
 from .models import User
@@ -83,10 +81,6 @@ class LoginView(View):
             user = service.login_user(request, username, password)
 
             if user:
-                user_plan = UserPlan.objects.filter(user=user).first()
-                if user_plan:
-                    PlanService(user_plan).downgrade_if_expired()
-
                 messages.success(request, _("You have been successfully logged in."))
                 return redirect(self.success_url)
 
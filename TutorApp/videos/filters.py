@@ -1,18 +1,18 @@
 import django_filters
+from core.filters import FuzzyCharFilter
+from core.forms import FuzzyModelSelect2Widget
 from courses.choices import SubjectChoices
 from courses.models import Section
 from django import forms
 from django.utils.translation import gettext_lazy as _
-from django_select2.forms import ModelSelect2Widget
 
 from .models import Video
 
 
 class VideoFilterSet(django_filters.FilterSet):
 
-    title = django_filters.CharFilter(
+    title = FuzzyCharFilter(
         field_name="title",
-        lookup_expr="icontains",
         label=_("Title"),
         widget=forms.TextInput(
             attrs={
@@ -25,9 +25,9 @@ class VideoFilterSet(django_filters.FilterSet):
         queryset=Section.objects.all(),
         label=_("Section"),
         empty_label=_("All Sections"),
-        widget=ModelSelect2Widget(
+        widget=FuzzyModelSelect2Widget(
             model=Section,
-            search_fields=["name__icontains"],
+            search_fields=["name"],
             attrs={
                 "data-placeholder": _("Search Section"),
                 "data-allow-clear": "true",
@@ -1,9 +1,8 @@
-from core.forms import TypedChoiceMixin
+from core.forms import FuzzyModelSelect2Widget, TypedChoiceMixin
 from courses.choices import SchoolLevelChoices, SubjectChoices
 from courses.models import Section
 from django import forms
 from django.utils.translation import gettext_lazy as _
-from django_select2.forms import ModelSelect2Widget
 from videos.models import Video, VideoTimestamp
 
 
@@ -22,9 +21,9 @@ class AddVideoStep1Form(TypedChoiceMixin, forms.Form):
         self.fields["section"] = forms.ModelChoiceField(
             queryset=Section.objects.all(),
             label=_("Section"),
-            widget=ModelSelect2Widget(
+            widget=FuzzyModelSelect2Widget(
                 model=Section,
-                search_fields=["name__icontains"],
+                search_fields=["name"],
                 attrs={
                     "placeholder": " ",
                     "data-placeholder": _("Section"),
@@ -61,9 +60,9 @@ class TimestampForm(forms.Form):
 class VideoFilterForm(forms.Form):
     title = forms.ModelChoiceField(
         queryset=Video.objects.all(),
-        widget=ModelSelect2Widget(
+        widget=FuzzyModelSelect2Widget(
             model=Video,
-            search_fields=["title__icontains"],
+            search_fields=["title"],
         ),
         required=False,
         label=_("Search videos"),
@@ -1,6 +1,7 @@
 import re
 from datetime import timedelta
 
+from core.search import trigram_index
 from courses.choices import SchoolLevelChoices, SubjectChoices
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -29,6 +30,9 @@ class Video(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [trigram_index("title", "video_title_trgm_idx")]
+
     def __str__(self):
         return f"{self.title} – {self.get_level_display()}"
 
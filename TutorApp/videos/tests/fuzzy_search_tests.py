@@ -0,0 +1,64 @@
+from core.forms import FuzzyModelSelect2Widget
+from core.search import fuzzy_search
+from courses.models import Section
+from courses.tests.factories import SectionFactory
+from django.test import TestCase
+from videos.filters import VideoFilterSet
+from videos.models import Video
+from videos.tests.factories import VideoFactory
+
+
+class FuzzySearchTests(TestCase):
+    def setUp(self):
+        self.sequences = VideoFactory.create(title="Ciągi arytmetyczne")
+        self.functions = VideoFactory.create(title="Funkcja kwadratowa")
+        self.geometry = VideoFactory.create(title="Geometria płaska")
+
+    def test_ignores_polish_diacritics(self):
+        """Test case that checks if a query without diacritics matches"""
+        results = fuzzy_search(Video.objects.all(), "title", "ciagi")
+
+        self.assertEqual(list(results), [self.sequences])
+
+    def test_tolerates_typos(self):
+        """Test case that checks if a misspelled word still matches"""
+        results = fuzzy_search(Video.objects.all(), "title", "kwadratowaa")
+
+        self.assertEqual(list(results), [self.functions])
+
+    def test_matches_substring(self):
+        """Test case that checks if a part of a word matches"""
+        results = fuzzy_search(Video.objects.all(), "title", "PŁAS")
+
+        self.assertEqual(list(results), [self.geometry])
+
+    def test_orders_by_similarity(self):
+        """Test case that checks if the closest match comes first"""
+        closer = VideoFactory.create(title="Funkcje")
+
+        results = list(fuzzy_search(Video.objects.all(), "title", "funkcje"))
+
+        self.assertEqual(results, [closer, self.functions])
+        self.assertGreater(results[0].similarity, results[1].similarity)
+
+    def test_blank_query_returns_queryset(self):
+        """Test case that checks if an empty query does not filter"""
+        self.assertEqual(fuzzy_search(Video.objects.all(), "title", "  ").count(), 3)
+
+    def test_filterset_uses_fuzzy_search(self):
+        """Test case that checks if the video filter matches without diacritics"""
+        filterset = VideoFilterSet(
+            data={"title": "geometria plaska"}, queryset=Video.objects.all()
+        )
+
+        self.assertEqual(list(filterset.qs), [self.geometry])
+
+    def test_select2_widget_uses_fuzzy_search(self):
+        """Test case that checks if the section autocomplete matches without diacritics"""
+        section = SectionFactory.create(name="Równania i nierówności")
+        SectionFactory.create(name="Statystyka")
+        widget = FuzzyModelSelect2Widget(model=Section, search_fields=["name"])
+
+        results = widget.filter_queryset(None, "rownania")
+
+        self.assertEqual(list(results), [section])
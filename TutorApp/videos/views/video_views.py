@@ -14,7 +14,6 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic import DeleteView, DetailView, ListView
 from django_filters.views import FilterView
 from formtools.wizard.views import SessionWizardView
-from plans.models import UserPlan
 from users.mixins import TeacherRequiredMixin
 from videos.filters import VideoFilterSet
 from videos.forms.video_forms import (
@@ -227,10 +226,7 @@ class VideoListView(LoginRequiredMixin, FilterView):
         """
         Helper method for checking user premium status.
         """
-        try:
-            return self.request.user.userplan.is_premium_or_trial
-        except UserPlan.DoesNotExist:
-            return False
+        return self.request.entitlement.is_premium_or_trial
 
 
 class SectionVideoListView(LoginRequiredMixin, ListView):
@@ -260,12 +256,7 @@ class VideoDetailsView(LoginRequiredMixin, DetailView):
     context_object_name = "video"
 
     def get_queryset(self) -> QuerySet[Video]:
-        try:
-            is_premium_or_trial = self.request.user.userplan.is_premium_or_trial
-        except UserPlan.DoesNotExist:
-            is_premium_or_trial = False
-
-        if is_premium_or_trial:
+        if self.request.entitlement.is_premium_or_trial:
             return Video.objects.prefetch_related("timestamps")
 
         return Video.objects.prefetch_related(